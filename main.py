@@ -25,7 +25,7 @@ from reddit_flow.exceptions import ConfigurationError
 
 env = os.getenv("ENV", "prod").lower()
 log_level = "DEBUG" if env == "test" else "INFO"
-configure_logging(level=log_level, json_logs=True)
+configure_logging(level=log_level, json_logs=True, background=True)
 logger = get_logger(__name__)
 
 
@@ -9,14 +9,42 @@ This module provides client classes for interacting with external APIs:
 - YouTube Data API
 
 All clients inherit from BaseClient and implement a consistent interface.
+
+The concrete clients are imported on first access, so only the SDKs of the
+clients actually used (e.g. praw, google-generativeai) are loaded.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from reddit_flow.clients.base import AsyncClientMixin, BaseClient, HTTPClientMixin
-from reddit_flow.clients.elevenlabs_client import ElevenLabsClient
-from reddit_flow.clients.gemini_client import GeminiClient
-from reddit_flow.clients.heygen_client import HeyGenClient
-from reddit_flow.clients.reddit_client import RedditClient
-from reddit_flow.clients.youtube_client import YouTubeClient
+
+if TYPE_CHECKING:
+    from reddit_flow.clients.elevenlabs_client import ElevenLabsClient
+    from reddit_flow.clients.gemini_client import GeminiClient
+    from reddit_flow.clients.heygen_client import HeyGenClient
+    from reddit_flow.clients.reddit_client import RedditClient
+    from reddit_flow.clients.youtube_client import YouTubeClient
+
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "ElevenLabsClient": "reddit_flow.clients.elevenlabs_client",
+    "GeminiClient": "reddit_flow.clients.gemini_client",
+    "HeyGenClient": "reddit_flow.clients.heygen_client",
+    "RedditClient": "reddit_flow.clients.reddit_client",
+    "YouTubeClient": "reddit_flow.clients.youtube_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a client module the first time one of its names is accessed."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BaseClient",
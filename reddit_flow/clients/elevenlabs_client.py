@@ -6,7 +6,7 @@ the ElevenLabs API.
 """
 
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import requests
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -42,6 +42,7 @@ class ElevenLabsClient(BaseClient, HTTPClientMixin):
     # API configuration
     DEFAULT_BASE_URL = "https://api.elevenlabs.io/v1"
     DEFAULT_TIMEOUT = 60
+    DEFAULT_STREAM_CHUNK_SIZE = 16 * 1024
 
     def _initialize(self) -> None:
         """
@@ -170,8 +171,8 @@ class ElevenLabsClient(BaseClient, HTTPClientMixin):
             return response.content
 
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else None
-            response_text = e.response.text if e.response else str(e)
+            status_code = e.response.status_code if e.response is not None else None
+            response_text = e.response.text if e.response is not None else str(e)
             logger.error(f"ElevenLabs API error: {status_code} - {response_text}")
             raise TTSError(
                 f"Text-to-speech conversion failed: {e}",
@@ -185,6 +186,69 @@ class ElevenLabsClient(BaseClient, HTTPClientMixin):
             logger.error(f"Error in text-to-speech: {e}", exc_info=True)
             raise TTSError(f"Failed to convert text to speech: {e}")
 
+    def text_to_speech_stream(
+        self, text: str, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Convert text to speech, yielding audio chunks as they are synthesized.
+
+        Uses the ElevenLabs streaming endpoint so callers can start consuming
+        (e.g. uploading) audio before synthesis has finished.
+
+        Args:
+            text: Text to convert to speech.
+            chunk_size: Maximum size of each yielded chunk in bytes.
+
+        Yields:
+            Audio data chunks (MP3 format).
+
+        Raises:
+            TTSError: If conversion fails.
+
+        Example:
+            >>> with open("output.mp3", "wb") as f:
+            ...     for chunk in client.text_to_speech_stream("Hello, world!"):
+            ...         f.write(chunk)
+        """
+        try:
+            url = f"{self._base_url}/text-to-speech/{self._voice_id}/stream"
+            headers = self._get_auth_headers()
+            data = {"text": text}
+
+            logger.debug(f"Streaming {len(text)} characters to speech")
+            with requests.post(
+                url,
+                json=data,
+                headers=headers,
+                timeout=self._timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+
+                audio_size = 0
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        audio_size += len(chunk)
+                        yield chunk
+
+            logger.info(f"Streamed audio: {audio_size / 1024:.2f} KB")
+
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            response_text = e.response.text if e.response is not None else str(e)
+            logger.error(f"ElevenLabs API error: {status_code} - {response_text}")
+            raise TTSError(
+                f"Text-to-speech conversion failed: {e}",
+                status_code=status_code,
+                response_body=response_text,
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error in text-to-speech stream: {e}")
+            raise TTSError(f"Network error during text-to-speech: {e}")
+        except Exception as e:
+            logger.error(f"Error in text-to-speech stream: {e}", exc_info=True)
+            raise TTSError(f"Failed to convert text to speech: {e}")
+
     def get_voices(self) -> list:
         """
         Get list of available voices.
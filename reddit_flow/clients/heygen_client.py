@@ -8,14 +8,14 @@ the HeyGen API v2.
 import asyncio
 import os
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
 
 import requests
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from reddit_flow.clients.base import BaseClient, HTTPClientMixin
 from reddit_flow.config import get_logger
-from reddit_flow.exceptions import ConfigurationError, VideoGenerationError
+from reddit_flow.exceptions import ConfigurationError, RedditFlowError, VideoGenerationError
 from reddit_flow.models import AudioAsset, VideoGenerationRequest, VideoGenerationResponse
 
 logger = get_logger(__name__)
@@ -156,12 +156,18 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
         retry=retry_if_exception_type(requests.exceptions.RequestException),
         reraise=True,
     )
-    def upload_audio(self, audio_data: bytes, content_type: str = "audio/mpeg") -> AudioAsset:
+    def upload_audio(
+        self,
+        audio_data: Union[bytes, bytearray, memoryview],
+        content_type: str = "audio/mpeg",
+    ) -> AudioAsset:
         """
         Upload audio to HeyGen asset storage.
 
+        The buffer is sent as-is; bytearray and memoryview inputs are not copied.
+
         Args:
-            audio_data: Audio file bytes (MP3/WAV).
+            audio_data: Audio file bytes (MP3/WAV), or any bytes-like buffer.
             content_type: MIME type of the audio (default: audio/mpeg).
 
         Returns:
@@ -180,7 +186,8 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
                 "Content-Type": content_type,
             }
 
-            logger.debug(f"Uploading {len(audio_data) / 1024:.2f} KB audio to HeyGen")
+            size_bytes = memoryview(audio_data).nbytes
+            logger.debug(f"Uploading {size_bytes / 1024:.2f} KB audio to HeyGen")
 
             response = requests.post(
                 self._upload_url,
@@ -199,12 +206,90 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
             return AudioAsset(
                 url=audio_url,
                 asset_id=asset_id,
-                file_size_bytes=len(audio_data),
+                file_size_bytes=size_bytes,
+            )
+
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            response_text = e.response.text if e.response is not None else str(e)
+            logger.error(f"HeyGen upload error: {status_code} - {response_text}")
+            raise VideoGenerationError(
+                f"Audio upload failed: {e}",
+                status_code=status_code,
+                response_body=response_text,
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error uploading audio: {e}")
+            raise VideoGenerationError(f"Network error during audio upload: {e}")
+        except Exception as e:
+            logger.error(f"Error uploading audio: {e}", exc_info=True)
+            raise VideoGenerationError(f"Failed to upload audio: {e}")
+
+    def upload_audio_stream(
+        self, chunks: Iterable[bytes], content_type: str = "audio/mpeg"
+    ) -> AudioAsset:
+        """
+        Upload audio to HeyGen asset storage from an iterable of chunks.
+
+        The body is sent with chunked transfer encoding, so the upload starts
+        as soon as the first chunk is available (e.g. while TTS is still
+        synthesizing). The chunk source is consumed once and not retried.
+
+        Args:
+            chunks: Iterable yielding audio bytes (MP3/WAV).
+            content_type: MIME type of the audio (default: audio/mpeg).
+
+        Returns:
+            AudioAsset model with URL and metadata.
+
+        Raises:
+            VideoGenerationError: If upload fails.
+        """
+        uploaded_bytes = 0
+
+        def body() -> Iterator[bytes]:
+            nonlocal uploaded_bytes
+            for chunk in chunks:
+                uploaded_bytes += len(chunk)
+                yield chunk
+
+        try:
+            headers = {
+                "X-API-KEY": self._api_key,
+                "Content-Type": content_type,
+            }
+
+            logger.debug("Streaming audio upload to HeyGen")
+
+            response = requests.post(
+                self._upload_url,
+                data=body(),
+                headers=headers,
+                timeout=self.DEFAULT_UPLOAD_TIMEOUT,
+            )
+            response.raise_for_status()
+
+            result = response.json()
+            audio_url = result["data"]["url"]
+            asset_id = result["data"].get("id")
+
+            logger.info(
+                f"Audio streamed successfully ({uploaded_bytes / 1024:.2f} KB): "
+                f"{audio_url[:50]}..."
+            )
+
+            return AudioAsset(
+                url=audio_url,
+                asset_id=asset_id,
+                file_size_bytes=uploaded_bytes,
             )
 
+        except RedditFlowError:
+            # Errors from the chunk source (e.g. TTSError) pass through unchanged
+            raise
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else None
-            response_text = e.response.text if e.response else str(e)
+            status_code = e.response.status_code if e.response is not None else None
+            response_text = e.response.text if e.response is not None else str(e)
             logger.error(f"HeyGen upload error: {status_code} - {response_text}")
             raise VideoGenerationError(
                 f"Audio upload failed: {e}",
@@ -218,12 +303,16 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
             logger.error(f"Error uploading audio: {e}", exc_info=True)
             raise VideoGenerationError(f"Failed to upload audio: {e}")
 
-    def upload_audio_url(self, audio_data: bytes, content_type: str = "audio/mpeg") -> str:
+    def upload_audio_url(
+        self,
+        audio_data: Union[bytes, bytearray, memoryview],
+        content_type: str = "audio/mpeg",
+    ) -> str:
         """
         Upload audio and return just the URL (backward-compatible).
 
         Args:
-            audio_data: Audio file bytes (MP3/WAV).
+            audio_data: Audio file bytes (MP3/WAV), or any bytes-like buffer.
             content_type: MIME type of the audio.
 
         Returns:
@@ -320,8 +409,8 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
             return video_id
 
         except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else None
-            response_text = e.response.text if e.response else str(e)
+            status_code = e.response.status_code if e.response is not None else None
+            response_text = e.response.text if e.response is not None else str(e)
             logger.error(f"HeyGen generation error: {status_code} - {response_text}")
             raise VideoGenerationError(
                 f"Video generation failed: {e}",
@@ -403,6 +492,9 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
         video_id: str,
         update_callback: Optional[Callable[[str], Any]] = None,
         timeout: Optional[int] = None,
+        status_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        initial_delay: float = 0.0,
+        poll_backoff: float = 1.5,
     ) -> str:
         """
         Wait for video generation to complete with timeout.
@@ -411,6 +503,11 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
             video_id: HeyGen video ID.
             update_callback: Optional async callback for status updates.
             timeout: Override default wait timeout.
+            status_callback: Optional sync callback receiving the raw status
+                data of every poll (e.g. to cache the latest status).
+            initial_delay: Seconds to wait before the first status poll. New
+                videos are never ready immediately, so an early poll is wasted.
+            poll_backoff: Factor applied to the wait between polls (min 1s).
 
         Returns:
             URL of completed video.
@@ -431,6 +528,10 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
         use_timeout = timeout or self._wait_timeout
 
         try:
+            if initial_delay > 0:
+                logger.debug(f"Delaying first status poll by {initial_delay:.0f}s")
+                await asyncio.sleep(min(initial_delay, use_timeout))
+
             while True:
                 elapsed = time.time() - start_time
 
@@ -455,6 +556,9 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
                 data = response.json()["data"]
                 status = data["status"]
 
+                if status_callback:
+                    status_callback(data)
+
                 if status == "completed":
                     video_url = data["video_url"]
                     logger.info(f"Video completed after {elapsed:.0f}s: {video_url[:50]}...")
@@ -471,12 +575,37 @@ class HeyGenClient(BaseClient, HTTPClientMixin):
                 logger.info(f"Video status: {status}, waiting {wait_time}s...")
                 await asyncio.sleep(wait_time)
 
-                wait_time = min(wait_time * 1.5, max_wait_time)
+                wait_time = max(1.0, min(wait_time * poll_backoff, max_wait_time))
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error checking video status: {e}", exc_info=True)
             raise VideoGenerationError(f"Failed to check video status: {e}")
 
+    def delete_video(self, video_id: str) -> None:
+        """
+        Delete a video, stopping its generation if still in progress.
+
+        Args:
+            video_id: HeyGen video ID.
+
+        Raises:
+            VideoGenerationError: If the deletion fails.
+        """
+        try:
+            url = f"{self._base_url}/v1/video.delete"
+            headers = self._get_auth_headers()
+            response = requests.delete(
+                url,
+                params={"video_id": video_id},
+                headers=headers,
+                timeout=30,
+            )
+            response.raise_for_status()
+            logger.info(f"Deleted HeyGen video {video_id}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to delete video {video_id}: {e}")
+            raise VideoGenerationError(f"Failed to delete video: {e}")
+
     def get_remaining_quota(self) -> Dict[str, Any]:
         """
         Get remaining video generation quota.
@@ -232,6 +232,7 @@ class RedditClient(BaseClient):
                 }
                 for c in post.comments
             ],
+            "num_comments": len(post.comments),
         }
 
     def _extract_comments(
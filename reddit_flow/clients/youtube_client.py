@@ -5,9 +5,13 @@ This module provides the client for video uploads to YouTube using
 the YouTube Data API v3 with OAuth2 authentication.
 """
 
+import mimetypes
+import mmap
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Dict, Optional
+from typing import Any, BinaryIO, Callable, ClassVar, Dict, Optional
 
 from reddit_flow.clients.base import BaseClient
 from reddit_flow.config import get_logger
@@ -17,6 +21,145 @@ from reddit_flow.models import YouTubeUploadRequest, YouTubeUploadResponse
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _stream_media_upload_class() -> type:
+    """
+    Build the MediaUpload subclass for forward-only streams.
+
+    Created on first use so googleapiclient is only imported when needed,
+    like the other Google imports in this module.
+    """
+    from googleapiclient.http import MediaUpload
+
+    class StreamMediaUpload(MediaUpload):
+        """
+        Resumable media backed by a non-seekable stream.
+
+        Chunks are read with readinto() into one reusable buffer and handed
+        out as memoryview slices, so no per-chunk bytes objects are built.
+        The buffered chunk is kept so a chunk the server did not acknowledge
+        can be re-sent; earlier bytes cannot be re-read.
+        """
+
+        def __init__(self, stream: BinaryIO, size: int, chunksize: int, mimetype: str) -> None:
+            self._stream = stream
+            self._size = size
+            self._chunksize = chunksize
+            self._mimetype = mimetype
+            self._buffer = bytearray()
+            self._view = memoryview(self._buffer)
+            self._buffer_start = 0
+            self._buffer_len = 0
+
+        def chunksize(self) -> int:
+            return self._chunksize
+
+        def mimetype(self) -> str:
+            return self._mimetype
+
+        def size(self) -> int:
+            return self._size
+
+        def resumable(self) -> bool:
+            return True
+
+        def getbytes(self, begin: int, length: int) -> memoryview:
+            buffer_end = self._buffer_start + self._buffer_len
+            if not self._buffer_start <= begin <= buffer_end:
+                raise YouTubeUploadError(f"Cannot seek upload stream to byte {begin}")
+
+            # Move the unacknowledged tail of the last chunk to the front
+            kept = buffer_end - begin
+            if kept and begin != self._buffer_start:
+                offset = begin - self._buffer_start
+                self._view[:kept] = self._view[offset : offset + kept]
+
+            if len(self._buffer) < length:
+                buffer = bytearray(length)
+                buffer[:kept] = self._view[:kept]
+                self._buffer, self._view = buffer, memoryview(buffer)
+
+            filled = kept
+            while filled < length:
+                # BinaryIO omits readinto, but raw HTTP bodies and files have it
+                read = self._stream.readinto(  # type: ignore[attr-defined]
+                    self._view[filled:length]
+                )
+                if not read:
+                    break
+                filled += read
+
+            self._buffer_start = begin
+            self._buffer_len = filled
+            return self._view[:filled]
+
+    return StreamMediaUpload
+
+
+@lru_cache(maxsize=1)
+def _mmap_media_upload_class() -> type:
+    """
+    Build the MediaUpload subclass for memory-mapped video files.
+
+    Created on first use so googleapiclient is only imported when needed,
+    like the other Google imports in this module.
+    """
+    from googleapiclient.http import MediaUpload
+
+    class MmapMediaUpload(MediaUpload):
+        """
+        Resumable media backed by a read-only memory map of a file.
+
+        Chunks are memoryview slices of the map, so http.client sends them
+        straight from the page cache instead of copying the file through
+        8 KiB Python reads as MediaFileUpload's stream path does.
+        """
+
+        def __init__(self, path: str, chunksize: int, mimetype: str) -> None:
+            with open(path, "rb") as f:
+                self._size = os.fstat(f.fileno()).st_size
+                # mmap cannot map an empty file; the map keeps its own descriptor
+                self._map = (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+                )
+            self._view = memoryview(self._map if self._map is not None else b"")
+            self._chunksize = chunksize
+            self._mimetype = mimetype
+
+        def chunksize(self) -> int:
+            return self._chunksize
+
+        def mimetype(self) -> str:
+            return self._mimetype
+
+        def size(self) -> int:
+            return self._size
+
+        def resumable(self) -> bool:
+            return True
+
+        def has_stream(self) -> bool:
+            # Makes googleapiclient call getbytes() rather than wrap a file object
+            return False
+
+        def getbytes(self, begin: int, length: int) -> memoryview:
+            end = self._size if length < 0 else begin + length
+            return self._view[begin:end]
+
+        def close(self) -> None:
+            self._view.release()
+            if self._map is None:
+                return
+            try:
+                self._map.close()
+            except BufferError:
+                # A chunk is still referenced (e.g. by a traceback being
+                # handled); the map is released when that is collected.
+                pass
+
+    return MmapMediaUpload
+
+
 class YouTubeClient(BaseClient):
     """
     Client for YouTube video uploads.
@@ -55,6 +198,9 @@ class YouTubeClient(BaseClient):
     # OAuth2 scopes for YouTube upload
     SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
 
+    # Stops concurrent uploads from running the OAuth flow more than once
+    _auth_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def _initialize(self) -> None:
         """
         Initialize YouTube client with OAuth2 configuration.
@@ -87,6 +233,9 @@ class YouTubeClient(BaseClient):
 
         # Service instance (lazy loaded)
         self._service = None
+        self._credentials: Any = None
+        # Per-thread authorized HTTP transports (see _thread_http)
+        self._thread_local = threading.local()
 
         # Optional progress callback
         self._progress_callback: Optional[Callable[[int], None]] = None
@@ -129,6 +278,13 @@ class YouTubeClient(BaseClient):
         if self._service:
             return self._service
 
+        with self._auth_lock:
+            if not self._service:
+                self._service = self._build_service()
+        return self._service
+
+    def _build_service(self) -> Any:
+        """Authenticate and build the YouTube service (see _get_authenticated_service)."""
         try:
             # Import Google libraries here to avoid import errors if not installed
             from google.auth.transport.requests import Request
@@ -165,9 +321,10 @@ class YouTubeClient(BaseClient):
                     token.write(creds.to_json())
                 logger.info("YouTube credentials saved")
 
-            self._service = build("youtube", "v3", credentials=creds)
+            self._credentials = creds
+            service = build("youtube", "v3", credentials=creds)
             logger.info("YouTube service authenticated")
-            return self._service
+            return service
 
         except YouTubeUploadError:
             raise
@@ -175,6 +332,31 @@ class YouTubeClient(BaseClient):
             logger.error(f"YouTube authentication failed: {e}", exc_info=True)
             raise YouTubeUploadError(f"Failed to authenticate with YouTube: {e}")
 
+    def _thread_http(self) -> Any:
+        """
+        Return an authorized HTTP transport owned by the calling thread.
+
+        httplib2 connections are not thread-safe, so concurrent uploads send
+        their chunks over one transport per thread instead of the service's.
+
+        Returns:
+            AuthorizedHttp for this thread, or None to use the service's own
+            transport (before authentication has stored credentials).
+        """
+        if self._credentials is None:
+            return None
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            import google_auth_httplib2
+            from googleapiclient.http import build_http
+
+            # build_http, unlike a bare httplib2.Http, sets the default timeout
+            # and does not treat the 308 "Resume Incomplete" reply to each
+            # upload chunk as a redirect
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=build_http())
+            self._thread_local.http = http
+        return http
+
     def upload_video(
         self,
         file_path: str,
@@ -207,73 +389,155 @@ class YouTubeClient(BaseClient):
         """
         try:
             from googleapiclient.errors import HttpError
-            from googleapiclient.http import MediaFileUpload
 
             service = self._get_authenticated_service()
 
-            # Validate file exists
-            video_path = Path(file_path)
-            if not video_path.exists():
+            # Validate file exists (one getsize call gives both existence and size)
+            try:
+                file_size = os.path.getsize(file_path)
+            except OSError:
                 raise YouTubeUploadError(f"Video file not found: {file_path}")
 
-            file_size = video_path.stat().st_size
-            logger.info(f"Uploading video: {file_size / (1024*1024):.2f} MB")
-
-            # Build request body
-            body = {
-                "snippet": {
-                    "title": title[:100],  # YouTube limit
-                    "description": description[:5000],  # YouTube limit
-                    "categoryId": category_id or self._category_id,
-                },
-                "status": {
-                    "privacyStatus": privacy_status,
-                    "selfDeclaredMadeForKids": made_for_kids,
-                },
-            }
-
-            if tags:
-                body["snippet"]["tags"] = tags
-
-            # Create media upload
-            media = MediaFileUpload(
-                str(video_path),
-                chunksize=self._chunk_size,
-                resumable=True,
-            )
+            logger.info("Uploading video: %.2f MB", file_size / (1 << 20))
+
+            # Create media upload (memory-mapped; chunks are sent without copying)
+            mimetype = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            media = _mmap_media_upload_class()(file_path, self._chunk_size, mimetype)
 
-            # Execute upload request
-            request = service.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media,
+            body = self._build_upload_body(
+                title, description, category_id, privacy_status, made_for_kids, tags
             )
+            try:
+                return self._execute_upload(service, body, media, progress_callback)
+            finally:
+                media.close()
+
+        except YouTubeUploadError:
+            raise
+        except HttpError as e:
+            logger.error(f"YouTube API error: {e.status_code} - {e.error_details}")
+            raise YouTubeUploadError(f"YouTube upload failed: {e}") from e
+        except Exception as e:
+            logger.error(f"Error uploading to YouTube: {e}", exc_info=True)
+            raise YouTubeUploadError(f"Failed to upload video: {e}") from e
+
+    def upload_video_stream(
+        self,
+        stream: BinaryIO,
+        size: int,
+        title: str,
+        description: str = "",
+        category_id: Optional[str] = None,
+        privacy_status: str = "public",
+        made_for_kids: bool = False,
+        tags: Optional[list[str]] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        mimetype: str = "video/mp4",
+    ) -> str:
+        """
+        Upload video to YouTube from a forward-only stream (e.g. an HTTP body).
+
+        The stream is read one resumable chunk at a time, so the video never has
+        to be written to disk or held in memory in full.
+
+        Args:
+            stream: Readable binary stream (supporting readinto) positioned at
+                the start of the video.
+            size: Total size of the video in bytes.
+            title: Video title (max 100 chars, will be truncated).
+            description: Video description (max 5000 chars).
+            category_id: YouTube category ID (defaults to config value).
+            privacy_status: Privacy setting ("public", "private", "unlisted").
+            made_for_kids: Whether video is made for kids.
+            tags: Optional list of video tags.
+            progress_callback: Optional callback for upload progress (0-100).
+            mimetype: MIME type of the video.
 
-            response = None
-            last_progress = 0
+        Returns:
+            YouTube video ID.
+
+        Raises:
+            YouTubeUploadError: If upload fails.
+        """
+        try:
+            from googleapiclient.errors import HttpError
 
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    if progress - last_progress >= 10:  # Log every 10%
-                        logger.info(f"Upload progress: {progress}%")
-                        last_progress = progress
-                        if progress_callback:
-                            progress_callback(progress)
+            service = self._get_authenticated_service()
+            logger.info("Streaming video upload: %.2f MB", size / (1 << 20))
 
-            video_id = response["id"]
-            logger.info(f"Video uploaded successfully: {video_id}")
-            return video_id
+            media = _stream_media_upload_class()(stream, size, self._chunk_size, mimetype)
+            body = self._build_upload_body(
+                title, description, category_id, privacy_status, made_for_kids, tags
+            )
+            return self._execute_upload(service, body, media, progress_callback)
 
         except YouTubeUploadError:
             raise
         except HttpError as e:
             logger.error(f"YouTube API error: {e.status_code} - {e.error_details}")
-            raise YouTubeUploadError(f"YouTube upload failed: {e}")
+            raise YouTubeUploadError(f"YouTube upload failed: {e}") from e
         except Exception as e:
-            logger.error(f"Error uploading to YouTube: {e}", exc_info=True)
-            raise YouTubeUploadError(f"Failed to upload video: {e}")
+            logger.error(f"Error streaming upload to YouTube: {e}", exc_info=True)
+            raise YouTubeUploadError(f"Failed to upload video: {e}") from e
+
+    def _build_upload_body(
+        self,
+        title: str,
+        description: str,
+        category_id: Optional[str],
+        privacy_status: str,
+        made_for_kids: bool,
+        tags: Optional[list[str]],
+    ) -> Dict[str, Any]:
+        """Build the videos.insert request body."""
+        body: Dict[str, Any] = {
+            "snippet": {
+                "title": title[:100],  # YouTube limit
+                "description": description[:5000],  # YouTube limit
+                "categoryId": category_id or self._category_id,
+            },
+            "status": {
+                "privacyStatus": privacy_status,
+                "selfDeclaredMadeForKids": made_for_kids,
+            },
+        }
+
+        if tags:
+            body["snippet"]["tags"] = tags
+
+        return body
+
+    def _execute_upload(
+        self,
+        service: Any,
+        body: Dict[str, Any],
+        media: Any,
+        progress_callback: Optional[Callable[[int], None]],
+    ) -> str:
+        """Run a resumable videos.insert upload to completion and return the video ID."""
+        request = service.videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media,
+        )
+
+        response = None
+        last_progress = 0
+        http = self._thread_http()
+
+        while response is None:
+            status, response = request.next_chunk(http=http)
+            if status:
+                progress = int(status.progress() * 100)
+                if progress - last_progress >= 10:  # Log every 10%
+                    logger.info(f"Upload progress: {progress}%")
+                    last_progress = progress
+                    if progress_callback:
+                        progress_callback(progress)
+
+        video_id = response["id"]
+        logger.info(f"Video uploaded successfully: {video_id}")
+        return video_id
 
     def upload_video_from_request(
         self,
@@ -6,6 +6,7 @@ This module provides:
 - Structured JSON logging for production
 - Colored console output for development
 - Log rotation and retention policies
+- Optional background thread for formatting and writing log records
 - Integration with the existing StructuredLogger
 
 Usage:
@@ -19,15 +20,20 @@ Usage:
     logger.info("Application started")
 """
 
+import atexit
 import copy
 import json
 import logging
+import logging.config
 import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 
 # =============================================================================
 # Constants
@@ -42,6 +48,62 @@ DEFAULT_JSON_LOG_FILE = "reddit_flow_log.json"
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10 MB
 BACKUP_COUNT = 5
 
+# Third-party loggers quietened to WARNING, applied in one incremental dictConfig
+_LIBRARY_LOGGING_CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "incremental": True,
+    "loggers": {
+        name: {"level": "WARNING"}
+        for name in (
+            "urllib3",
+            "requests",
+            "httpx",
+            "httpcore",
+            "asyncio",
+            "prawcore",
+            "google.auth",
+            "google.auth.transport",
+            "googleapiclient",
+            "telegram",
+            "httpx._client",
+        )
+    },
+}
+
+# Shared encoder: json.dumps(..., default=str) builds a new encoder on every call
+_JSON_ENCODER = json.JSONEncoder(default=str)
+
+# Listener thread draining the log queue when background logging is enabled
+_queue_listener: Optional[QueueListener] = None
+
+
+class _IsoTimestamp:
+    """
+    Callable giving ``datetime.fromtimestamp(ts).isoformat()``.
+
+    Log timestamps arrive many per second, so the date and time part is built
+    once per second and only the microseconds are formatted per call.
+    """
+
+    __slots__ = ("_second_prefix",)
+
+    def __init__(self) -> None:
+        # (epoch second, its local ISO date and time) of the last call
+        self._second_prefix: tuple[int, str] = (-1, "")
+
+    def __call__(self, created: float) -> str:
+        second = int(created)
+        micros = round((created - second) * 1_000_000)
+        if micros == 1_000_000:
+            second, micros = second + 1, 0
+
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second).isoformat()
+            self._second_prefix = (second, prefix)
+        # isoformat() leaves out the fraction when it is zero
+        return f"{prefix}.{micros:06d}" if micros else prefix
+
 
 # =============================================================================
 # Custom Formatters
@@ -55,10 +117,15 @@ class JsonFormatter(logging.Formatter):
     Outputs log records as JSON objects for easy parsing by log aggregation tools.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize JSON formatter; arguments are passed to logging.Formatter."""
+        super().__init__(*args, **kwargs)
+        self._format_timestamp = _IsoTimestamp()
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON string."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -67,15 +134,18 @@ class JsonFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add exception info if present
+        # Add exception info if present; the rendered traceback is cached on the
+        # record (as logging.Formatter does) so other handlers reuse it
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
 
         # Add extra fields if present
         if hasattr(record, "extra_data"):
             log_data["extra"] = record.extra_data
 
-        return json.dumps(log_data, default=str)
+        return _JSON_ENCODER.encode(log_data)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -96,12 +166,29 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
-    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
-        """Initialize colored formatter with optional format strings."""
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        is_tty: Optional[bool] = None,
+    ):
+        """
+        Initialize colored formatter with optional format strings.
+
+        Args:
+            fmt: Format used for WARNING and above.
+            datefmt: Date format.
+            is_tty: Whether output goes to a terminal; checked on stdout once
+                here if not given, rather than on every record.
+        """
         # Store both formats
         self._simple_fmt = DEFAULT_SIMPLE_LOG_FORMAT
         self._detailed_fmt = fmt or DEFAULT_LOG_FORMAT
         self._datefmt = datefmt or DEFAULT_DATE_FORMAT
+        self._is_tty = sys.stdout.isatty() if is_tty is None else is_tty
+        self._colored_levelnames = {
+            name: f"{color}{name}{self.RESET}" for name, color in self.COLORS.items()
+        }
         super().__init__(self._simple_fmt, self._datefmt)
 
     def format(self, record: logging.LogRecord) -> str:
@@ -116,13 +203,40 @@ class ColoredFormatter(logging.Formatter):
             self._style._fmt = self._simple_fmt
 
         # Only colorize if output is a terminal
-        if sys.stdout.isatty():
-            color = self.COLORS.get(record.levelname, "")
-            record.levelname = f"{color}{record.levelname}{self.RESET}"
+        if self._is_tty:
+            record.levelname = self._colored_levelnames.get(
+                record.levelname, f"{record.levelname}{self.RESET}"
+            )
 
         return super().format(record)
 
 
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves all formatting to the listener thread.
+
+    The stock QueueHandler merges the message arguments before enqueueing so
+    that records can cross process boundaries. Records here stay in-process,
+    so the calling thread only enqueues; %-interpolation, JSON serialization
+    and file writes happen on the QueueListener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record unchanged."""
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if one is running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 # =============================================================================
 # Logger Configuration
 # =============================================================================
@@ -135,6 +249,7 @@ def configure_logging(
     json_logs: bool = False,
     console_output: bool = True,
     file_output: bool = True,
+    background: bool = False,
 ) -> None:
     """
     Configure application-wide logging.
@@ -149,17 +264,23 @@ def configure_logging(
         json_logs: If True, use JSON format for file logs.
         console_output: If True, output logs to console.
         file_output: If True, output logs to file.
+        background: If True, format and write records on a background thread
+            so logging calls only enqueue the record.
 
     Example:
         >>> configure_logging(level="DEBUG", json_logs=True)
         >>> logger = get_logger(__name__)
         >>> logger.info("Logging configured")
     """
+    global _queue_listener
+
     # Get the root logger
     root_logger = logging.getLogger()
 
     # Clear existing handlers
+    _stop_queue_listener()
     root_logger.handlers.clear()
+    handlers: list[logging.Handler] = []
 
     # Set log level from environment or parameter
     log_level = getattr(logging, os.getenv("LOG_LEVEL", level).upper(), logging.INFO)
@@ -172,11 +293,11 @@ def configure_logging(
 
         # Use colored formatter for console in development
         if sys.stdout.isatty():
-            console_handler.setFormatter(ColoredFormatter())
+            console_handler.setFormatter(ColoredFormatter(is_tty=True))
         else:
             console_handler.setFormatter(logging.Formatter(DEFAULT_LOG_FORMAT, DEFAULT_DATE_FORMAT))
 
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler with rotation
     if file_output:
@@ -200,7 +321,16 @@ def configure_logging(
         else:
             file_handler.setFormatter(logging.Formatter(DEFAULT_LOG_FORMAT, DEFAULT_DATE_FORMAT))
 
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if background and handlers:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        root_logger.addHandler(DeferredQueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Reduce noise from third-party libraries
     _configure_library_loggers()
@@ -210,22 +340,7 @@ def configure_logging(
 
 def _configure_library_loggers() -> None:
     """Configure logging levels for third-party libraries to reduce noise."""
-    noisy_loggers = [
-        "urllib3",
-        "requests",
-        "httpx",
-        "httpcore",
-        "asyncio",
-        "prawcore",
-        "google.auth",
-        "google.auth.transport",
-        "googleapiclient",
-        "telegram",
-        "httpx._client",
-    ]
-
-    for logger_name in noisy_loggers:
-        logging.getLogger(logger_name).setLevel(logging.WARNING)
+    logging.config.dictConfig(_LIBRARY_LOGGING_CONFIG)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -261,8 +376,22 @@ class StructuredLogger:
 
     Each workflow execution creates a unique log file with structured
     JSON entries for easy parsing and analysis.
+
+    The file stays open for the logger's lifetime. Entries are queued and
+    written by a background thread, which combines whatever is waiting into
+    one write. Completed and failed steps wait for the queue to be written so
+    they survive a crash; ``flush()`` does the same on demand.
     """
 
+    # Most entries the writer thread combines into one write
+    BATCH_LIMIT = 64
+
+    # Queued entries before log_step waits for the writer to catch up
+    QUEUE_LIMIT = 10_000
+
+    # Step statuses written to disk before log_step returns
+    FLUSH_STATUSES = frozenset({"completed", "failed"})
+
     def __init__(self, log_dir: str = DEFAULT_LOG_DIR):
         """
         Initialize the structured logger.
@@ -279,25 +408,85 @@ class StructuredLogger:
 
         # Get standard logger for internal logging
         self._logger = get_logger(__name__)
+        self._timestamp = _IsoTimestamp()
+
+        # Encoded lines for the writer thread; None tells it to stop
+        self._queue: queue.Queue[Optional[str]] = queue.Queue(maxsize=self.QUEUE_LIMIT)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._file: TextIO = open(self.log_file, "a", encoding="utf-8")
+        self._writer = threading.Thread(
+            target=self._drain, name="structured-log-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
 
         # Initialize the file
         self._write_entry(
             {
                 "event": "session_start",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._timestamp(time.time()),
                 "config": {"log_level": logging.getLevelName(logging.root.level)},
             }
         )
+        self.flush()
         self._logger.info("Structured logging enabled: %s", self.log_file)
 
     def _write_entry(self, data: Dict[str, Any]) -> None:
-        """Write a single JSON entry to the log file."""
+        """Queue a single JSON entry for the writer thread."""
+        # Encode now: the caller may change data once log_step returns
+        line = _JSON_ENCODER.encode(data) + "\n"
+        with self._close_lock:
+            if not self._closed:
+                self._queue.put(line)
+                return
+
+        # Closed: append directly
         try:
             with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(data, default=str) + "\n")
+                f.write(line)
         except Exception as e:
             self._logger.error("Failed to write to structured log: %s", e)
 
+    def _drain(self) -> None:
+        """Write queued entries until close() is called (runs on the writer thread)."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_LIMIT:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = [line for line in batch if line is not None]
+            try:
+                if lines:
+                    self._file.write("".join(lines))
+                    self._file.flush()
+            except Exception as e:
+                self._logger.error("Failed to write to structured log: %s", e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if len(lines) < len(batch):
+                return
+
+    def flush(self) -> None:
+        """Wait until every queued entry has been written to the log file."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write queued entries, stop the writer thread and close the log file."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._writer.join()
+        self._file.close()
+        atexit.unregister(self.close)
+
     def log_step(
         self,
         chat_id: int,
@@ -321,7 +510,7 @@ class StructuredLogger:
             error: Optional error message if step failed.
         """
         entry: Dict[str, Any] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(time.time()),
             "event": "step_execution",
             "chat_id": chat_id,
             "step_number": step,
@@ -337,10 +526,11 @@ class StructuredLogger:
             entry["error"] = error
 
         self._write_entry(entry)
+        if status in self.FLUSH_STATUSES:
+            self.flush()
 
-        # Also log to standard logger
-        log_msg = f"Step {step} ({name}): {status}"
+        # Also log to standard logger; the message is only built if it is emitted
         if error:
-            self._logger.error(log_msg + f" - {error}")
+            self._logger.error("Step %s (%s): %s - %s", step, name, status, error)
         else:
-            self._logger.info(log_msg)
+            self._logger.info("Step %s (%s): %s", step, name, status)
@@ -25,7 +25,7 @@ Exception Hierarchy:
         └── ScriptGenerationError# Script creation failed
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional
 
 
 class RedditFlowError(Exception):
@@ -115,6 +115,9 @@ class APIError(RedditFlowError):
         response_body: Raw response body if available.
     """
 
+    # "[HTTP <code>] " prefixes shared by every APIError instance, keyed by status code
+    _status_prefix_cache: ClassVar[Dict[int, str]] = {}
+
     def __init__(
         self,
         message: str,
@@ -138,8 +141,14 @@ class APIError(RedditFlowError):
     def __str__(self) -> str:
         """Return string representation including status code."""
         base = super().__str__()
-        if self.status_code:
-            return f"[HTTP {self.status_code}] {base}"
+        status_code = self.status_code
+        if status_code:
+            prefix = APIError._status_prefix_cache.get(status_code)
+            if prefix is None:
+                prefix = APIError._status_prefix_cache.setdefault(
+                    status_code, f"[HTTP {status_code}] "
+                )
+            return prefix + base
         return base
 
 
@@ -59,6 +59,8 @@ class RedditPost(BaseModel):
         author: Username of the post author.
         score: Net upvotes on the post.
         comments: List of top-level and nested comments.
+        num_comments: Number of comments the post had when fetched, including
+            any not turned into comment models.
         created_utc: UTC timestamp when the post was created.
     """
 
@@ -70,6 +72,7 @@ class RedditPost(BaseModel):
     author: str = Field(default="[deleted]", description="Post author username")
     score: int = Field(default=0, description="Net upvote score")
     comments: List[RedditComment] = Field(default_factory=list, description="Post comments")
+    num_comments: int = Field(default=0, ge=0, description="Comments on the post when fetched")
     created_utc: Optional[datetime] = Field(default=None, description="Post creation time")
 
     @field_validator("author", mode="before")
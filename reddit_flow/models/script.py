@@ -10,6 +10,9 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, computed_field, field_validator
 
+# Allowed writing styles for script generation (lowercase canonical form)
+_VALID_STYLES = frozenset({"conversational", "formal", "humorous", "informative"})
+
 
 class VideoScript(BaseModel):
     """
@@ -108,7 +111,9 @@ class ScriptGenerationRequest(BaseModel):
     @classmethod
     def validate_style(cls, v: str) -> str:
         """Validate writing style."""
-        valid_styles = {"conversational", "formal", "humorous", "informative"}
-        if v.lower() not in valid_styles:
-            raise ValueError(f"Style must be one of: {valid_styles}")
-        return v.lower()
+        if v in _VALID_STYLES:
+            return v
+        lowered = v.lower()
+        if lowered not in _VALID_STYLES:
+            raise ValueError(f"Style must be one of: {set(_VALID_STYLES)}")
+        return lowered
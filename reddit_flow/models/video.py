@@ -21,6 +21,10 @@ class VideoStatus(str, Enum):
     FAILED = "failed"
 
 
+# Statuses of a video HeyGen is still generating
+_PENDING_STATUSES = frozenset({VideoStatus.PENDING, VideoStatus.PROCESSING})
+
+
 class VideoDimension(BaseModel):
     """
     Model for video dimensions.
@@ -44,13 +48,11 @@ class VideoDimension(BaseModel):
         h = self.height // divisor
         return f"{w}:{h}"
 
-    @computed_field
     @property
     def is_portrait(self) -> bool:
         """Check if video is portrait orientation."""
         return self.height > self.width
 
-    @computed_field
     @property
     def is_landscape(self) -> bool:
         """Check if video is landscape orientation."""
@@ -155,23 +157,20 @@ class VideoGenerationResponse(BaseModel):
     completed_at: Optional[datetime] = Field(default=None, description="Completion timestamp")
     duration_seconds: Optional[float] = Field(default=None, description="Video duration")
 
-    @computed_field
     @property
     def is_complete(self) -> bool:
         """Check if video generation is complete."""
         return self.status == VideoStatus.COMPLETED
 
-    @computed_field
     @property
     def is_failed(self) -> bool:
         """Check if video generation failed."""
         return self.status == VideoStatus.FAILED
 
-    @computed_field
     @property
     def is_pending(self) -> bool:
         """Check if video is still being generated."""
-        return self.status in (VideoStatus.PENDING, VideoStatus.PROCESSING)
+        return self.status in _PENDING_STATUSES
 
 
 class YouTubeUploadRequest(BaseModel):
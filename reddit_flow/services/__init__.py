@@ -7,19 +7,54 @@ This module provides service classes that implement the core business logic:
 - MediaService: Audio/video generation
 - UploadService: YouTube upload
 - WorkflowOrchestrator: End-to-end workflow coordination
+
+The service modules are imported on first access, so importing one service
+does not load the API clients of all the others.
 """
 
-from reddit_flow.services.content_service import ContentService
-from reddit_flow.services.media_service import MediaGenerationResult, MediaService
-from reddit_flow.services.script_service import ScriptService
-from reddit_flow.services.upload_service import UploadResult, UploadService
-from reddit_flow.services.workflow_orchestrator import (
-    StepResult,
-    WorkflowOrchestrator,
-    WorkflowResult,
-    WorkflowStatus,
-    WorkflowStep,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from reddit_flow.services.content_service import ContentService
+    from reddit_flow.services.media_service import MediaGenerationResult, MediaService
+    from reddit_flow.services.script_service import ScriptService
+    from reddit_flow.services.upload_service import UploadResult, UploadService
+    from reddit_flow.services.workflow_orchestrator import (
+        StepResult,
+        WorkflowCache,
+        WorkflowOrchestrator,
+        WorkflowResult,
+        WorkflowStatus,
+        WorkflowStep,
+    )
+
+# Public name -> module that defines it
+_LAZY_IMPORTS = {
+    "ContentService": "reddit_flow.services.content_service",
+    "MediaGenerationResult": "reddit_flow.services.media_service",
+    "MediaService": "reddit_flow.services.media_service",
+    "ScriptService": "reddit_flow.services.script_service",
+    "UploadResult": "reddit_flow.services.upload_service",
+    "UploadService": "reddit_flow.services.upload_service",
+    "StepResult": "reddit_flow.services.workflow_orchestrator",
+    "WorkflowCache": "reddit_flow.services.workflow_orchestrator",
+    "WorkflowOrchestrator": "reddit_flow.services.workflow_orchestrator",
+    "WorkflowResult": "reddit_flow.services.workflow_orchestrator",
+    "WorkflowStatus": "reddit_flow.services.workflow_orchestrator",
+    "WorkflowStep": "reddit_flow.services.workflow_orchestrator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a service module the first time one of its names is accessed."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "ContentService",
@@ -29,6 +64,7 @@ __all__ = [
     "UploadService",
     "UploadResult",
     "WorkflowOrchestrator",
+    "WorkflowCache",
     "WorkflowResult",
     "WorkflowStatus",
     "WorkflowStep",
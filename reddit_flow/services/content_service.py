@@ -6,7 +6,9 @@ including post data, comments, and link information parsing.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sized
 
 from reddit_flow.clients import RedditClient
 from reddit_flow.config import get_logger
@@ -16,6 +18,18 @@ from reddit_flow.models import LinkInfo, RedditComment, RedditPost
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _default_reddit_client() -> RedditClient:
+    """Return the RedditClient shared by every ContentService without an explicit one."""
+    return RedditClient()
+
+
+@lru_cache(maxsize=4096)
+def _parse_reddit_url_cached(url: str) -> LinkInfo:
+    """Return the LinkInfo for a URL, memoized across ContentService instances."""
+    return ContentService._parse_reddit_url(url)
+
+
 class ContentService:
     """
     Service for extracting and processing Reddit content.
@@ -36,14 +50,12 @@ class ContentService:
         >>> print(post.title)
     """
 
-    # Reddit URL patterns
+    # Reddit URL pattern (full URLs fill subreddit/post_id, redd.it short URLs fill short).
+    # Matched against the lowercased URL, so no IGNORECASE flag is needed.
     REDDIT_URL_PATTERN = re.compile(
-        r"(?:https?://)?(?:www\.)?(?:old\.)?reddit\.com/r/(\w+)/comments/(\w+)",
-        re.IGNORECASE,
-    )
-    REDDIT_SHORT_URL_PATTERN = re.compile(
-        r"(?:https?://)?redd\.it/(\w+)",
-        re.IGNORECASE,
+        r"(?:https?://)?(?:www\.)?(?:old\.)?reddit\.com/"
+        r"r/(?P<subreddit>\w+)/comments/(?P<post_id>\w+)"
+        r"|(?:https?://)?redd\.it/(?P<short>\w+)"
     )
 
     def __init__(
@@ -56,18 +68,18 @@ class ContentService:
 
         Args:
             reddit_client: Optional RedditClient instance. If not provided,
-                          a new client will be created.
+                          a process-wide shared client is used (created on first use).
             max_comments: Maximum number of comments to fetch per post.
         """
         self._reddit_client = reddit_client
         self._max_comments = max_comments
-        logger.info(f"ContentService initialized (max_comments={max_comments})")
+        logger.info("ContentService initialized (max_comments=%d)", max_comments)
 
     @property
     def reddit_client(self) -> RedditClient:
         """Lazy-load Reddit client on first access."""
         if self._reddit_client is None:
-            self._reddit_client = RedditClient()
+            self._reddit_client = _default_reddit_client()
         return self._reddit_client
 
     def parse_reddit_url(self, url: str) -> LinkInfo:
@@ -88,25 +100,39 @@ class ContentService:
         Raises:
             InvalidURLError: If URL cannot be parsed.
         """
-        # Try standard Reddit URL pattern
-        match = self.REDDIT_URL_PATTERN.search(url)
-        if match:
-            subreddit, post_id = match.groups()
-            logger.debug(f"Parsed URL: r/{subreddit}, post={post_id}")
-            return LinkInfo(
-                link=url,
-                subreddit=subreddit,
-                post_id=post_id,
-            )
-
-        # Try short URL pattern (redd.it) - not fully supported
-        match = self.REDDIT_SHORT_URL_PATTERN.search(url)
-        if match:
+        # Parsing is a pure function of the URL; cache it and hand out copies
+        # so callers cannot mutate the shared instance.
+        return _parse_reddit_url_cached(url).model_copy()
+
+    @classmethod
+    def _parse_reddit_url(cls, url: str) -> LinkInfo:
+        """Parse a Reddit URL without caching (see parse_reddit_url)."""
+        # Cheap substring check rejects obvious non-Reddit links before the regex
+        lowered = url.lower()
+        if "reddit.com/r/" not in lowered and "redd.it/" not in lowered:
+            raise InvalidURLError(f"Could not parse Reddit URL: {url}")
+
+        match = cls.REDDIT_URL_PATTERN.search(lowered)
+        if match is None:
+            raise InvalidURLError(f"Could not parse Reddit URL: {url}")
+
+        # Short URL (redd.it) - not fully supported
+        if match.group("short") is not None:
             raise InvalidURLError(
                 "Short URLs (redd.it) are not supported. " "Please use the full Reddit URL."
             )
 
-        raise InvalidURLError(f"Could not parse Reddit URL: {url}")
+        # Slice the original URL by match spans to keep the caller's casing
+        # (unless lowercasing changed the length, e.g. some non-ASCII chars)
+        source = url if len(lowered) == len(url) else lowered
+        subreddit = source[match.start("subreddit") : match.end("subreddit")]
+        post_id = source[match.start("post_id") : match.end("post_id")]
+        logger.debug("Parsed URL: r/%s, post=%s", subreddit, post_id)
+        return LinkInfo(
+            link=url,
+            subreddit=subreddit,
+            post_id=post_id,
+        )
 
     def validate_url(self, subreddit: Optional[str], post_id: str) -> bool:
         """
@@ -119,12 +145,21 @@ class ContentService:
         Returns:
             True if valid, False otherwise.
         """
-        # Post ID must be alphanumeric and reasonable length
-        if not post_id or not re.match(r"^[a-zA-Z0-9]{2,10}$", post_id):
+        # Post ID must be ASCII alphanumeric, 2-10 chars
+        if (
+            not post_id
+            or not 2 <= len(post_id) <= 10
+            or not post_id.isascii()
+            or not post_id.isalnum()
+        ):
             return False
 
-        # Subreddit validation (if provided)
-        if subreddit and not re.match(r"^[a-zA-Z0-9_]{2,21}$", subreddit):
+        # Subreddit (if provided) must be ASCII alphanumeric/underscore, 2-21 chars
+        if subreddit and not (
+            2 <= len(subreddit) <= 21
+            and subreddit.isascii()
+            and subreddit.replace("_", "a").isalnum()
+        ):
             return False
 
         return True
@@ -134,6 +169,7 @@ class ContentService:
         subreddit: str,
         post_id: str,
         include_comments: bool = True,
+        max_comments_override: Optional[int] = None,
     ) -> RedditPost:
         """
         Fetch complete post content including comments.
@@ -142,6 +178,9 @@ class ContentService:
             subreddit: Subreddit name.
             post_id: Reddit post ID.
             include_comments: Whether to fetch comments.
+            max_comments_override: Optional lower comment limit for this call
+                (capped at the service's max_comments). Pass 0 to skip building
+                comment models entirely.
 
         Returns:
             RedditPost model with post data.
@@ -151,24 +190,37 @@ class ContentService:
             RedditAPIError: If Reddit API call fails.
         """
         try:
-            logger.info(f"Fetching content from r/{subreddit}, post={post_id}")
+            logger.info("Fetching content from r/%s, post=%s", subreddit, post_id)
 
             # Fetch raw post data
             raw_data = self.reddit_client.get_post_data(subreddit, post_id)
 
+            comment_limit = self._max_comments
+            if max_comments_override is not None:
+                comment_limit = max(0, min(comment_limit, max_comments_override))
+
             # Convert comments to models
             comments: List[RedditComment] = []
-            if include_comments and raw_data.get("comments"):
-                for i, comment_data in enumerate(raw_data["comments"][: self._max_comments]):
-                    comment_id = comment_data.get("id", f"comment_{i}")
-                    comments.append(
-                        RedditComment(
-                            id=comment_id,
-                            author=comment_data.get("author", "[deleted]"),
-                            body=comment_data.get("body", "[deleted]"),
-                            score=comment_data.get("score", 0),
-                        )
+            raw_comments = raw_data.get("comments")
+            if include_comments and comment_limit and raw_comments:
+                comment_model = RedditComment
+                comments = [
+                    comment_model(
+                        id=c.get("id") or f"comment_{i}",
+                        author=c.get("author", "[deleted]"),
+                        body=c.get("body", "[deleted]"),
+                        score=c.get("score", 0),
                     )
+                    for i, c in enumerate(islice(raw_comments, comment_limit))
+                ]
+
+            # Count comments the post had, not just the models built from them;
+            # a lazy comment stream is only read up to the limit
+            num_comments = raw_data.get("num_comments")
+            if num_comments is None:
+                num_comments = (
+                    len(raw_comments) if isinstance(raw_comments, Sized) else len(comments)
+                )
 
             # Create post model
             post = RedditPost(
@@ -180,21 +232,23 @@ class ContentService:
                 score=raw_data.get("score", 0),
                 url=raw_data.get("url", f"https://reddit.com/r/{subreddit}/comments/{post_id}/"),
                 comments=comments,
+                num_comments=num_comments,
             )
 
-            logger.info(f"Fetched post: '{post.title[:50]}...' with {len(comments)} comments")
+            logger.info("Fetched post: '%.50s...' with %d comments", post.title, len(comments))
             return post
 
         except RedditAPIError:
             raise
         except Exception as e:
-            logger.error(f"Failed to extract content: {e}", exc_info=True)
+            logger.error("Failed to extract content: %s", e, exc_info=True)
             raise ContentError(f"Failed to extract Reddit content: {e}")
 
     def get_content_from_url(
         self,
         url: str,
         user_text: Optional[str] = None,
+        max_comments: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Extract content from a Reddit URL with optional user commentary.
@@ -204,6 +258,8 @@ class ContentService:
         Args:
             url: Reddit URL to process.
             user_text: Optional user commentary/opinion about the post.
+            max_comments: Optional per-call comment limit; 0 skips comments for
+                callers that only need the post text.
 
         Returns:
             Dictionary with:
@@ -213,7 +269,7 @@ class ContentService:
 
         Raises:
             InvalidURLError: If URL parsing fails.
-            EmptyContentError: If post has no content.
+            EmptyContentError: If post has neither selftext nor comments.
             ContentError: If content extraction fails.
         """
         # Parse URL
@@ -224,10 +280,15 @@ class ContentService:
             raise InvalidURLError(f"Invalid Reddit URL format: {url}")
 
         # Fetch content
-        post = self.get_post_content(link_info.subreddit, link_info.post_id)
-
-        # Validate content exists
-        if not post.selftext and not post.comments:
+        post = self.get_post_content(
+            link_info.subreddit,
+            link_info.post_id,
+            max_comments_override=max_comments,
+        )
+
+        # Validate content exists. Comment models may have been skipped
+        # (max_comments=0), so check the number of comments the post had
+        if not post.selftext and not post.num_comments:
             raise EmptyContentError("This post has no text content or comments to convert.")
 
         return {
@@ -246,13 +307,17 @@ class ContentService:
         Returns:
             Dictionary with post summary.
         """
+        selftext = post.selftext or ""
+        title = post.title or ""
+        # A literal with constant keys builds in one BUILD_CONST_KEY_MAP op,
+        # which is cheaper than dict(zip(keys, values)) or dict(**kwargs).
         return {
             "id": post.id,
             "subreddit": post.subreddit,
-            "title": post.title[:100] if post.title else "",
+            "title": title[:100],
             "author": post.author,
             "score": post.score,
-            "has_selftext": bool(post.selftext),
-            "selftext_length": len(post.selftext) if post.selftext else 0,
+            "has_selftext": bool(selftext),
+            "selftext_length": len(selftext),
             "comments_fetched": len(post.comments),
         }
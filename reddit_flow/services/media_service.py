@@ -5,17 +5,35 @@ This module provides business logic for generating audio via TTS and creating
 AI avatar videos from scripts using ElevenLabs and HeyGen APIs.
 """
 
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
 
 from reddit_flow.clients import ElevenLabsClient, HeyGenClient
-from reddit_flow.config import Settings, get_logger
+from reddit_flow.config import Settings, get_logger, get_settings
 from reddit_flow.exceptions import MediaGenerationError, TTSError, VideoGenerationError
 from reddit_flow.models import AudioAsset, VideoScript
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _default_elevenlabs_client() -> ElevenLabsClient:
+    """Return the ElevenLabsClient shared by every MediaService without an explicit one."""
+    return ElevenLabsClient()
+
+
+@lru_cache(maxsize=1)
+def _default_heygen_client() -> HeyGenClient:
+    """Return the HeyGenClient shared by every MediaService without an explicit one."""
+    return HeyGenClient()
+
+
 @dataclass
 class MediaGenerationResult:
     """
@@ -34,6 +52,46 @@ class MediaGenerationResult:
     video_url: Optional[str] = None
 
 
+class _CoalescingNotifier:
+    """
+    Deliver progress messages to an async callback in the background.
+
+    Posting never blocks the caller. While one message is being delivered,
+    newer messages replace each other so that only the latest is sent next;
+    a slow sink (e.g. a chat API) therefore sees at most one queued update.
+    """
+
+    def __init__(self, callback: Optional[Callable[[str], Any]]) -> None:
+        self._callback = callback
+        self._pending: Optional[str] = None
+        self._task: Optional[asyncio.Future] = None
+
+    def post(self, message: str) -> None:
+        """Schedule a message for delivery, superseding any undelivered one."""
+        if self._callback is None:
+            return
+        self._pending = message
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._drain())
+
+    async def relay(self, message: str) -> None:
+        """Async-callback adapter for APIs that await their update callback."""
+        self.post(message)
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            message, self._pending = self._pending, None
+            try:
+                await self._callback(message)  # type: ignore[misc]
+            except Exception as e:
+                logger.warning("Progress update failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Wait until every posted message has been delivered."""
+        if self._task is not None:
+            await self._task
+
+
 class MediaService:
     """
     Service for generating audio and video media from scripts.
@@ -47,6 +105,11 @@ class MediaService:
     Attributes:
         elevenlabs_client: ElevenLabsClient instance for TTS.
         heygen_client: HeyGenClient instance for video generation.
+        stream_audio: Whether TTS output is streamed straight into the HeyGen upload.
+        audio_cache_ttl: Seconds an uploaded audio asset is reused for identical scripts.
+        audio_cache_max_entries: Most audio assets kept in memory for reuse.
+        min_first_poll_delay: Minimum seconds before the first video status poll.
+        poll_backoff: Growth factor for the wait between video status polls.
 
     Example:
         >>> service = MediaService()
@@ -55,39 +118,87 @@ class MediaService:
         >>> print(result.video_url)
     """
 
+    # Uploaded HeyGen assets are reused for this long before being regenerated
+    DEFAULT_AUDIO_CACHE_TTL = 3600.0
+    # Each cached entry holds the full audio bytes, so keep only a few
+    DEFAULT_AUDIO_CACHE_MAX_ENTRIES = 32
+    # Video status results are served from memory for this long
+    STATUS_CACHE_TTL = 0.5
+    # Weight of the newest completion time in the moving average
+    COMPLETION_EMA_WEIGHT = 0.2
+    # First poll happens after this fraction of the average completion time
+    FIRST_POLL_FRACTION = 0.5
+
     def __init__(
         self,
         elevenlabs_client: Optional[ElevenLabsClient] = None,
         heygen_client: Optional[HeyGenClient] = None,
         settings: Optional[Settings] = None,
+        stream_audio: bool = False,
+        audio_cache_ttl: float = DEFAULT_AUDIO_CACHE_TTL,
+        audio_cache_max_entries: int = DEFAULT_AUDIO_CACHE_MAX_ENTRIES,
+        min_first_poll_delay: float = 10.0,
+        poll_backoff: float = 1.6,
     ) -> None:
         """
         Initialize MediaService.
 
         Args:
-            elevenlabs_client: Optional ElevenLabsClient instance.
-            heygen_client: Optional HeyGenClient instance.
-            settings: Optional Settings instance.
+            elevenlabs_client: Optional ElevenLabsClient instance. Defaults to a
+                process-wide shared client (created on first use).
+            heygen_client: Optional HeyGenClient instance. Defaults to a
+                process-wide shared client (created on first use).
+            settings: Optional Settings instance. Defaults to the cached
+                application settings.
+            stream_audio: Upload TTS audio to HeyGen while it is still being
+                synthesized instead of waiting for the complete file.
+            audio_cache_ttl: Seconds to reuse the uploaded audio for an identical
+                script and voice. Set to 0 to disable the cache.
+            audio_cache_max_entries: Maximum number of audio assets cached; the
+                least recently used one is evicted when full.
+            min_first_poll_delay: Seconds to wait before the first status poll
+                of a new video. Raised automatically once completion times of
+                previous videos are known.
+            poll_backoff: Growth factor for the wait between status polls.
         """
         self._elevenlabs_client = elevenlabs_client
         self._heygen_client = heygen_client
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
+        self._is_prod = self.settings.env == "prod"
+        self.stream_audio = stream_audio
+        self.audio_cache_ttl = audio_cache_ttl
+        self.audio_cache_max_entries = audio_cache_max_entries
+        # cache key -> (expires_at, audio bytes, uploaded asset), least recently used first
+        self._audio_cache: OrderedDict[str, Tuple[float, bytes, AudioAsset]] = OrderedDict()
+        # video_id -> (fetched_at, status dict), oldest first
+        self._status_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self.min_first_poll_delay = min_first_poll_delay
+        self.poll_backoff = poll_backoff
+        # Moving average of observed video completion times (seconds)
+        self._completion_ema: Optional[float] = None
         logger.info("MediaService initialized")
 
     @property
     def elevenlabs_client(self) -> ElevenLabsClient:
         """Lazy-load ElevenLabs client on first access."""
         if self._elevenlabs_client is None:
-            self._elevenlabs_client = ElevenLabsClient()
+            self._elevenlabs_client = _default_elevenlabs_client()
         return self._elevenlabs_client
 
     @property
     def heygen_client(self) -> HeyGenClient:
         """Lazy-load HeyGen client on first access."""
         if self._heygen_client is None:
-            self._heygen_client = HeyGenClient()
+            self._heygen_client = _default_heygen_client()
         return self._heygen_client
 
+    def _skip_in_dev(self, step: str) -> bool:
+        """Return True (and log it) when a paid API step should be skipped outside prod."""
+        if self._is_prod:
+            return False
+        logger.info("Skipping %s in %s mode", step, self.settings.env)
+        return True
+
     def generate_audio(self, text: str) -> bytes:
         """
         Generate audio from text using ElevenLabs TTS.
@@ -96,19 +207,19 @@ class MediaService:
             text: Text to convert to speech.
 
         Returns:
-            Audio data as bytes (MP3 format).
+            Audio data as bytes (MP3 format). Outside prod, placeholder bytes
+            are returned without contacting ElevenLabs.
 
-        Raiself.settings.env != "prod":
-            logger.info(f"Skipping audio generation in {self.settings.env} mode")
-            return b"dummy_audio_bytes"
-
-        if ses:
+        Raises:
             TTSError: If audio generation fails.
         """
+        if self._skip_in_dev("audio generation"):
+            return b"dummy_audio_bytes"
+
         if not text or not text.strip():
             raise TTSError("Cannot generate audio from empty text")
 
-        logger.info(f"Generating audio for {len(text)} characters")
+        logger.info("Generating audio for %d characters", len(text))
         return self.elevenlabs_client.text_to_speech(text)
 
     def generate_audio_from_script(self, script: VideoScript) -> bytes:
@@ -124,17 +235,23 @@ class MediaService:
         Raises:
             TTSError: If audio generation fails.
         """
-        logger.info(
-            f"Generating audio for script: '{script.title[:50]}...' " f"({script.word_count} words)"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            # word_count splits the whole script, so only compute it when logged
+            logger.info(
+                "Generating audio for script: '%.50s...' (%d words)",
+                script.title,
+                script.word_count,
+            )
         return self.generate_audio(script.script)
 
-    def upload_audio(self, audio_data: bytes) -> AudioAsset:
+    def upload_audio(self, audio_data: Union[bytes, bytearray, memoryview]) -> AudioAsset:
         """
         Upload audio to HeyGen asset storage.
 
+        The audio is passed down as a memoryview, so large buffers are not copied.
+
         Args:
-            audio_data: Audio file bytes (MP3/WAV).
+            audio_data: Audio file bytes (MP3/WAV), or any bytes-like buffer.
 
         Returns:
             AudioAsset with URL and metadata.
@@ -142,11 +259,76 @@ class MediaService:
         Raises:
             VideoGenerationError: If upload fails.
         """
-        if not audio_data:
+        audio_view = memoryview(audio_data)
+        if not audio_view.nbytes:
             raise VideoGenerationError("Cannot upload empty audio data")
 
-        logger.info(f"Uploading audio: {len(audio_data) / 1024:.2f} KB")
-        return self.heygen_client.upload_audio(audio_data)
+        logger.info("Uploading audio: %.2f KB", audio_view.nbytes / 1024)
+        return self.heygen_client.upload_audio(audio_view)
+
+    def stream_audio_to_heygen(self, script: VideoScript) -> Tuple[bytes, AudioAsset]:
+        """
+        Generate audio for a script and upload it to HeyGen as it is synthesized.
+
+        ElevenLabs chunks are fed directly into a chunked HeyGen upload, so the
+        upload overlaps with synthesis. Chunks are also collected so the full
+        audio is still available to the caller.
+
+        Args:
+            script: VideoScript model with script text.
+
+        Returns:
+            Tuple of (audio bytes, uploaded AudioAsset).
+
+        Raises:
+            TTSError: If audio generation fails.
+            VideoGenerationError: If upload fails.
+        """
+        text = script.script
+        if not text or not text.strip():
+            raise TTSError("Cannot generate audio from empty text")
+
+        logger.info("Streaming audio for script: '%.50s...' to HeyGen", script.title)
+        audio_buffer = bytearray()
+
+        def tee_chunks() -> Iterator[bytes]:
+            for chunk in self.elevenlabs_client.text_to_speech_stream(text):
+                audio_buffer.extend(chunk)
+                yield chunk
+
+        audio_asset = self.heygen_client.upload_audio_stream(tee_chunks())
+        if not audio_buffer:
+            raise TTSError("Text-to-speech stream returned no audio")
+
+        return bytes(audio_buffer), audio_asset
+
+    def _audio_cache_key(self, text: str) -> str:
+        """Build a content-addressed cache key from the script text and voice."""
+        voice_id = str(self.elevenlabs_client.voice_id)
+        return hashlib.blake2b(f"{voice_id}\0{text}".encode(), digest_size=16).hexdigest()
+
+    def _get_cached_audio(self, key: str) -> Optional[Tuple[bytes, AudioAsset]]:
+        """Return cached (audio bytes, asset) for a key, dropping expired entries."""
+        entry = self._audio_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, audio_data, audio_asset = entry
+        if time.monotonic() >= expires_at:
+            del self._audio_cache[key]
+            return None
+        self._audio_cache.move_to_end(key)
+        return audio_data, audio_asset
+
+    def _store_cached_audio(self, key: str, audio_data: bytes, audio_asset: AudioAsset) -> None:
+        """Cache audio for a key, dropping expired entries and evicting the least recently used."""
+        now = time.monotonic()
+        for stale in [k for k, entry in self._audio_cache.items() if now >= entry[0]]:
+            del self._audio_cache[stale]
+
+        self._audio_cache[key] = (now + self.audio_cache_ttl, audio_data, audio_asset)
+        self._audio_cache.move_to_end(key)
+        while len(self._audio_cache) > self.audio_cache_max_entries:
+            self._audio_cache.popitem(last=False)
 
     def start_video_generation(
         self,
@@ -170,7 +352,7 @@ class MediaService:
         Raises:
             VideoGenerationError: If video generation fails.
         """
-        logger.info(f"Starting video generation: '{title or 'Untitled'}'")
+        logger.info("Starting video generation: '%s'", title or "Untitled")
 
         return self.heygen_client.generate_video(
             audio_url=audio_asset.url,
@@ -199,12 +381,76 @@ class MediaService:
         Raises:
             VideoGenerationError: If generation fails or times out.
         """
-        logger.info(f"Waiting for video completion: {video_id}")
-        return await self.heygen_client.wait_for_video(
+        logger.info("Waiting for video completion: %s", video_id)
+        started = time.monotonic()
+        video_url = await self.heygen_client.wait_for_video(
             video_id=video_id,
             update_callback=update_callback,
             timeout=timeout,
+            status_callback=partial(self._remember_status, video_id),
+            initial_delay=self.first_poll_delay,
+            poll_backoff=self.poll_backoff,
         )
+        self._record_completion_time(time.monotonic() - started)
+        return video_url
+
+    def cancel_video_job(self, video_id: str) -> bool:
+        """
+        Best-effort teardown of a HeyGen video that is no longer wanted.
+
+        Args:
+            video_id: HeyGen video ID.
+
+        Returns:
+            True if the video was deleted, False if the deletion failed.
+        """
+        try:
+            self.heygen_client.delete_video(video_id)
+        except VideoGenerationError as e:
+            logger.warning("Could not cancel video %s: %s", video_id, e)
+            return False
+        self._status_cache.pop(video_id, None)
+        return True
+
+    @property
+    def first_poll_delay(self) -> float:
+        """Seconds to wait before polling a new video, tuned by past completions."""
+        if self._completion_ema is None:
+            return self.min_first_poll_delay
+        return max(self.min_first_poll_delay, self._completion_ema * self.FIRST_POLL_FRACTION)
+
+    def _record_completion_time(self, seconds: float) -> None:
+        """Fold an observed completion time into the moving average."""
+        if self._completion_ema is None:
+            self._completion_ema = seconds
+        else:
+            weight = self.COMPLETION_EMA_WEIGHT
+            self._completion_ema = weight * seconds + (1 - weight) * self._completion_ema
+
+    def _remember_status(self, video_id: str, data: Dict[str, Any]) -> None:
+        """Cache a raw HeyGen status payload observed while polling."""
+        self._cache_status(
+            video_id,
+            {
+                "video_id": video_id,
+                "status": str(data.get("status")),
+                "video_url": data.get("video_url"),
+                "error_message": data.get("error"),
+            },
+        )
+
+    def _cache_status(self, video_id: str, status: Dict[str, Any]) -> None:
+        """Cache a status dict, first dropping entries older than STATUS_CACHE_TTL."""
+        now = time.monotonic()
+        cache = self._status_cache
+        while cache:
+            oldest_id, (fetched_at, _) = next(iter(cache.items()))
+            if now - fetched_at < self.STATUS_CACHE_TTL:
+                break
+            del cache[oldest_id]
+
+        cache[video_id] = (now, status)
+        cache.move_to_end(video_id)
 
     async def generate_video_from_script(
         self,
@@ -240,8 +486,7 @@ class MediaService:
             VideoGenerationError: If video generation fails.
             MediaGenerationError: If overall workflow fails.
         """
-        if self.settings.env != "prod":
-            logger.info(f"Skipping video generation in {self.settings.env} mode")
+        if self._skip_in_dev("video generation"):
             return MediaGenerationResult(
                 audio_data=b"dummy_audio",
                 audio_asset=AudioAsset(
@@ -252,24 +497,41 @@ class MediaService:
                 video_url="https://example.com/test_video.mp4",
             )
 
-        try:
-            # Step 1: Generate audio from script
-            if update_callback:
-                await update_callback("Generating audio from script...")
+        # Progress updates are delivered in the background so they overlap the HTTP work
+        notifier = _CoalescingNotifier(update_callback)
+        notify = notifier.post
 
-            audio_data = self.generate_audio_from_script(script)
+        try:
+            cache_key = self._audio_cache_key(script.script) if self.audio_cache_ttl > 0 else None
+            cached_audio = self._get_cached_audio(cache_key) if cache_key else None
+
+            if cached_audio is not None:
+                # Steps 1+2: Identical script already voiced and uploaded
+                notify("Reusing previously generated audio...")
+                audio_data, audio_asset = cached_audio
+                logger.info("Audio cache hit: %.50s...", audio_asset.url)
+            elif self.stream_audio:
+                # Steps 1+2: Generate audio and upload it to HeyGen as one pipeline
+                notify("Generating audio and streaming it to HeyGen...")
+                audio_data, audio_asset = await asyncio.to_thread(
+                    self.stream_audio_to_heygen, script
+                )
+            else:
+                # Step 1: Generate audio from script
+                notify("Generating audio from script...")
+                audio_data = await asyncio.to_thread(self.generate_audio_from_script, script)
 
-            # Step 2: Upload audio to HeyGen
-            if update_callback:
-                await update_callback("Uploading audio to HeyGen...")
+                # Step 2: Upload audio to HeyGen
+                notify("Uploading audio to HeyGen...")
+                audio_asset = await asyncio.to_thread(self.upload_audio, audio_data)
 
-            audio_asset = self.upload_audio(audio_data)
+            if cache_key and cached_audio is None:
+                self._store_cached_audio(cache_key, audio_data, audio_asset)
 
             # Step 3: Start video generation
-            if update_callback:
-                await update_callback("Starting video generation...")
-
-            video_id = self.start_video_generation(
+            notify("Starting video generation...")
+            video_id = await asyncio.to_thread(
+                self.start_video_generation,
                 audio_asset=audio_asset,
                 title=script.title,
                 avatar_id=avatar_id,
@@ -284,16 +546,24 @@ class MediaService:
 
             # Step 4: Optionally wait for completion
             if wait_for_completion:
-                video_url = await self.wait_for_video(
-                    video_id=video_id,
-                    update_callback=update_callback,
-                    timeout=timeout,
-                )
+                try:
+                    video_url = await self.wait_for_video(
+                        video_id=video_id,
+                        update_callback=notifier.relay if update_callback else None,
+                        timeout=timeout,
+                    )
+                except asyncio.CancelledError:
+                    # Stop the server-side render so it does not use up quota; the
+                    # shield lets the teardown finish even if cancelled again
+                    logger.warning("Video wait cancelled, deleting HeyGen video %s", video_id)
+                    await asyncio.shield(asyncio.to_thread(self.cancel_video_job, video_id))
+                    raise
                 result.video_url = video_url
 
             logger.info(
-                f"Media generation complete: video_id={video_id}, "
-                f"completed={result.video_url is not None}"
+                "Media generation complete: video_id=%s, completed=%s",
+                video_id,
+                result.video_url is not None,
             )
 
             return result
@@ -301,8 +571,10 @@ class MediaService:
         except (TTSError, VideoGenerationError):
             raise
         except Exception as e:
-            logger.error(f"Media generation failed: {e}", exc_info=True)
+            logger.error("Media generation failed: %s", e, exc_info=True)
             raise MediaGenerationError(f"Media generation failed: {e}")
+        finally:
+            await notifier.aclose()
 
     async def generate_video_from_text(
         self,
@@ -354,6 +626,10 @@ class MediaService:
         """
         Check the status of a video generation.
 
+        Results seen within the last STATUS_CACHE_TTL seconds (from an earlier
+        check or from an in-flight wait_for_video poll) are returned without
+        another API call.
+
         Args:
             video_id: HeyGen video ID.
 
@@ -363,10 +639,16 @@ class MediaService:
         Raises:
             VideoGenerationError: If status check fails.
         """
+        cached = self._status_cache.get(video_id)
+        if cached is not None and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            return dict(cached[1])
+
         response = self.heygen_client.check_video_status(video_id)
-        return {
+        status = {
             "video_id": response.video_id,
             "status": response.status,
             "video_url": response.video_url,
             "error_message": response.error_message,
         }
+        self._cache_status(video_id, status)
+        return dict(status)
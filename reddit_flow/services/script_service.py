@@ -5,6 +5,8 @@ This module provides business logic for generating video scripts from Reddit con
 using the Gemini AI client.
 """
 
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 from reddit_flow.clients import GeminiClient
@@ -15,6 +17,12 @@ from reddit_flow.models import RedditComment, RedditPost, VideoScript
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _default_gemini_client() -> GeminiClient:
+    """Return the GeminiClient shared by every ScriptService without an explicit one."""
+    return GeminiClient()
+
+
 class ScriptService:
     """
     Service for generating video scripts from Reddit content.
@@ -49,7 +57,7 @@ class ScriptService:
 
         Args:
             gemini_client: Optional GeminiClient instance. If not provided,
-                          a new client will be created when needed.
+                          a process-wide shared client is used (created on first use).
             max_words: Maximum word count for generated scripts.
             max_comments: Maximum number of comments to include in context.
             settings: Optional Settings instance.
@@ -66,7 +74,7 @@ class ScriptService:
     def gemini_client(self) -> GeminiClient:
         """Lazy-load Gemini client on first access."""
         if self._gemini_client is None:
-            self._gemini_client = GeminiClient()
+            self._gemini_client = _default_gemini_client()
         return self._gemini_client
 
     async def generate_script(
@@ -178,14 +186,15 @@ class ScriptService:
 
             # Format comments from dictionary
             raw_comments = content.get("comments", [])
+            # Filter before limiting so up to max_comments non-empty comments are kept
+            with_body = ((c, body) for c in raw_comments if (body := c.get("body")))
             comments_data = [
                 {
-                    "body": c.get("body", ""),
+                    "body": body,
                     "author": c.get("author", "[deleted]"),
                     "score": c.get("score", 0),
                 }
-                for c in raw_comments[: self._max_comments]
-                if c.get("body")
+                for c, body in islice(with_body, self._max_comments)
             ]
 
             logger.info(
@@ -243,7 +252,8 @@ class ScriptService:
         Format comments for AI script generation.
 
         Converts RedditComment models to dictionary format expected by
-        GeminiClient, limiting to max_comments and filtering out deleted.
+        GeminiClient, filtering out deleted comments and keeping the first
+        max_comments that remain.
 
         Args:
             comments: List of RedditComment models.
@@ -251,22 +261,12 @@ class ScriptService:
         Returns:
             List of comment dictionaries with body, author, and score.
         """
-        formatted = []
-
-        for comment in comments[: self._max_comments]:
-            # Skip deleted comments
-            if comment.body == "[deleted]":
-                continue
-
-            formatted.append(
-                {
-                    "body": comment.body,
-                    "author": comment.author,
-                    "score": comment.score,
-                }
-            )
-
-        return formatted
+        # Skip deleted comments before limiting, so deleted ones don't use up the quota
+        kept = (c for c in comments if c.body != "[deleted]")
+        return [
+            {"body": c.body, "author": c.author, "score": c.score}
+            for c in islice(kept, self._max_comments)
+        ]
 
     def _validate_script(self, script: VideoScript) -> bool:
         """
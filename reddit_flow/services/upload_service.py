@@ -6,12 +6,19 @@ including title/description formatting and metadata management.
 """
 
 import os
+import queue
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractContextManager, closing, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential
+from urllib3.util.retry import Retry
 
 from reddit_flow.clients import YouTubeClient
 from reddit_flow.config import Settings, get_logger
@@ -20,6 +27,47 @@ from reddit_flow.models import VideoScript, YouTubeUploadRequest, YouTubeUploadR
 
 logger = get_logger(__name__)
 
+# YouTube title/description limits and the cut points that leave room for "..."
+_TITLE_LIMIT = 100
+_TITLE_CUTOFF = _TITLE_LIMIT - 3
+_DESC_LIMIT = 5000
+_DESC_CUTOFF = _DESC_LIMIT - 3
+
+# Reasons in YouTube API errors that a retry within minutes cannot fix
+_QUOTA_ERROR_REASONS = frozenset({"quotaExceeded", "uploadLimitExceeded", "dailyLimitExceeded"})
+
+# Network failures raised while talking to YouTube or the video host
+_NETWORK_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+def _is_retryable_upload_error(error: BaseException) -> bool:
+    """
+    Return True for upload failures worth retrying.
+
+    Only transient causes qualify: network errors and 5xx replies from the
+    YouTube API. Exhausted quota, client errors, missing files and failed
+    authentication would fail the same way again.
+    """
+    from googleapiclient.errors import HttpError
+
+    if not isinstance(error, YouTubeUploadError):
+        return False
+    cause = error.__cause__
+    if isinstance(cause, _NETWORK_ERRORS):
+        return True
+    if not isinstance(cause, HttpError):
+        return False
+    details = cause.error_details if isinstance(cause.error_details, list) else []
+    reasons = {detail.get("reason") for detail in details if isinstance(detail, dict)}
+    if reasons & _QUOTA_ERROR_REASONS:
+        return False
+    return cause.status_code is not None and cause.status_code >= 500
+
 
 @dataclass
 class UploadResult:
@@ -41,6 +89,158 @@ class UploadResult:
     local_file_path: Optional[str] = None
 
 
+class _DownloadProgress:
+    """
+    Thread-safe byte counter for download progress callbacks.
+
+    The callback fires only when another REPORT_EVERY bytes have arrived (or
+    the download finishes), so per-chunk overhead is a single comparison.
+    """
+
+    REPORT_EVERY = 1 << 20
+
+    def __init__(
+        self, callback: Callable[[int, Optional[int]], None], total: Optional[int]
+    ) -> None:
+        self._callback = callback
+        self._total = total
+        self._done = 0
+        self._reported = 0
+        self._next_report = self.REPORT_EVERY
+        self._lock = threading.Lock()
+
+    def add(self, nbytes: int) -> None:
+        """Record nbytes more downloaded, reporting if a threshold was crossed."""
+        with self._lock:
+            self._done += nbytes
+            if self._done < self._next_report and self._done != self._total:
+                return
+            self._next_report = self._done + self.REPORT_EVERY
+            self._reported = done = self._done
+        self._callback(done, self._total)
+
+    def restart(self, total: Optional[int]) -> None:
+        """
+        Count from zero again after the download restarted from the beginning.
+
+        Nothing is reported until the new count passes the last reported one,
+        so the callback never sees progress go backwards.
+        """
+        with self._lock:
+            self._total = total
+            self._done = 0
+            self._next_report = max(self._reported, self.REPORT_EVERY)
+
+    def finish(self) -> None:
+        """Report the final count if the last chunk did not already do so."""
+        with self._lock:
+            if self._done == self._reported:
+                return
+            self._reported = done = self._done
+        self._callback(done, self._total)
+
+
+class _ProgressReader:
+    """Readable wrapper that feeds bytes read from a stream into a _DownloadProgress."""
+
+    def __init__(self, stream: Any, progress: _DownloadProgress) -> None:
+        self._stream = stream
+        self._progress = progress
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        if data:
+            self._progress.add(len(data))
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        read = self._stream.readinto(buffer)
+        if read:
+            self._progress.add(read)
+        return read
+
+
+class _BackgroundCallback:
+    """
+    Progress callback adapter that runs the real callback on a daemon thread.
+
+    Calls made on the transfer thread only queue their arguments, so a slow
+    callback cannot throttle the upload. When the bounded queue is full the
+    oldest pending update is dropped; on exit the queue is drained (waiting
+    at most CLOSE_TIMEOUT seconds) so the final update is still delivered.
+    """
+
+    QUEUE_SIZE = 8
+    CLOSE_TIMEOUT = 5.0
+    _STOP = object()
+
+    def __init__(self, callback: Callable[..., None]) -> None:
+        self._callback = callback
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._run, name="progress-callback", daemon=True)
+        self._thread.start()
+
+    def __call__(self, *args: Any) -> None:
+        self._put(args)
+
+    def _put(self, item: Any) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _run(self) -> None:
+        while (args := self._queue.get()) is not self._STOP:
+            try:
+                self._callback(*args)
+            except Exception:
+                logger.warning("Progress callback failed", exc_info=True)
+
+    def __enter__(self) -> "_BackgroundCallback":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._put(self._STOP)
+        self._thread.join(self.CLOSE_TIMEOUT)
+
+
+def _in_background(
+    callback: Optional[Callable[..., None]],
+) -> AbstractContextManager[Optional[Callable[..., None]]]:
+    """Return a context yielding callback wrapped in a _BackgroundCallback (None stays None)."""
+    return _BackgroundCallback(callback) if callback is not None else nullcontext()
+
+
+class _AtomicCleanup:
+    """Context manager that deletes a temporary file on exit unless disarmed."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._armed = True
+
+    def disarm(self) -> str:
+        """Keep the file after the block exits and return its path."""
+        self._armed = False
+        return self.path
+
+    def __enter__(self) -> "_AtomicCleanup":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if not self._armed:
+            return
+        try:
+            Path(self.path).unlink(missing_ok=True)
+            logger.debug("Cleaned up temporary file: %s", self.path)
+        except OSError as e:
+            logger.warning("Failed to clean up file %s: %s", self.path, e)
+
+
 class UploadService:
     """
     Service for uploading videos to YouTube.
@@ -49,11 +249,13 @@ class UploadService:
     - Downloading videos from URLs to local files
     - Formatting titles and descriptions for YouTube
     - Uploading videos with metadata
+    - Uploading batches of videos concurrently
     - Managing upload progress callbacks
 
     Attributes:
         youtube_client: YouTubeClient instance for API calls.
         default_category_id: Default YouTube category ID.
+        stream_uploads: Whether URL uploads skip the temporary file.
 
     Example:
         >>> service = UploadService()
@@ -66,8 +268,20 @@ class UploadService:
     """
 
     # YouTube video limits
-    MAX_TITLE_LENGTH = 100
-    MAX_DESCRIPTION_LENGTH = 5000
+    MAX_TITLE_LENGTH = _TITLE_LIMIT
+    MAX_DESCRIPTION_LENGTH = _DESC_LIMIT
+
+    # Copy buffer size when downloading videos
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    # Parallel ranged downloads: connection count and minimum file size
+    DOWNLOAD_WORKERS = 4
+    PARALLEL_DOWNLOAD_MIN_SIZE = 8 << 20
+    # (connect, read) timeouts for video downloads
+    DOWNLOAD_TIMEOUT = (10, 300)
+    # Batch uploads: attempts per video and exponential backoff bounds (seconds)
+    BATCH_UPLOAD_ATTEMPTS = 3
+    BATCH_RETRY_BASE_DELAY = 2.0
+    BATCH_RETRY_MAX_DELAY = 60.0
 
     def __init__(
         self,
@@ -75,6 +289,7 @@ class UploadService:
         default_category_id: str = "22",
         default_privacy: str = "public",
         settings: Optional[Settings] = None,
+        stream_uploads: bool = False,
     ) -> None:
         """
         Initialize UploadService.
@@ -84,11 +299,19 @@ class UploadService:
             default_category_id: Default YouTube category (22 = People & Blogs).
             default_privacy: Default privacy status (public, private, unlisted).
             settings: Optional Settings instance.
+            stream_uploads: Pipe videos from URL straight into the YouTube
+                upload instead of downloading them to a temporary file first
+                (ignored when the local file is kept).
         """
         self._youtube_client = youtube_client
         self._default_category_id = default_category_id
         self._default_privacy = default_privacy
         self.settings = settings or Settings()
+        self._is_prod = self.settings.env == "prod"
+        self._http_session: Optional[requests.Session] = None
+        # Per-thread sessions of upload_many_from_urls workers
+        self._thread_state = threading.local()
+        self.stream_uploads = stream_uploads
         logger.info(
             f"UploadService initialized (category={default_category_id}, "
             f"privacy={default_privacy})"
@@ -101,6 +324,42 @@ class UploadService:
             self._youtube_client = YouTubeClient()
         return self._youtube_client
 
+    @property
+    def http_session(self) -> requests.Session:
+        """
+        Lazy-load the HTTP session used for video downloads.
+
+        Reusing one session keeps connections (and TLS sessions) to the video
+        CDN alive across downloads, and retries transient server errors.
+        Sessions are not thread-safe, so worker threads of
+        upload_many_from_urls and range downloads get their own.
+        """
+        session: Optional[requests.Session] = getattr(self._thread_state, "http_session", None)
+        if session is not None:
+            return session
+        if self._http_session is None:
+            self._http_session = self._new_http_session()
+        return self._http_session
+
+    @staticmethod
+    def _new_http_session() -> requests.Session:
+        """Create a pooled download session that retries transient server errors."""
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _ensure_clients(self) -> None:
+        """Create the lazy YouTube client now, before worker threads race to create it."""
+        if self._youtube_client is None:
+            self._youtube_client = YouTubeClient()
+
     def upload_video(
         self,
         file_path: str,
@@ -131,31 +390,24 @@ class UploadService:
         Raises:
             YouTubeUploadError: If upload fails.
         """
-        if self.settings.env != "prod":
-            logger.info(f"Skipping YouTube upload in {self.settings.env} mode")
-            return YouTubeUploadResponse(
-                video_id="test_video_id",
-                title=title,
-                url="https://youtube.com/watch?v=test_video_id",
-            )
+        if not self._is_prod:
+            return self._skipped_upload_response(title)
 
-        # Validate file exists
-        video_path = Path(file_path)
-        if not video_path.exists():
+        # Validate file exists (one getsize call gives both existence and size)
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
             raise YouTubeUploadError(f"Video file not found: {file_path}")
 
         # Format title and description
         formatted_title = self._format_title(title)
         formatted_description = self._format_description(description)
 
-        logger.info(
-            f"Uploading video: '{formatted_title}' "
-            f"({video_path.stat().st_size / (1024*1024):.2f} MB)"
-        )
+        logger.info("Uploading video: '%s' (%.2f MB)", formatted_title, file_size / (1 << 20))
 
         # Create upload request
         request = YouTubeUploadRequest(
-            file_path=str(video_path),
+            file_path=os.fspath(file_path),
             title=formatted_title,
             description=formatted_description,
             category_id=category_id or self._default_category_id,
@@ -164,11 +416,12 @@ class UploadService:
             made_for_kids=made_for_kids,
         )
 
-        # Perform upload
-        response = self.youtube_client.upload_video_from_request(
-            request=request,
-            progress_callback=progress_callback,
-        )
+        # Perform upload (progress is reported off the upload thread)
+        with _in_background(progress_callback) as background_callback:
+            response = self.youtube_client.upload_video_from_request(
+                request=request,
+                progress_callback=background_callback,
+            )
 
         logger.info(f"Video uploaded: {response.video_id} - {response.watch_url}")
         return response
@@ -202,12 +455,16 @@ class UploadService:
         Raises:
             YouTubeUploadError: If upload fails.
         """
-        # Build description from script metadata
-        description = self._build_description_from_script(script, additional_description)
-
         # Use youtube_title if available, otherwise regular title
         title = script.youtube_title or script.title
 
+        # The metadata is never sent outside prod, so don't build it
+        if not self._is_prod:
+            return self._skipped_upload_response(title)
+
+        # Build description from script metadata
+        description = self._build_description_from_script(script, additional_description)
+
         return self.upload_video(
             file_path=file_path,
             title=title,
@@ -226,6 +483,7 @@ class UploadService:
         privacy_status: Optional[str] = None,
         keep_local_file: bool = False,
         progress_callback: Optional[Callable[[int], None]] = None,
+        download_progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> UploadResult:
         """
         Download video from URL and upload to YouTube.
@@ -241,6 +499,8 @@ class UploadService:
             privacy_status: Override default privacy status.
             keep_local_file: Whether to keep the downloaded file.
             progress_callback: Optional callback for upload progress.
+            download_progress_callback: Optional callback receiving
+                (bytes downloaded, total bytes or None) while downloading.
 
         Returns:
             UploadResult with video details and optional local path.
@@ -249,21 +509,145 @@ class UploadService:
             YouTubeUploadError: If download or upload fails.
         """
         # Skip download/upload in non-prod environments
-        if self.settings.env != "prod":
-            logger.info(f"Skipping video download/upload in {self.settings.env} mode")
-            return UploadResult(
-                video_id="test_video_id",
+        if not self._is_prod:
+            return self._skipped_upload_result(title)
+
+        if self.stream_uploads and not keep_local_file:
+            return self.upload_from_url_streaming(
+                video_url=video_url,
                 title=title,
-                url="https://youtube.com/watch?v=test_video_id",
-                studio_url="https://studio.youtube.com/video/test_video_id/edit",
-                local_file_path=None,
+                description=description,
+                tags=tags,
+                privacy_status=privacy_status,
+                progress_callback=progress_callback,
+                download_progress_callback=download_progress_callback,
             )
 
-        # Download video to temporary file
-        local_path = self._download_video(video_url)
+        return self._upload_via_temp_file(
+            video_url=video_url,
+            title=title,
+            description=description,
+            tags=tags,
+            privacy_status=privacy_status,
+            keep_local_file=keep_local_file,
+            progress_callback=progress_callback,
+            download_progress_callback=download_progress_callback,
+        )
+
+    def upload_from_url_streaming(
+        self,
+        video_url: str,
+        title: str,
+        description: str = "",
+        tags: Optional[List[str]] = None,
+        privacy_status: Optional[str] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        download_progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> UploadResult:
+        """
+        Pipe a video from URL straight into a resumable YouTube upload.
+
+        The HTTP body is read one upload chunk at a time, so the video is never
+        written to disk. YouTube needs the total size up front; if the source
+        does not send a plain Content-Length, this falls back to downloading
+        to a temporary file first.
+
+        Args:
+            video_url: URL of video to upload.
+            title: Video title.
+            description: Video description.
+            tags: Optional list of video tags.
+            privacy_status: Override default privacy status.
+            progress_callback: Optional callback for upload progress.
+            download_progress_callback: Optional callback receiving
+                (bytes downloaded, total bytes or None) while downloading.
+
+        Returns:
+            UploadResult with video details (no local file).
+
+        Raises:
+            YouTubeUploadError: If download or upload fails.
+        """
+        if not self._is_prod:
+            return self._skipped_upload_result(title)
 
         try:
-            # Upload to YouTube
+            response = self.http_session.get(video_url, stream=True, timeout=self.DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to open video stream: {e}")
+            raise YouTubeUploadError(f"Failed to download video from URL: {e}") from e
+
+        with closing(response):
+            content_length = response.headers.get("Content-Length", "")
+            if not content_length.isdigit() or "Content-Encoding" in response.headers:
+                logger.info("Video size unknown, uploading via temporary file instead")
+                response.close()
+                return self._upload_via_temp_file(
+                    video_url=video_url,
+                    title=title,
+                    description=description,
+                    tags=tags,
+                    privacy_status=privacy_status,
+                    keep_local_file=False,
+                    progress_callback=progress_callback,
+                    download_progress_callback=download_progress_callback,
+                )
+
+            size = int(content_length)
+            formatted_title = self._format_title(title)
+            logger.info(f"Streaming video to YouTube: '{formatted_title}' ({size} bytes)")
+
+            # Both callbacks would otherwise run on the thread moving the bytes
+            with (
+                _in_background(progress_callback) as upload_callback,
+                _in_background(download_progress_callback) as download_callback,
+            ):
+                stream: Any = response.raw
+                if download_callback is not None:
+                    stream = _ProgressReader(stream, _DownloadProgress(download_callback, size))
+
+                video_id = self.youtube_client.upload_video_stream(
+                    stream=stream,
+                    size=size,
+                    title=formatted_title,
+                    description=self._format_description(description),
+                    category_id=self._default_category_id,
+                    privacy_status=privacy_status or self._default_privacy,
+                    tags=tags or [],
+                    progress_callback=upload_callback,
+                )
+
+        uploaded = YouTubeUploadResponse(
+            video_id=video_id,
+            title=formatted_title,
+            url=f"https://www.youtube.com/watch?v={video_id}",
+        )
+        logger.info(f"Video uploaded: {uploaded.video_id} - {uploaded.watch_url}")
+        return UploadResult(
+            video_id=uploaded.video_id,
+            title=uploaded.title,
+            url=uploaded.watch_url,
+            studio_url=uploaded.studio_url,
+        )
+
+    def _upload_via_temp_file(
+        self,
+        video_url: str,
+        title: str,
+        description: str,
+        tags: Optional[List[str]],
+        privacy_status: Optional[str],
+        keep_local_file: bool,
+        progress_callback: Optional[Callable[[int], None]],
+        download_progress_callback: Optional[Callable[[int, Optional[int]], None]],
+    ) -> UploadResult:
+        """Download a video to a temporary file, then upload it (see upload_from_url)."""
+        # Download video to temporary file
+        local_path = self._download_video(video_url, progress_callback=download_progress_callback)
+
+        # Delete the download on error, and on success unless it is being kept
+        with _AtomicCleanup(local_path) as cleanup:
             response = self.upload_video(
                 file_path=local_path,
                 title=title,
@@ -272,25 +656,16 @@ class UploadService:
                 privacy_status=privacy_status,
                 progress_callback=progress_callback,
             )
-
-            result = UploadResult(
-                video_id=response.video_id,
-                title=response.title,
-                url=response.watch_url,
-                studio_url=response.studio_url,
-                local_file_path=local_path if keep_local_file else None,
-            )
-
-            # Clean up temporary file if not keeping
-            if not keep_local_file:
-                self._cleanup_file(local_path)
-
-            return result
-
-        except Exception:
-            # Clean up on error
-            self._cleanup_file(local_path)
-            raise
+            if keep_local_file:
+                cleanup.disarm()
+
+        return UploadResult(
+            video_id=response.video_id,
+            title=response.title,
+            url=response.watch_url,
+            studio_url=response.studio_url,
+            local_file_path=local_path if keep_local_file else None,
+        )
 
     def upload_from_url_with_script(
         self,
@@ -301,6 +676,7 @@ class UploadService:
         privacy_status: Optional[str] = None,
         keep_local_file: bool = False,
         progress_callback: Optional[Callable[[int], None]] = None,
+        download_progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> UploadResult:
         """
         Download video from URL and upload using script metadata.
@@ -315,6 +691,8 @@ class UploadService:
             privacy_status: Override default privacy status.
             keep_local_file: Whether to keep the downloaded file.
             progress_callback: Optional callback for upload progress.
+            download_progress_callback: Optional callback receiving
+                (bytes downloaded, total bytes or None) while downloading.
 
         Returns:
             UploadResult with video details.
@@ -322,10 +700,14 @@ class UploadService:
         Raises:
             YouTubeUploadError: If download or upload fails.
         """
-        # Build description and get title
-        description = self._build_description_from_script(script, additional_description)
         title = script.youtube_title or script.title
 
+        # The metadata is never sent outside prod, so don't build it
+        if not self._is_prod:
+            return self._skipped_upload_result(title)
+
+        description = self._build_description_from_script(script, additional_description)
+
         return self.upload_from_url(
             video_url=video_url,
             title=title,
@@ -334,8 +716,101 @@ class UploadService:
             privacy_status=privacy_status,
             keep_local_file=keep_local_file,
             progress_callback=progress_callback,
+            download_progress_callback=download_progress_callback,
         )
 
+    def upload_many_from_urls(
+        self,
+        jobs: List[Tuple[str, VideoScript]],
+        max_concurrency: int = 3,
+        privacy_status: Optional[str] = None,
+    ) -> List[UploadResult]:
+        """
+        Download and upload several videos concurrently.
+
+        Each job runs upload_from_url_with_script on a worker thread. The
+        workers share this service's YouTube client, but each downloads with
+        its own HTTP session, since requests sessions are not thread-safe. Failed
+        jobs are retried with exponential backoff, except when YouTube reports
+        an exhausted quota, which will not clear within the retry window.
+
+        Args:
+            jobs: (video URL, VideoScript) pairs to upload.
+            max_concurrency: Maximum number of videos in flight at once.
+            privacy_status: Override default privacy status for every video.
+
+        Returns:
+            UploadResults in the same order as jobs.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+            YouTubeUploadError: If any job still fails after retries; details
+                list the failed URLs and the IDs of the videos that uploaded.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not jobs:
+            return []
+
+        if self._is_prod:
+            self._ensure_clients()
+
+        retrying = Retrying(
+            stop=stop_after_attempt(self.BATCH_UPLOAD_ATTEMPTS),
+            wait=wait_exponential(
+                multiplier=self.BATCH_RETRY_BASE_DELAY, max=self.BATCH_RETRY_MAX_DELAY
+            ),
+            retry=retry_if_exception(_is_retryable_upload_error),
+            reraise=True,
+        )
+
+        worker_sessions: List[requests.Session] = []
+
+        def upload(video_url: str, script: VideoScript) -> UploadResult:
+            if getattr(self._thread_state, "http_session", None) is None:
+                session = self._new_http_session()
+                worker_sessions.append(session)
+                self._thread_state.http_session = session
+            return retrying.copy()(
+                self.upload_from_url_with_script,
+                video_url=video_url,
+                script=script,
+                privacy_status=privacy_status,
+            )
+
+        results: List[Optional[UploadResult]] = [None] * len(jobs)
+        failures: List[Dict[str, str]] = []
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(jobs))) as executor:
+                futures = {
+                    executor.submit(upload, video_url, script): index
+                    for index, (video_url, script) in enumerate(jobs)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    video_url = jobs[index][0]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error("Batch upload failed for %s: %s", video_url, e)
+                        failures.append({"url": video_url, "error": str(e)})
+                    else:
+                        logger.info("Batch upload finished for %s", video_url)
+        finally:
+            for session in worker_sessions:
+                session.close()
+
+        uploaded = [result for result in results if result is not None]
+        if failures:
+            raise YouTubeUploadError(
+                f"{len(failures)} of {len(jobs)} uploads failed",
+                details={
+                    "failed": failures,
+                    "uploaded": [result.video_id for result in uploaded],
+                },
+            )
+        return uploaded
+
     def get_video_info(self, video_id: str) -> Dict[str, Any]:
         """
         Get information about an uploaded video.
@@ -382,8 +857,9 @@ class UploadService:
             return "Untitled Video"
 
         title = title.strip()
-        if len(title) > self.MAX_TITLE_LENGTH:
-            return title[: self.MAX_TITLE_LENGTH - 3] + "..."
+        # Module constants: cheaper than two class attribute lookups per call
+        if len(title) > _TITLE_LIMIT:
+            return title[:_TITLE_CUTOFF] + "..."
         return title
 
     def _format_description(self, description: str) -> str:
@@ -401,11 +877,42 @@ class UploadService:
         if not description:
             return ""
 
-        description = description.strip()
-        if len(description) > self.MAX_DESCRIPTION_LENGTH:
-            return description[: self.MAX_DESCRIPTION_LENGTH - 3] + "..."
+        return self._truncate_description(description.strip())
+
+    def _truncate_description(self, description: str) -> str:
+        """
+        Truncate an already-stripped description to YouTube's length limit.
+
+        Args:
+            description: Description without leading/trailing whitespace.
+
+        Returns:
+            Description within YouTube limits.
+        """
+        if len(description) > _DESC_LIMIT:
+            return description[:_DESC_CUTOFF] + "..."
         return description
 
+    def _skipped_upload_response(self, title: str) -> YouTubeUploadResponse:
+        """Return a placeholder response when uploads are disabled outside prod."""
+        logger.info(f"Skipping YouTube upload in {self.settings.env} mode")
+        return YouTubeUploadResponse(
+            video_id="test_video_id",
+            title=title,
+            url="https://youtube.com/watch?v=test_video_id",
+        )
+
+    def _skipped_upload_result(self, title: str) -> UploadResult:
+        """Return a placeholder result when uploads are disabled outside prod."""
+        logger.info(f"Skipping video download/upload in {self.settings.env} mode")
+        return UploadResult(
+            video_id="test_video_id",
+            title=title,
+            url="https://youtube.com/watch?v=test_video_id",
+            studio_url="https://studio.youtube.com/video/test_video_id/edit",
+            local_file_path=None,
+        )
+
     def _build_description_from_script(
         self,
         script: VideoScript,
@@ -421,43 +928,62 @@ class UploadService:
         Returns:
             Formatted description string.
         """
-        parts = []
+        # Flat fragments joined once. Sections are separated by a blank line and
+        # nothing is emitted before the first one, so the result never needs
+        # stripping (the script text itself is stripped by VideoScript).
+        parts: List[str] = []
 
         # Add source info if available
         if script.source_subreddit:
-            source_line = f"📍 Source: r/{script.source_subreddit}"
+            parts += ("📍 Source: r/", script.source_subreddit)
             if script.source_post_id:
-                source_line += f" (Post: {script.source_post_id})"
-            parts.append(source_line)
+                parts += (" (Post: ", script.source_post_id, ")")
+            parts.append("\n")
 
         # Add script summary (first 500 chars)
-        if script.script:
-            summary = script.script[:500]
-            if len(script.script) > 500:
-                summary += "..."
-            parts.append(f"\n{summary}")
+        text = script.script
+        if text:
+            if parts:
+                parts.append("\n")
+            parts.append(text[:500])
+            if len(text) > 500:
+                parts.append("...")
+            parts.append("\n")
 
         # Add user opinion if available
         if script.user_opinion:
-            parts.append(f"\n💬 Commentary: {script.user_opinion[:200]}")
+            if parts:
+                parts.append("\n")
+            parts += ("💬 Commentary: ", script.user_opinion[:200], "\n")
 
         # Add additional text
         if additional_text:
-            parts.append(f"\n{additional_text}")
+            if parts:
+                parts.append("\n")
+            parts += (additional_text, "\n")
 
         # Add generated info
-        parts.append("\n\n---")
-        parts.append("🤖 Generated with AI assistance")
+        if parts:
+            parts.append("\n\n")
+        parts.append("---\n🤖 Generated with AI assistance")
 
-        description = "\n".join(parts)
-        return self._format_description(description)
+        return self._truncate_description("".join(parts))
 
-    def _download_video(self, video_url: str) -> str:
+    def _download_video(
+        self,
+        video_url: str,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> str:
         """
         Download video from URL to temporary file.
 
+        Large files on servers that honour byte ranges are fetched over
+        several parallel connections; otherwise a single stream is used.
+
         Args:
             video_url: URL of video to download.
+            progress_callback: Optional callback receiving (bytes downloaded,
+                total bytes or None), called about once per MiB.
 
         Returns:
             Path to downloaded temporary file.
@@ -468,41 +994,213 @@ class UploadService:
         try:
             logger.info(f"Downloading video from: {video_url[:50]}...")
 
-            response = requests.get(video_url, stream=True, timeout=300)
-            response.raise_for_status()
-
             # Create temp file with .mp4 extension
             fd, temp_path = tempfile.mkstemp(suffix=".mp4")
             os.close(fd)
 
-            # Write video content
-            total_size = 0
-            with open(temp_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    total_size += len(chunk)
+            # Removed again if any step below fails
+            with _AtomicCleanup(temp_path) as cleanup:
+                # Ranged downloads write with pwrite; without it, skip the probe request
+                size = self._probe_range_support(video_url) if hasattr(os, "pwrite") else None
+                # One counter for both attempts, so a fallback never reports less
+                progress = _DownloadProgress(progress_callback, size) if progress_callback else None
+                if (
+                    size is None
+                    or size < self.PARALLEL_DOWNLOAD_MIN_SIZE
+                    or not self._download_ranges(video_url, temp_path, size, progress)
+                ):
+                    self._download_stream(video_url, temp_path, progress)
+
+                total_size = os.path.getsize(temp_path)
 
-            logger.info(f"Video downloaded: {total_size / (1024*1024):.2f} MB to {temp_path}")
-            return temp_path
+                logger.info("Video downloaded: %.2f MB to %s", total_size / (1 << 20), temp_path)
+                return cleanup.disarm()
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to download video: {e}")
-            raise YouTubeUploadError(f"Failed to download video from URL: {e}")
+            raise YouTubeUploadError(f"Failed to download video from URL: {e}") from e
         except Exception as e:
             logger.error(f"Error downloading video: {e}", exc_info=True)
-            raise YouTubeUploadError(f"Video download failed: {e}")
+            raise YouTubeUploadError(f"Video download failed: {e}") from e
 
-    def _cleanup_file(self, file_path: str) -> None:
+    def _download_stream(
+        self,
+        video_url: str,
+        temp_path: str,
+        progress: Optional[_DownloadProgress] = None,
+    ) -> None:
         """
-        Clean up a temporary file.
+        Download a video over a single connection into temp_path.
 
         Args:
-            file_path: Path to file to delete.
+            video_url: URL of video to download.
+            temp_path: File to write (truncated first).
+            progress: Optional download progress counter, restarted from zero.
+        """
+        with closing(
+            self.http_session.get(video_url, stream=True, timeout=self.DOWNLOAD_TIMEOUT)
+        ) as response:
+            response.raise_for_status()
+
+            # Write the raw stream straight to disk (decoding any
+            # Content-Encoding). read1 hands back whatever the socket buffer
+            # holds, up to the chunk size, instead of joining reads into a
+            # full chunk first.
+            response.raw.decode_content = True
+            read1 = response.raw.read1
+            with open(temp_path, "wb") as f:
+                total: Optional[int] = None
+                content_length = response.headers.get("Content-Length", "")
+                if content_length.isdigit() and "Content-Encoding" not in response.headers:
+                    total = int(content_length)
+                    self._preallocate(f.fileno(), total)
+
+                if progress is not None:
+                    progress.restart(total)
+                write = f.write
+                while chunk := read1(self.DOWNLOAD_CHUNK_SIZE):
+                    write(chunk)
+                    if progress is not None:
+                        progress.add(len(chunk))
+                if progress is not None:
+                    progress.finish()
+                # Drop any reserved space the body did not fill
+                f.truncate()
+
+    def _probe_range_support(self, video_url: str) -> Optional[int]:
+        """
+        Check whether the server serves byte ranges of the video.
+
+        Uses a one-byte ranged GET rather than HEAD, since presigned CDN URLs
+        are often only valid for GET.
+
+        Args:
+            video_url: URL of video to download.
+
+        Returns:
+            Total size in bytes if ranges are supported, otherwise None.
         """
         try:
-            path = Path(file_path)
-            if path.exists():
-                path.unlink()
-                logger.debug(f"Cleaned up temporary file: {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up file {file_path}: {e}")
+            with closing(
+                self.http_session.get(
+                    video_url,
+                    headers={"Range": "bytes=0-0"},
+                    stream=True,
+                    timeout=(self.DOWNLOAD_TIMEOUT[0], 30),
+                )
+            ) as response:
+                if response.status_code != 206:
+                    return None
+                if response.headers.get("Content-Encoding", "identity") != "identity":
+                    return None
+                content_range = response.headers.get("Content-Range", "")
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Range probe failed, using a single stream: {e}")
+            return None
+
+        # Content-Range: bytes 0-0/<total>
+        total = content_range.rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+
+    def _download_ranges(
+        self,
+        video_url: str,
+        temp_path: str,
+        size: int,
+        progress: Optional[_DownloadProgress] = None,
+    ) -> bool:
+        """
+        Download a video as parallel byte ranges written in place.
+
+        Args:
+            video_url: URL of video to download.
+            temp_path: File to write; sized to the full video up front.
+            size: Total video size in bytes.
+            progress: Optional download progress counter.
+
+        Returns:
+            True if every range was served, False if the server ignored a
+            Range header (the caller then falls back to a single stream).
+        """
+        part_size = -(-size // self.DOWNLOAD_WORKERS)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+        logger.debug(f"Downloading {size} bytes in {len(ranges)} parallel ranges")
+
+        fd = os.open(temp_path, os.O_WRONLY)
+        try:
+            self._preallocate(fd, size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                results = list(
+                    pool.map(
+                        lambda r: self._download_range(video_url, fd, r[0], r[1], progress),
+                        ranges,
+                    )
+                )
+        finally:
+            os.close(fd)
+
+        return all(results)
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        """
+        Reserve size bytes for a file so later writes do not grow it piecemeal.
+
+        Uses posix_fallocate where available (contiguous extents, fewer
+        metadata updates) and falls back to ftruncate.
+        """
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                return
+            except OSError as e:
+                # e.g. EOPNOTSUPP on filesystems without fallocate support
+                logger.debug(f"posix_fallocate unavailable, using ftruncate: {e}")
+        os.ftruncate(fd, size)
+
+    def _download_range(
+        self,
+        video_url: str,
+        fd: int,
+        start: int,
+        end: int,
+        progress: Optional[_DownloadProgress] = None,
+    ) -> bool:
+        """
+        Download bytes start..end (inclusive) of a video into fd at the same offset.
+
+        Runs on its own range thread, so it uses a session of its own that is
+        closed once the range is written.
+
+        Returns:
+            False if the server answered with the full body instead of the range.
+
+        Raises:
+            YouTubeUploadError: If the server sent fewer bytes than requested.
+        """
+        headers = {"Range": f"bytes={start}-{end}"}
+        with (
+            self._new_http_session() as session,
+            closing(
+                session.get(video_url, headers=headers, stream=True, timeout=self.DOWNLOAD_TIMEOUT)
+            ) as response,
+        ):
+            response.raise_for_status()
+            if response.status_code != 206:
+                return False
+
+            offset = start
+            response.raw.decode_content = True
+            read1 = response.raw.read1
+            while chunk := read1(self.DOWNLOAD_CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    view = view[written:]
+                    offset += written
+                if progress is not None:
+                    progress.add(len(chunk))
+
+        if offset != end + 1:
+            raise YouTubeUploadError(f"Incomplete download of bytes {start}-{end}")
+        return True
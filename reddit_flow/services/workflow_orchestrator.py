@@ -5,10 +5,16 @@ This module provides the WorkflowOrchestrator class that coordinates all service
 to transform Reddit content into YouTube videos.
 """
 
+import asyncio
+import hashlib
+import itertools
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from reddit_flow.config import get_logger
 from reddit_flow.exceptions import (
@@ -23,13 +29,42 @@ from reddit_flow.exceptions import (
     YouTubeUploadError,
 )
 from reddit_flow.models import LinkInfo, RedditPost, VideoScript
-from reddit_flow.services.content_service import ContentService
-from reddit_flow.services.media_service import MediaGenerationResult, MediaService
-from reddit_flow.services.script_service import ScriptService
-from reddit_flow.services.upload_service import UploadResult, UploadService
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: each service pulls in its API client SDKs
+    from reddit_flow.services.content_service import ContentService
+    from reddit_flow.services.media_service import MediaGenerationResult, MediaService
+    from reddit_flow.services.script_service import ScriptService
+    from reddit_flow.services.upload_service import UploadResult, UploadService
 
 logger = get_logger(__name__)
 
+# Marks the end of the work stream flowing through the process_batch queues
+_BATCH_DONE = object()
+
+
+async def fire_and_collect(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Run awaitables concurrently and return their results in order.
+
+    Every awaitable is scheduled as a task up front, so the total wait is the
+    slowest one rather than the sum. If one raises, the others are cancelled
+    and the exception propagates unchanged.
+
+    Args:
+        *aws: Coroutines or futures to run.
+
+    Returns:
+        List of results, in the same order as the arguments.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
 
 class WorkflowStatus(str, Enum):
     """Status of workflow execution."""
@@ -51,7 +86,40 @@ class WorkflowStep(str, Enum):
     UPLOAD_VIDEO = "upload_video"
 
 
-@dataclass
+# Progress message sent to update_callback when each step starts
+_STEP_MESSAGES: Dict[WorkflowStep, str] = {
+    WorkflowStep.PARSE_URL: "Step 1/5: Parsing Reddit URL...",
+    WorkflowStep.FETCH_CONTENT: "Step 2/5: Fetching Reddit content...",
+    WorkflowStep.GENERATE_SCRIPT: "Step 3/5: Generating AI script...",
+    WorkflowStep.GENERATE_MEDIA: "Step 4/5: Generating audio and video...",
+    WorkflowStep.UPLOAD_VIDEO: "Step 5/5: Uploading to YouTube...",
+}
+
+# Tags added to every upload, ahead of the post's subreddit
+_BASE_TAGS: Tuple[str, ...] = ("#Shorts", "Reddit")
+
+# Appended to the generated video description
+_SOURCE_DESCRIPTION = "\n\nSource: {}"
+
+# Errors raised by the workflow steps themselves (anything else is unexpected)
+_WORKFLOW_ERRORS = (
+    InvalidURLError,
+    RedditAPIError,
+    ContentError,
+    AIGenerationError,
+    TTSError,
+    VideoGenerationError,
+    MediaGenerationError,
+    YouTubeUploadError,
+)
+
+# Statuses after which a step or workflow records its completion time
+_TERMINAL_STATUSES: frozenset[WorkflowStatus] = frozenset(
+    {WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED}
+)
+
+
+@dataclass(slots=True)
 class StepResult:
     """
     Result of a single workflow step.
@@ -63,6 +131,8 @@ class StepResult:
         completed_at: When the step completed.
         data: Step output data.
         error: Error message if step failed.
+        started_ns: Monotonic clock reading when the step started.
+        completed_ns: Monotonic clock reading when the step completed.
     """
 
     step: WorkflowStep
@@ -71,9 +141,16 @@ class StepResult:
     completed_at: Optional[datetime] = None
     data: Any = None
     error: Optional[str] = None
+    started_ns: int = field(default_factory=time.monotonic_ns, repr=False)
+    completed_ns: Optional[int] = field(default=None, repr=False)
 
+    def mark_finished(self) -> None:
+        """Record the completion time."""
+        self.completed_ns = time.monotonic_ns()
+        self.completed_at = datetime.now()
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkflowResult:
     """
     Complete result of a workflow execution.
@@ -90,6 +167,8 @@ class WorkflowResult:
         media_result: Generated audio/video assets.
         upload_result: YouTube upload details.
         error: Error message if workflow failed.
+        started_ns: Monotonic clock reading when workflow started.
+        completed_ns: Monotonic clock reading when workflow completed.
     """
 
     workflow_id: str
@@ -100,9 +179,23 @@ class WorkflowResult:
     link_info: Optional[LinkInfo] = None
     post: Optional[RedditPost] = None
     script: Optional[VideoScript] = None
-    media_result: Optional[MediaGenerationResult] = None
-    upload_result: Optional[UploadResult] = None
+    media_result: Optional["MediaGenerationResult"] = None
+    upload_result: Optional["UploadResult"] = None
     error: Optional[str] = None
+    started_ns: int = field(default_factory=time.monotonic_ns, repr=False)
+    completed_ns: Optional[int] = field(default=None, repr=False)
+
+    def mark_finished(self) -> None:
+        """Record the completion time."""
+        self.completed_ns = time.monotonic_ns()
+        self.completed_at = datetime.now()
+
+    def get_step(self, step: WorkflowStep) -> Optional[StepResult]:
+        """Get the most recent result recorded for a step, or None if it never ran."""
+        for step_result in reversed(self.steps):
+            if step_result.step == step:
+                return step_result
+        return None
 
     @property
     def youtube_url(self) -> Optional[str]:
@@ -117,11 +210,78 @@ class WorkflowResult:
     @property
     def duration_seconds(self) -> Optional[float]:
         """Get total workflow duration in seconds."""
+        # The monotonic clock is immune to wall-clock adjustments
+        if self.completed_ns is not None:
+            return (self.completed_ns - self.started_ns) / 1e9
         if self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         return None
 
 
+class WorkflowCache:
+    """
+    In-memory cache for intermediate workflow artifacts.
+
+    Holds fetched posts, generated scripts and generated media so that
+    re-running a workflow for the same input skips the external calls.
+    Entries expire after ``ttl`` seconds and the least recently used entry
+    is evicted once ``max_entries`` is reached.
+
+    Subclass and override ``get``/``set`` to share artifacts between
+    processes (e.g. through Redis).
+
+    Example:
+        >>> orchestrator = WorkflowOrchestrator(cache=WorkflowCache(ttl=600))
+    """
+
+    DEFAULT_TTL = 3600.0
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize WorkflowCache.
+
+        Args:
+            ttl: Seconds an entry stays valid.
+            max_entries: Maximum number of entries kept.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> (expires_at, value), least recently used first
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
+
+
+# One pipeline step: takes the workflow result so far and returns it updated
+_Stage = Callable[[WorkflowResult], Awaitable[WorkflowResult]]
+
+
 class WorkflowOrchestrator:
     """
     Orchestrates the complete content generation workflow.
@@ -139,6 +299,7 @@ class WorkflowOrchestrator:
         script_service: Service for AI script generation.
         media_service: Service for audio/video generation.
         upload_service: Service for YouTube uploads.
+        cache: Optional cache for fetched posts, scripts and media.
 
     Example:
         >>> orchestrator = WorkflowOrchestrator()
@@ -151,10 +312,12 @@ class WorkflowOrchestrator:
 
     def __init__(
         self,
-        content_service: Optional[ContentService] = None,
-        script_service: Optional[ScriptService] = None,
-        media_service: Optional[MediaService] = None,
-        upload_service: Optional[UploadService] = None,
+        content_service: Optional["ContentService"] = None,
+        script_service: Optional["ScriptService"] = None,
+        media_service: Optional["MediaService"] = None,
+        upload_service: Optional["UploadService"] = None,
+        cache: Optional[WorkflowCache] = None,
+        eager_init: bool = False,
     ) -> None:
         """
         Initialize WorkflowOrchestrator.
@@ -164,47 +327,106 @@ class WorkflowOrchestrator:
             script_service: Optional ScriptService instance.
             media_service: Optional MediaService instance.
             upload_service: Optional UploadService instance.
+            cache: Optional WorkflowCache. When given, steps 2-4 reuse the
+                post, script and media of an earlier run with the same input.
+            eager_init: Create the services right away and warm up their
+                clients (see warmup). Inside a running event loop the client
+                warm-up is scheduled as a task, available as ``warmup_task``;
+                otherwise it completes before the constructor returns.
         """
         self._content_service = content_service
         self._script_service = script_service
         self._media_service = media_service
         self._upload_service = upload_service
-        self._workflow_counter = 0
+        self.cache = cache
+        # next() on a count is atomic, so concurrent workflows never share an ID
+        self._workflow_counter = itertools.count(1)
+        # (epoch second, formatted timestamp) last used in a workflow ID
+        self._id_timestamp: Tuple[int, str] = (-1, "")
+        self._warmup_task: Optional[asyncio.Task[None]] = None
+        if eager_init:
+            # Build the services here, on one thread: the lazy properties are
+            # unlocked, so the warm-up threads must only find them built
+            self._create_services()
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self.warmup())
+            else:
+                self._warmup_task = loop.create_task(self.warmup())
         logger.info("WorkflowOrchestrator initialized")
 
     @property
-    def content_service(self) -> ContentService:
+    def warmup_task(self) -> Optional["asyncio.Task[None]"]:
+        """Client warm-up scheduled by ``eager_init`` inside a running loop, if any."""
+        return self._warmup_task
+
+    def _create_services(self) -> None:
+        """Create every service not passed to the constructor; failures are only logged."""
+        for name in ("content_service", "script_service", "media_service", "upload_service"):
+            try:
+                getattr(self, name)
+            except Exception as e:
+                logger.debug(f"{name} could not be created: {e}")
+
+    @property
+    def content_service(self) -> "ContentService":
         """Lazy-load ContentService on first access."""
         if self._content_service is None:
+            from reddit_flow.services.content_service import ContentService
+
             self._content_service = ContentService()
         return self._content_service
 
     @property
-    def script_service(self) -> ScriptService:
+    def script_service(self) -> "ScriptService":
         """Lazy-load ScriptService on first access."""
         if self._script_service is None:
+            from reddit_flow.services.script_service import ScriptService
+
             self._script_service = ScriptService()
         return self._script_service
 
     @property
-    def media_service(self) -> MediaService:
+    def media_service(self) -> "MediaService":
         """Lazy-load MediaService on first access."""
         if self._media_service is None:
+            from reddit_flow.services.media_service import MediaService
+
             self._media_service = MediaService()
         return self._media_service
 
     @property
-    def upload_service(self) -> UploadService:
+    def upload_service(self) -> "UploadService":
         """Lazy-load UploadService on first access."""
         if self._upload_service is None:
+            from reddit_flow.services.upload_service import UploadService
+
             self._upload_service = UploadService()
         return self._upload_service
 
     def _generate_workflow_id(self) -> str:
         """Generate a unique workflow ID."""
-        self._workflow_counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"wf_{timestamp}_{self._workflow_counter:04d}"
+        number = next(self._workflow_counter)
+        # strftime is only needed once per wall-clock second
+        second = int(time.time())
+        if second != self._id_timestamp[0]:
+            self._id_timestamp = (second, datetime.fromtimestamp(second).strftime("%Y%m%d_%H%M%S"))
+        return f"wf_{self._id_timestamp[1]}_{number:04d}"
+
+    def _cache_key(self, step: WorkflowStep, *parts: Any) -> str:
+        """Build a cache key from a step and the inputs its output depends on."""
+        raw = "\0".join([step.value, *map(str, parts)])
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Any:
+        """Return a cached step output, or None when missing or caching is off."""
+        return None if self.cache is None else self.cache.get(key)
+
+    def _cache_set(self, key: str, value: Any) -> None:
+        """Store a step output when caching is on."""
+        if self.cache is not None:
+            self.cache.set(key, value)
 
     def _create_step_result(
         self,
@@ -220,8 +442,8 @@ class WorkflowOrchestrator:
             data=data,
             error=error,
         )
-        if status in (WorkflowStatus.COMPLETED, WorkflowStatus.FAILED):
-            result.completed_at = datetime.now()
+        if status in _TERMINAL_STATUSES:
+            result.mark_finished()
         return result
 
     async def process_reddit_url(
@@ -264,73 +486,89 @@ class WorkflowOrchestrator:
             VideoGenerationError: If video generation fails.
             YouTubeUploadError: If upload fails.
         """
-        workflow_id = self._generate_workflow_id()
-        result = WorkflowResult(workflow_id=workflow_id)
-        result.status = WorkflowStatus.IN_PROGRESS
-
-        logger.info(f"Starting workflow {workflow_id} for URL: {url[:50]}...")
-
-        try:
-            # Step 1: Parse Reddit URL
-            result = await self._execute_parse_url(result, url, update_callback)
+        result = WorkflowResult(workflow_id=self._generate_workflow_id())
+        logger.info(f"Starting workflow {result.workflow_id} for URL: {url[:50]}...")
+
+        return await self._run_pipeline(
+            result,
+            [
+                partial(self._execute_parse_url, url=url, update_callback=update_callback),
+                partial(
+                    self._execute_fetch_and_script,
+                    user_opinion=user_opinion,
+                    update_callback=update_callback,
+                ),
+                partial(
+                    self._execute_generate_media,
+                    avatar_id=avatar_id,
+                    test_mode=test_mode,
+                    update_callback=update_callback,
+                    timeout=timeout,
+                ),
+                partial(
+                    self._execute_upload_video,
+                    source_url=url,
+                    keep_local_file=keep_local_file,
+                    update_callback=update_callback,
+                ),
+            ],
+            update_callback,
+            success_message=lambda r: f"✅ Complete! Video uploaded: {r.youtube_url}",
+            wrap_unexpected=True,
+        )
 
-            # Step 2: Fetch content
-            result = await self._execute_fetch_content(result, update_callback)
+    async def _run_pipeline(
+        self,
+        result: WorkflowResult,
+        stages: List[_Stage],
+        update_callback: Optional[Callable[[str], Any]],
+        success_message: Callable[[WorkflowResult], Optional[str]],
+        wrap_unexpected: bool = False,
+    ) -> WorkflowResult:
+        """
+        Run workflow stages in order and record the overall outcome.
 
-            # Step 3: Generate script
-            result = await self._execute_generate_script(result, user_opinion, update_callback)
+        Args:
+            result: Workflow result to fill in.
+            stages: Steps to run; each receives and returns the result.
+            update_callback: Optional async callback for progress updates.
+            success_message: Builds the final progress message (None to skip).
+            wrap_unexpected: Re-raise errors outside the known workflow errors
+                as RedditFlowError instead of unchanged.
 
-            # Step 4: Generate media
-            result = await self._execute_generate_media(
-                result, avatar_id, test_mode, update_callback, timeout
-            )
+        Returns:
+            The completed WorkflowResult.
+        """
+        result.status = WorkflowStatus.IN_PROGRESS
 
-            # Step 5: Upload to YouTube
-            result = await self._execute_upload_video(result, url, keep_local_file, update_callback)
+        try:
+            for stage in stages:
+                result = await stage(result)
 
-            # Mark workflow as complete
             result.status = WorkflowStatus.COMPLETED
-            result.completed_at = datetime.now()
+            result.mark_finished()
 
-            logger.info(
-                f"Workflow {workflow_id} completed successfully. "
-                f"YouTube URL: {result.youtube_url}"
-            )
+            message = success_message(result)
+            logger.info(f"Workflow {result.workflow_id} completed: {message}")
 
-            if update_callback:
-                await update_callback(f"✅ Complete! Video uploaded: {result.youtube_url}")
-
-        except (
-            InvalidURLError,
-            RedditAPIError,
-            ContentError,
-            AIGenerationError,
-            TTSError,
-            VideoGenerationError,
-            MediaGenerationError,
-            YouTubeUploadError,
-        ) as e:
-            result.status = WorkflowStatus.FAILED
-            result.error = str(e)
-            result.completed_at = datetime.now()
-
-            logger.error(f"Workflow {workflow_id} failed: {e}")
-
-            if update_callback:
-                await update_callback(f"❌ Failed: {e}")
-
-            raise
+            if update_callback and message:
+                await update_callback(message)
 
         except Exception as e:
+            unexpected = wrap_unexpected and not isinstance(e, _WORKFLOW_ERRORS)
             result.status = WorkflowStatus.FAILED
-            result.error = f"Unexpected error: {e}"
-            result.completed_at = datetime.now()
+            result.error = f"Unexpected error: {e}" if unexpected else str(e)
+            result.mark_finished()
 
-            logger.error(f"Workflow {workflow_id} failed unexpectedly: {e}", exc_info=True)
+            if not unexpected:
+                logger.error(f"Workflow {result.workflow_id} failed: {e}")
+                if update_callback:
+                    await update_callback(f"❌ Failed: {e}")
+                raise
 
+            logger.error(f"Workflow {result.workflow_id} failed unexpectedly: {e}", exc_info=True)
             if update_callback:
                 await update_callback(f"❌ Unexpected error: {e}")
-
             raise RedditFlowError(f"Workflow failed unexpectedly: {e}") from e
 
         return result
@@ -344,10 +582,10 @@ class WorkflowOrchestrator:
         """Execute Step 1: Parse Reddit URL."""
         step = WorkflowStep.PARSE_URL
 
-        if update_callback:
-            await update_callback("Step 1/5: Parsing Reddit URL...")
+        if update_callback is not None:
+            await update_callback(_STEP_MESSAGES[step])
 
-        logger.debug(f"Step 1: Parsing URL - {url[:50]}...")
+        logger.debug("Step 1: Parsing URL - %.50s...", url)
 
         try:
             link_info = self.content_service.parse_reddit_url(url)
@@ -363,7 +601,7 @@ class WorkflowOrchestrator:
             )
             result.steps.append(step_result)
 
-            logger.info(f"Step 1 complete: r/{link_info.subreddit}, " f"post={link_info.post_id}")
+            logger.info("Step 1 complete: r/%s, post=%s", link_info.subreddit, link_info.post_id)
 
         except InvalidURLError as e:
             step_result = self._create_step_result(
@@ -384,20 +622,26 @@ class WorkflowOrchestrator:
         """Execute Step 2: Fetch Reddit content."""
         step = WorkflowStep.FETCH_CONTENT
 
-        if update_callback:
-            await update_callback("Step 2/5: Fetching Reddit content...")
+        if update_callback is not None:
+            await update_callback(_STEP_MESSAGES[step])
 
         link_info = result.link_info
         if link_info is None:
             raise RedditFlowError("Cannot fetch content: link_info is None")
 
-        logger.debug(f"Step 2: Fetching r/{link_info.subreddit}/{link_info.post_id}")
+        logger.debug("Step 2: Fetching r/%s/%s", link_info.subreddit, link_info.post_id)
+
+        cache_key = self._cache_key(step, link_info.subreddit, link_info.post_id)
 
         try:
-            post = self.content_service.get_post_content(
-                subreddit=link_info.subreddit,
-                post_id=link_info.post_id,
-            )
+            post = self._cache_get(cache_key)
+            cached = post is not None
+            if post is None:
+                post = self.content_service.get_post_content(
+                    subreddit=link_info.subreddit,
+                    post_id=link_info.post_id,
+                )
+                self._cache_set(cache_key, post)
             result.post = post
 
             step_result = self._create_step_result(
@@ -407,12 +651,13 @@ class WorkflowOrchestrator:
                     "title": post.title[:50] if post.title else "",
                     "comments_count": len(post.comments),
                     "author": post.author,
+                    "cached": cached,
                 },
             )
             result.steps.append(step_result)
 
             logger.info(
-                f"Step 2 complete: '{post.title[:30]}...' " f"with {len(post.comments)} comments"
+                "Step 2 complete: '%.30s...' with %d comments", post.title, len(post.comments)
             )
 
         except (ContentError, RedditAPIError) as e:
@@ -435,20 +680,26 @@ class WorkflowOrchestrator:
         """Execute Step 3: Generate video script."""
         step = WorkflowStep.GENERATE_SCRIPT
 
-        if update_callback:
-            await update_callback("Step 3/5: Generating AI script...")
+        if update_callback is not None:
+            await update_callback(_STEP_MESSAGES[step])
 
         post = result.post
         if post is None:
             raise RedditFlowError("Cannot generate script: post is None")
 
-        logger.debug(f"Step 3: Generating script for post '{post.id}'")
+        logger.debug("Step 3: Generating script for post '%s'", post.id)
+
+        cache_key = self._cache_key(step, post.id, user_opinion)
 
         try:
-            script = await self.script_service.generate_script(
-                post=post,
-                user_opinion=user_opinion,
-            )
+            script = self._cache_get(cache_key)
+            cached = script is not None
+            if script is None:
+                script = await self.script_service.generate_script(
+                    post=post,
+                    user_opinion=user_opinion,
+                )
+                self._cache_set(cache_key, script)
             result.script = script
 
             step_result = self._create_step_result(
@@ -457,12 +708,13 @@ class WorkflowOrchestrator:
                 data={
                     "title": script.title[:50] if script.title else "",
                     "word_count": script.word_count,
+                    "cached": cached,
                 },
             )
             result.steps.append(step_result)
 
             logger.info(
-                f"Step 3 complete: Script '{script.title[:30]}...' " f"({script.word_count} words)"
+                "Step 3 complete: Script '%.30s...' (%d words)", script.title, script.word_count
             )
 
         except AIGenerationError as e:
@@ -476,6 +728,43 @@ class WorkflowOrchestrator:
 
         return result
 
+    async def _execute_fetch_and_script(
+        self,
+        result: WorkflowResult,
+        user_opinion: Optional[str],
+        update_callback: Optional[Callable[[str], Any]],
+    ) -> WorkflowResult:
+        """
+        Execute Steps 2 and 3: Fetch Reddit content, then generate the script.
+
+        The media and upload clients are warmed up in the meantime.
+        """
+
+        async def fetch_and_script() -> WorkflowResult:
+            fetched = await self._execute_fetch_content(result, update_callback)
+            return await self._execute_generate_script(fetched, user_opinion, update_callback)
+
+        result, _ = await fire_and_collect(fetch_and_script(), self._prewarm_clients())
+        return result
+
+    async def _prewarm_clients(self) -> None:
+        """
+        Create the media and upload clients ahead of Steps 4 and 5.
+
+        Runs in a worker thread while the Reddit and Gemini calls are in flight.
+        Failures are only logged; the step that needs the client reports them.
+        """
+
+        def warm() -> None:
+            _ = self.media_service.elevenlabs_client
+            _ = self.media_service.heygen_client
+            _ = self.upload_service.youtube_client
+
+        try:
+            await asyncio.to_thread(warm)
+        except Exception as e:
+            logger.debug(f"Client pre-warming failed: {e}")
+
     async def _execute_generate_media(
         self,
         result: WorkflowResult,
@@ -487,24 +776,30 @@ class WorkflowOrchestrator:
         """Execute Step 4: Generate audio and video."""
         step = WorkflowStep.GENERATE_MEDIA
 
-        if update_callback:
-            await update_callback("Step 4/5: Generating audio and video...")
+        if update_callback is not None:
+            await update_callback(_STEP_MESSAGES[step])
 
         script = result.script
         if script is None:
             raise RedditFlowError("Cannot generate media: script is None")
 
-        logger.debug(f"Step 4: Generating media for script '{script.title[:30]}...'")
+        logger.debug("Step 4: Generating media for script '%.30s...'", script.title)
+
+        cache_key = self._cache_key(step, script.title, script.script, avatar_id, test_mode)
 
         try:
-            media_result = await self.media_service.generate_video_from_script(
-                script=script,
-                avatar_id=avatar_id,
-                test_mode=test_mode,
-                wait_for_completion=True,
-                update_callback=update_callback,
-                timeout=timeout,
-            )
+            media_result = self._cache_get(cache_key)
+            cached = media_result is not None
+            if media_result is None:
+                media_result = await self.media_service.generate_video_from_script(
+                    script=script,
+                    avatar_id=avatar_id,
+                    test_mode=test_mode,
+                    wait_for_completion=True,
+                    update_callback=update_callback,
+                    timeout=timeout,
+                )
+                self._cache_set(cache_key, media_result)
             result.media_result = media_result
 
             step_result = self._create_step_result(
@@ -514,12 +809,14 @@ class WorkflowOrchestrator:
                     "video_id": media_result.video_id,
                     "video_url": media_result.video_url,
                     "audio_size_bytes": len(media_result.audio_data),
+                    "cached": cached,
                 },
             )
             result.steps.append(step_result)
 
-            video_url_preview = media_result.video_url[:50] if media_result.video_url else "N/A"
-            logger.info(f"Step 4 complete: Video generated, URL={video_url_preview}...")
+            logger.info(
+                "Step 4 complete: Video generated, URL=%.50s...", media_result.video_url or "N/A"
+            )
 
         except (TTSError, VideoGenerationError, MediaGenerationError) as e:
             step_result = self._create_step_result(
@@ -529,6 +826,11 @@ class WorkflowOrchestrator:
             )
             result.steps.append(step_result)
             raise
+        except asyncio.CancelledError:
+            # MediaService has already asked HeyGen to drop the render
+            result.steps.append(self._create_step_result(step, WorkflowStatus.CANCELLED))
+            logger.warning("Step 4 cancelled")
+            raise
 
         return result
 
@@ -542,8 +844,8 @@ class WorkflowOrchestrator:
         """Execute Step 5: Upload video to YouTube."""
         step = WorkflowStep.UPLOAD_VIDEO
 
-        if update_callback:
-            await update_callback("Step 5/5: Uploading to YouTube...")
+        if update_callback is not None:
+            await update_callback(_STEP_MESSAGES[step])
 
         script = result.script
         media_result = result.media_result
@@ -559,14 +861,13 @@ class WorkflowOrchestrator:
         logger.debug("Step 5: Uploading video to YouTube")
 
         try:
-            # Add source URL to description
-            additional_description = f"\n\nSource: {source_url}"
-
-            upload_result = self.upload_service.upload_from_url_with_script(
+            # Download + upload are blocking I/O; keep the event loop responsive
+            upload_result = await asyncio.to_thread(
+                self.upload_service.upload_from_url_with_script,
                 video_url=media_result.video_url,
                 script=script,
-                additional_description=additional_description,
-                tags=["#Shorts", "Reddit", link_info.subreddit],
+                additional_description=_SOURCE_DESCRIPTION.format(source_url),
+                tags=[*_BASE_TAGS, link_info.subreddit],
                 keep_local_file=keep_local_file,
             )
             result.upload_result = upload_result
@@ -582,7 +883,7 @@ class WorkflowOrchestrator:
             )
             result.steps.append(step_result)
 
-            logger.info(f"Step 5 complete: Uploaded to YouTube - {upload_result.url}")
+            logger.info("Step 5 complete: Uploaded to YouTube - %s", upload_result.url)
 
         except YouTubeUploadError as e:
             step_result = self._create_step_result(
@@ -622,9 +923,7 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowResult with all outputs and status.
         """
-        workflow_id = self._generate_workflow_id()
-        result = WorkflowResult(workflow_id=workflow_id)
-        result.status = WorkflowStatus.IN_PROGRESS
+        result = WorkflowResult(workflow_id=self._generate_workflow_id())
         result.link_info = link_info
 
         # Add completed parse step
@@ -640,42 +939,132 @@ class WorkflowOrchestrator:
         )
 
         logger.info(
-            f"Starting workflow {workflow_id} from LinkInfo: "
+            f"Starting workflow {result.workflow_id} from LinkInfo: "
             f"r/{link_info.subreddit}/{link_info.post_id}"
         )
 
-        try:
-            # Steps 2-5 (skip URL parsing)
-            result = await self._execute_fetch_content(result, update_callback)
-            result = await self._execute_generate_script(result, user_opinion, update_callback)
-            result = await self._execute_generate_media(
-                result, avatar_id, test_mode, update_callback, timeout
-            )
-            result = await self._execute_upload_video(
-                result, link_info.link, keep_local_file, update_callback
-            )
-
-            result.status = WorkflowStatus.COMPLETED
-            result.completed_at = datetime.now()
+        # Steps 2-5 (skip URL parsing)
+        return await self._run_pipeline(
+            result,
+            [
+                partial(
+                    self._execute_fetch_and_script,
+                    user_opinion=user_opinion,
+                    update_callback=update_callback,
+                ),
+                partial(
+                    self._execute_generate_media,
+                    avatar_id=avatar_id,
+                    test_mode=test_mode,
+                    update_callback=update_callback,
+                    timeout=timeout,
+                ),
+                partial(
+                    self._execute_upload_video,
+                    source_url=link_info.link,
+                    keep_local_file=keep_local_file,
+                    update_callback=update_callback,
+                ),
+            ],
+            update_callback,
+            success_message=lambda r: f"✅ Complete! {r.youtube_url}",
+        )
 
-            logger.info(f"Workflow {workflow_id} completed: {result.youtube_url}")
+    async def process_batch(
+        self,
+        urls: List[str],
+        user_opinion: Optional[str] = None,
+        avatar_id: Optional[str] = None,
+        test_mode: bool = False,
+        keep_local_file: bool = False,
+        timeout: Optional[int] = None,
+        queue_size: int = 2,
+    ) -> List[WorkflowResult]:
+        """
+        Execute the complete workflow for several Reddit URLs as a pipeline.
 
-            if update_callback:
-                await update_callback(f"✅ Complete! {result.youtube_url}")
+        Each workflow step runs in its own worker, connected to the next one
+        by a bounded queue. While one workflow waits on HeyGen, the next can
+        be generating its script and a third fetching from Reddit.
 
-        except Exception as e:
-            result.status = WorkflowStatus.FAILED
-            result.error = str(e)
-            result.completed_at = datetime.now()
+        A failing workflow does not stop the batch: it is marked as failed
+        and skips the remaining steps.
 
-            logger.error(f"Workflow {workflow_id} failed: {e}")
+        Args:
+            urls: Reddit post URLs.
+            user_opinion: Optional user commentary to include in every script.
+            avatar_id: Optional HeyGen avatar ID override.
+            test_mode: Use HeyGen test mode (watermarked).
+            keep_local_file: Keep downloaded videos after upload.
+            timeout: Override video generation timeout.
+            queue_size: Maximum workflows waiting between two steps.
 
-            if update_callback:
-                await update_callback(f"❌ Failed: {e}")
+        Returns:
+            One WorkflowResult per URL, in input order.
+        """
+        results = [WorkflowResult(workflow_id=self._generate_workflow_id()) for _ in urls]
+        for result in results:
+            result.status = WorkflowStatus.IN_PROGRESS
+
+        logger.info(f"Starting batch of {len(urls)} workflows")
+
+        stages: List[Callable[[int, WorkflowResult], Awaitable[WorkflowResult]]] = [
+            lambda i, r: self._execute_parse_url(r, urls[i], None),
+            lambda i, r: self._execute_fetch_content(r, None),
+            lambda i, r: self._execute_generate_script(r, user_opinion, None),
+            lambda i, r: self._execute_generate_media(r, avatar_id, test_mode, None, timeout),
+            lambda i, r: self._execute_upload_video(r, urls[i], keep_local_file, None),
+        ]
+        queues: List[asyncio.Queue[Any]] = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+
+        async with asyncio.TaskGroup() as group:
+            for n, stage in enumerate(stages):
+                outbox = queues[n + 1] if n + 1 < len(queues) else None
+                group.create_task(self._run_batch_stage(stage, queues[n], outbox))
+
+            for item in enumerate(results):
+                await queues[0].put(item)
+            await queues[0].put(_BATCH_DONE)
+
+        for result in results:
+            if result.status != WorkflowStatus.FAILED:
+                result.status = WorkflowStatus.COMPLETED
+                result.mark_finished()
+
+        completed = sum(r.status == WorkflowStatus.COMPLETED for r in results)
+        logger.info(f"Batch finished: {completed}/{len(results)} workflows completed")
 
-            raise
+        return results
 
-        return result
+    async def _run_batch_stage(
+        self,
+        stage: Callable[[int, WorkflowResult], Awaitable[WorkflowResult]],
+        inbox: asyncio.Queue[Any],
+        outbox: Optional[asyncio.Queue[Any]],
+    ) -> None:
+        """Run one process_batch step for every workflow arriving on inbox."""
+        while True:
+            item = await inbox.get()
+            if item is not _BATCH_DONE:
+                index, result = item
+                if result.status != WorkflowStatus.FAILED:
+                    try:
+                        await stage(index, result)
+                    except RedditFlowError as e:
+                        self._fail_batch_workflow(result, str(e))
+                    except Exception as e:
+                        self._fail_batch_workflow(result, f"Unexpected error: {e}")
+            if outbox is not None:
+                await outbox.put(item)
+            if item is _BATCH_DONE:
+                return
+
+    def _fail_batch_workflow(self, result: WorkflowResult, error: str) -> None:
+        """Mark a process_batch workflow as failed so later steps skip it."""
+        result.status = WorkflowStatus.FAILED
+        result.error = error
+        result.mark_finished()
+        logger.error(f"Workflow {result.workflow_id} failed: {error}")
 
     async def generate_script_only(
         self,
@@ -696,86 +1085,87 @@ class WorkflowOrchestrator:
         Returns:
             WorkflowResult with post and script (no media/upload).
         """
-        workflow_id = self._generate_workflow_id()
-        result = WorkflowResult(workflow_id=workflow_id)
-        result.status = WorkflowStatus.IN_PROGRESS
-
-        logger.info(f"Starting script-only workflow {workflow_id}")
-
-        try:
-            result = await self._execute_parse_url(result, url, update_callback)
-            result = await self._execute_fetch_content(result, update_callback)
-            result = await self._execute_generate_script(result, user_opinion, update_callback)
-
-            result.status = WorkflowStatus.COMPLETED
-            result.completed_at = datetime.now()
-
-            script_title = result.script.title if result.script else "Unknown"
-            logger.info(
-                f"Script-only workflow {workflow_id} complete: " f"'{script_title[:30]}...'"
-            )
-
-            if update_callback and result.script:
-                await update_callback(f"✅ Script generated: {result.script.title}")
+        result = WorkflowResult(workflow_id=self._generate_workflow_id())
+        logger.info(f"Starting script-only workflow {result.workflow_id}")
+
+        return await self._run_pipeline(
+            result,
+            [
+                partial(self._execute_parse_url, url=url, update_callback=update_callback),
+                partial(self._execute_fetch_content, update_callback=update_callback),
+                partial(
+                    self._execute_generate_script,
+                    user_opinion=user_opinion,
+                    update_callback=update_callback,
+                ),
+            ],
+            update_callback,
+            success_message=lambda r: (
+                f"✅ Script generated: {r.script.title}" if r.script else None
+            ),
+        )
 
-        except Exception as e:
-            result.status = WorkflowStatus.FAILED
-            result.error = str(e)
-            result.completed_at = datetime.now()
+    async def _run_client_checks(self) -> Dict[str, Optional[Exception]]:
+        """
+        Create every service's API clients concurrently in worker threads.
 
-            logger.error(f"Script-only workflow {workflow_id} failed: {e}")
+        Returns:
+            Dictionary with service names and the exception raised while
+            creating their clients, or None on success.
+        """
+        checks: Dict[str, Callable[[], Any]] = {
+            # ContentService has Reddit client
+            "content_service": lambda: self.content_service.reddit_client,
+            # ScriptService has Gemini client
+            "script_service": lambda: self.script_service.gemini_client,
+            # MediaService has ElevenLabs and HeyGen clients
+            "media_service": lambda: (
+                self.media_service.elevenlabs_client,
+                self.media_service.heygen_client,
+            ),
+            # UploadService has YouTube client
+            "upload_service": lambda: self.upload_service.youtube_client,
+        }
+
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(check) for check in checks.values()),
+            return_exceptions=True,
+        )
 
-            if update_callback:
-                await update_callback(f"❌ Failed: {e}")
+        return {
+            name: outcome if isinstance(outcome, Exception) else None
+            for name, outcome in zip(checks, outcomes)
+        }
 
-            raise
+    async def warmup(self) -> None:
+        """
+        Create all service clients ahead of the first workflow.
 
-        return result
+        Client setup (credentials, SDK configuration, HTTP sessions) then no
+        longer delays the first workflow's steps. Failures are only logged;
+        the step that needs the client reports them.
+        """
+        for name, error in (await self._run_client_checks()).items():
+            if error is not None:
+                logger.debug(f"{name} warm-up failed: {error}")
+        logger.info("Service clients warmed up")
 
-    def verify_services(self) -> Dict[str, bool]:
+    async def verify_services(self) -> Dict[str, bool]:
         """
         Verify all services are accessible.
 
         Performs a basic check to ensure all service dependencies
-        are properly configured.
+        are properly configured. The checks are independent, so they run
+        concurrently in worker threads.
 
         Returns:
             Dictionary with service names and verification status.
         """
         results = {}
-
-        try:
-            # Check ContentService has Reddit client
-            _ = self.content_service.reddit_client
-            results["content_service"] = True
-        except Exception as e:
-            logger.warning(f"ContentService verification failed: {e}")
-            results["content_service"] = False
-
-        try:
-            # Check ScriptService has Gemini client
-            _ = self.script_service.gemini_client
-            results["script_service"] = True
-        except Exception as e:
-            logger.warning(f"ScriptService verification failed: {e}")
-            results["script_service"] = False
-
-        try:
-            # Check MediaService has ElevenLabs and HeyGen clients
-            _ = self.media_service.elevenlabs_client
-            _ = self.media_service.heygen_client
-            results["media_service"] = True
-        except Exception as e:
-            logger.warning(f"MediaService verification failed: {e}")
-            results["media_service"] = False
-
-        try:
-            # Check UploadService has YouTube client
-            _ = self.upload_service.youtube_client
-            results["upload_service"] = True
-        except Exception as e:
-            logger.warning(f"UploadService verification failed: {e}")
-            results["upload_service"] = False
+        for name, error in (await self._run_client_checks()).items():
+            if error is not None:
+                logger.warning(f"{name} verification failed: {error}")
+            results[name] = error is None
 
         all_ok = all(results.values())
         logger.info(
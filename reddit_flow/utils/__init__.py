@@ -22,7 +22,9 @@ from reddit_flow.utils.retry import (
     RetryConfig,
     TimeoutConfig,
     TimeoutError,
+    cached_retry,
     log_retry_attempt,
+    resilient,
     timeout_decorator,
     with_retry,
     with_retry_sync,
@@ -64,6 +66,7 @@ __all__ = [
     "API_RETRY_CONFIG",
     "with_retry",
     "with_retry_sync",
+    "cached_retry",
     "log_retry_attempt",
     # Circuit Breaker
     "CircuitBreaker",
@@ -79,4 +82,6 @@ __all__ = [
     "with_timeout",
     "with_timeout_async",
     "timeout_decorator",
+    # Combined
+    "resilient",
 ]
@@ -33,13 +33,17 @@ Example usage:
 """
 
 import asyncio
+import concurrent.futures
 import functools
 import logging
+import queue
 import threading
+import time
+import types
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Optional, Set, Type, TypeVar, Union
+from typing import AbstractSet, Any, Callable, Hashable, Optional, Type, TypeVar, Union
 
 from tenacity import (
     RetryCallState,
@@ -48,6 +52,7 @@ from tenacity import (
     stop_after_attempt,
     stop_after_delay,
     wait_exponential,
+    wait_random_exponential,
 )
 
 from reddit_flow.exceptions import APIError, RedditFlowError, RetryableError, TransientAPIError
@@ -63,7 +68,7 @@ F = TypeVar("F", bound=Callable[..., Any])
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """
     Configuration for retry behavior.
@@ -73,7 +78,8 @@ class RetryConfig:
         base_delay: Base delay between retries in seconds.
         max_delay: Maximum delay between retries in seconds.
         exponential_base: Base for exponential backoff (default: 2).
-        jitter: Whether to add random jitter to delays.
+        jitter: Whether to randomize delays ("full jitter": each delay is drawn
+            uniformly between 0 and the exponential backoff).
         retry_on: Exception types to retry on.
         stop_after_seconds: Optional total time limit for all retries.
     """
@@ -102,6 +108,19 @@ class RetryConfig:
         if self.max_delay < self.base_delay:
             raise ValueError("max_delay must be >= base_delay")
 
+    def _as_key(self) -> tuple:
+        """Return a hashable snapshot of the fields that shape the retry policy."""
+        retry_on = self.retry_on if isinstance(self.retry_on, type) else tuple(self.retry_on)
+        return (
+            self.max_attempts,
+            self.base_delay,
+            self.max_delay,
+            self.exponential_base,
+            self.jitter,
+            retry_on,
+            self.stop_after_seconds,
+        )
+
 
 # Default configurations for different scenarios
 DEFAULT_RETRY_CONFIG = RetryConfig()
@@ -172,41 +191,67 @@ def with_retry(
     if config is None:
         config = DEFAULT_RETRY_CONFIG
 
-    def decorator(func: F) -> F:
-        """Apply retry logic to the decorated function."""
-        # Build stop condition
-        stop_conditions: list[Union[stop_after_attempt, stop_after_delay]] = [
-            stop_after_attempt(config.max_attempts)
-        ]
-        if config.stop_after_seconds:
-            stop_conditions.append(stop_after_delay(config.stop_after_seconds))
-
-        # Build wait strategy
-        wait_strategy = wait_exponential(
-            multiplier=config.base_delay,
-            max=config.max_delay,
-            exp_base=config.exponential_base,
-        )
+    return _build_retry_decorator(config._as_key(), on_retry or log_retry_attempt)
 
-        # Build retry condition
-        retry_condition = retry_if_exception_type(config.retry_on)
-
-        # Create the retry decorator
-        retry_decorator = retry(
-            stop=(
-                stop_conditions[0]
-                if len(stop_conditions) == 1
-                else stop_conditions[0] | stop_conditions[1]
-            ),
-            wait=wait_strategy,
-            retry=retry_condition,
-            before_sleep=on_retry or log_retry_attempt,
-            reraise=True,
-        )
 
-        return retry_decorator(func)
+@functools.lru_cache(maxsize=256)
+def _build_retry_decorator(
+    config_key: tuple,
+    on_retry: Callable[[RetryCallState], None],
+) -> Callable[[F], F]:
+    """
+    Build the tenacity decorator for a retry policy, memoized per policy.
 
-    return decorator
+    The stop, wait and retry strategies are stateless, so one decorator can be
+    shared by every function using the same policy.
+
+    Args:
+        config_key: Result of RetryConfig._as_key().
+        on_retry: Callback called on each retry attempt.
+
+    Returns:
+        Decorator applying the retry policy.
+    """
+    (
+        max_attempts,
+        base_delay,
+        max_delay,
+        exponential_base,
+        jitter,
+        retry_on,
+        stop_after_seconds,
+    ) = config_key
+
+    # Build stop condition
+    stop_conditions: list[Union[stop_after_attempt, stop_after_delay]] = [
+        stop_after_attempt(max_attempts)
+    ]
+    if stop_after_seconds:
+        stop_conditions.append(stop_after_delay(stop_after_seconds))
+
+    # Build wait strategy; full jitter spreads out clients retrying in lockstep
+    wait_cls = wait_random_exponential if jitter else wait_exponential
+    wait_strategy = wait_cls(
+        multiplier=base_delay,
+        max=max_delay,
+        exp_base=exponential_base,
+    )
+
+    # Build retry condition
+    retry_condition = retry_if_exception_type(retry_on)
+
+    # Create the retry decorator
+    return retry(
+        stop=(
+            stop_conditions[0]
+            if len(stop_conditions) == 1
+            else stop_conditions[0] | stop_conditions[1]
+        ),
+        wait=wait_strategy,
+        retry=retry_condition,
+        before_sleep=on_retry,
+        reraise=True,
+    )
 
 
 def with_retry_sync(
@@ -230,10 +275,147 @@ def with_retry_sync(
     Example:
         result = with_retry_sync(api_call, config=AGGRESSIVE_RETRY_CONFIG, url="...")
     """
-    decorated = with_retry(config)(func)
+    # A bound method shares the wrapper of its function; the instance is passed
+    # per call, so the cache never keeps it alive
+    target = getattr(func, "__func__", func)
+    if not _is_long_lived_function(target):
+        # Closures and lambdas are usually new objects on every call: caching
+        # them would only churn the cache and keep them alive
+        return with_retry(config)(func)(*args, **kwargs)
+
+    decorated = _sync_retry_wrapper(target, (config or DEFAULT_RETRY_CONFIG)._as_key())
+    if target is not func:
+        return decorated(getattr(func, "__self__"), *args, **kwargs)
     return decorated(*args, **kwargs)
 
 
+def _is_long_lived_function(func: Any) -> bool:
+    """Return True for plain functions defined at module or class level."""
+    return (
+        isinstance(func, types.FunctionType)
+        and func.__name__ != "<lambda>"
+        and "<locals>" not in func.__qualname__
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _sync_retry_wrapper(func: Callable[..., T], config_key: tuple) -> Callable[..., T]:
+    """
+    Return func wrapped with a retry policy, reused across with_retry_sync calls.
+
+    Only called with module- or class-level functions, which live as long as
+    their module anyway, so the strong references held here cost nothing.
+    """
+    return _build_retry_decorator(config_key, log_retry_attempt)(func)
+
+
+def cached_retry(
+    config: Optional[RetryConfig] = None,
+    cache_ttl: float = 300.0,
+    key_fn: Optional[Callable[..., Hashable]] = None,
+    cache_failures: bool = False,
+    failure_ttl: Optional[float] = None,
+    max_entries: int = 256,
+) -> Callable[[F], F]:
+    """
+    Decorator that caches results in front of retry logic.
+
+    A cache hit returns the stored value without calling the function or
+    going through retries. On a miss the call runs with ``with_retry(config)``
+    and its result is cached for ``cache_ttl`` seconds. Only for synchronous
+    functions.
+
+    Args:
+        config: Retry configuration. Uses DEFAULT_RETRY_CONFIG if not provided.
+        cache_ttl: Seconds a successful result stays cached.
+        key_fn: Builds the cache key from the call arguments. Defaults to the
+            positional and keyword arguments; calls with unhashable arguments
+            are not cached.
+        cache_failures: Also cache the exception raised once retries are
+            exhausted, so a failing call is not retried again right away.
+        failure_ttl: Seconds a failure stays cached (defaults to cache_ttl).
+        max_entries: Maximum number of cached calls; least recently used
+            entries are evicted first.
+
+    Returns:
+        Decorated function with a ``cache_clear()`` method.
+
+    Example:
+        @cached_retry(API_RETRY_CONFIG, cache_ttl=600)
+        def get_voice(voice_id: str):
+            ...
+    """
+    if failure_ttl is None:
+        failure_ttl = cache_ttl
+
+    def decorator(func: F) -> F:
+        """Apply caching and retry logic to the decorated function."""
+        retried = with_retry(config)(func)
+        # key -> (expires_at, failed, value or (exception, traceback))
+        entries: OrderedDict[Hashable, tuple[float, bool, Any]] = OrderedDict()
+        lock = threading.Lock()
+
+        def make_key(args: tuple, kwargs: dict[str, Any]) -> Optional[Hashable]:
+            """Build the cache key, or None if the arguments cannot be hashed."""
+            key = key_fn(*args, **kwargs) if key_fn else (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return None
+            return key
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Return the cached result or call through the retry logic."""
+            key = make_key(args, kwargs)
+            if key is None:
+                return retried(*args, **kwargs)
+
+            with lock:
+                entry = entries.get(key)
+                if entry is not None:
+                    if time.monotonic() < entry[0]:
+                        entries.move_to_end(key)
+                    else:
+                        del entries[key]
+                        entry = None
+
+            if entry is not None:
+                _, failed, value = entry
+                if failed:
+                    exception, traceback = value
+                    # Restore the original traceback so it does not grow per hit
+                    raise exception.with_traceback(traceback)
+                return value
+
+            try:
+                result = retried(*args, **kwargs)
+            except Exception as e:
+                if cache_failures:
+                    store(key, failure_ttl, True, (e, e.__traceback__))
+                raise
+            store(key, cache_ttl, False, result)
+            return result
+
+        def store(key: Hashable, ttl: float, failed: bool, value: Any) -> None:
+            """Cache a call outcome, evicting the least recently used entry when full."""
+            with lock:
+                entries[key] = (time.monotonic() + ttl, failed, value)
+                entries.move_to_end(key)
+                while len(entries) > max_entries:
+                    entries.popitem(last=False)
+
+        def cache_clear() -> None:
+            """Remove all cached results."""
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore
+
+    return decorator
+
+
 # =============================================================================
 # Circuit Breaker Pattern
 # =============================================================================
@@ -247,7 +429,7 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CircuitBreakerConfig:
     """
     Configuration for circuit breaker behavior.
@@ -256,13 +438,18 @@ class CircuitBreakerConfig:
         failure_threshold: Number of failures before opening circuit.
         success_threshold: Successes needed in half-open to close.
         timeout_seconds: How long circuit stays open before half-open.
-        excluded_exceptions: Exceptions that don't count as failures.
+        excluded_exceptions: Exceptions that don't count as failures (stored
+            as a frozenset).
     """
 
     failure_threshold: int = 5
     success_threshold: int = 2
     timeout_seconds: float = 60.0
-    excluded_exceptions: Set[Type[Exception]] = field(default_factory=set)
+    excluded_exceptions: AbstractSet[Type[Exception]] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        """Freeze the excluded exception types."""
+        object.__setattr__(self, "excluded_exceptions", frozenset(self.excluded_exceptions))
 
 
 class CircuitBreaker:
@@ -271,7 +458,7 @@ class CircuitBreaker:
 
     When a service fails repeatedly, the circuit "opens" and immediately
     rejects requests for a timeout period. After the timeout, it enters
-    "half-open" state and allows test requests through.
+    "half-open" state and lets one test request through at a time.
 
     Example:
         breaker = CircuitBreaker("heygen_api")
@@ -289,89 +476,162 @@ class CircuitBreaker:
     _breakers: dict[str, "CircuitBreaker"] = {}
     _lock = threading.Lock()
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         name: str,
         config: Optional[CircuitBreakerConfig] = None,
-    ):
+    ) -> "CircuitBreaker":
         """
-        Initialize circuit breaker.
+        Get the circuit breaker for a name, creating it on first use.
+
+        Breakers are shared per name, so every caller guarding the same
+        service sees the same state. When a breaker with this name already
+        exists it is returned unchanged and ``config`` is ignored.
 
         Args:
             name: Unique identifier for this circuit.
             config: Circuit breaker configuration.
         """
+        with cls._lock:
+            breaker = cls._breakers.get(name)
+            if breaker is None:
+                breaker = super().__new__(cls)
+                # Set up before registering so get() never sees a partial breaker
+                breaker._setup(name, config)
+                cls._breakers[name] = breaker
+            return breaker
+
+    def _setup(self, name: str, config: Optional[CircuitBreakerConfig]) -> None:
+        """Initialize the state of a newly created breaker."""
         self.name = name
         self.config = config or CircuitBreakerConfig()
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
-        self._last_failure_time: Optional[datetime] = None
+        # time.monotonic() reading, immune to wall-clock adjustments
+        self._last_failure_time: Optional[float] = None
+        # Set while a half-open test request is running, so only one goes through
+        self._probe_in_flight = False
+        # Guards state changes only; no I/O or logging happens while it is held
         self._state_lock = threading.Lock()
 
-        # Register globally
-        with CircuitBreaker._lock:
-            CircuitBreaker._breakers[name] = self
-
     @property
     def state(self) -> CircuitState:
         """Get current circuit state, checking for timeout transitions."""
+        # Attribute reads are atomic; only an open circuit can change state here
+        state = self._state
+        if state is not CircuitState.OPEN:
+            return state
+
         with self._state_lock:
-            if self._state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self._state = CircuitState.HALF_OPEN
-                    logger.info("Circuit '%s' entering half-open state", self.name)
-            return self._state
+            entered_half_open = self._state is CircuitState.OPEN and self._should_attempt_reset()
+            if entered_half_open:
+                self._state = CircuitState.HALF_OPEN
+                self._probe_in_flight = False
+            state = self._state
+
+        if entered_half_open:
+            logger.info("Circuit '%s' entering half-open state", self.name)
+        return state
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to try resetting."""
         if self._last_failure_time is None:
             return True
-        elapsed = datetime.now() - self._last_failure_time
-        return elapsed >= timedelta(seconds=self.config.timeout_seconds)
+        elapsed = time.monotonic() - self._last_failure_time
+        return elapsed >= self.config.timeout_seconds
 
     def record_success(self) -> None:
         """Record a successful operation."""
+        # Steady state: closed with nothing to reset, so skip the lock
+        if self._state is CircuitState.CLOSED and self._failure_count == 0:
+            return
+
+        closed = False
         with self._state_lock:
             if self._state == CircuitState.HALF_OPEN:
+                self._probe_in_flight = False
                 self._success_count += 1
                 if self._success_count >= self.config.success_threshold:
                     self._state = CircuitState.CLOSED
                     self._failure_count = 0
                     self._success_count = 0
-                    logger.info("Circuit '%s' closed after successful recovery", self.name)
+                    closed = True
             elif self._state == CircuitState.CLOSED:
                 # Reset failure count on success in closed state
                 self._failure_count = 0
 
+        if closed:
+            logger.info("Circuit '%s' closed after successful recovery", self.name)
+
     def record_failure(self, exception: Exception) -> None:
         """Record a failed operation."""
-        # Check if this exception type should be excluded
-        if type(exception) in self.config.excluded_exceptions:
+        # Check if this exception type should be excluded (usually none are)
+        excluded = self.config.excluded_exceptions
+        if excluded and exception.__class__ in excluded:
+            # Neither a success nor a failure, but the test request is over
+            self._probe_in_flight = False
             return
 
+        reopened = opened = False
         with self._state_lock:
             self._failure_count += 1
-            self._last_failure_time = datetime.now()
+            self._last_failure_time = time.monotonic()
+            failure_count = self._failure_count
 
             if self._state == CircuitState.HALF_OPEN:
                 # Any failure in half-open reopens the circuit
                 self._state = CircuitState.OPEN
                 self._success_count = 0
-                logger.warning("Circuit '%s' reopened after failure in half-open state", self.name)
+                self._probe_in_flight = False
+                reopened = True
             elif self._state == CircuitState.CLOSED:
-                if self._failure_count >= self.config.failure_threshold:
+                if failure_count >= self.config.failure_threshold:
                     self._state = CircuitState.OPEN
-                    logger.warning(
-                        "Circuit '%s' opened after %d failures",
-                        self.name,
-                        self._failure_count,
-                    )
+                    opened = True
+
+        if reopened:
+            logger.warning("Circuit '%s' reopened after failure in half-open state", self.name)
+        elif opened:
+            logger.warning("Circuit '%s' opened after %d failures", self.name, failure_count)
 
     def is_available(self) -> bool:
         """Check if requests should be allowed through."""
+        # Healthy circuit: skip the state property entirely
+        if self._state is CircuitState.CLOSED:
+            return True
         state = self.state  # This may trigger state transition
-        return state in (CircuitState.CLOSED, CircuitState.HALF_OPEN)
+        if state is CircuitState.HALF_OPEN:
+            return not self._probe_in_flight
+        return state is CircuitState.CLOSED
+
+    def _acquire(self) -> None:
+        """
+        Admit a request, claiming the half-open test slot when needed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a test
+                request already running.
+        """
+        if self._state is CircuitState.CLOSED:
+            return
+
+        state = self.state  # This may trigger state transition
+        if state is CircuitState.CLOSED:
+            return
+
+        if state is CircuitState.HALF_OPEN:
+            with self._state_lock:
+                admitted = self._state is CircuitState.HALF_OPEN and not self._probe_in_flight
+                if admitted:
+                    self._probe_in_flight = True
+            if admitted:
+                return
+
+        raise CircuitOpenError(
+            f"Circuit '{self.name}' is open",
+            details={"circuit": self.name, "state": self._state.value},
+        )
 
     def reset(self) -> None:
         """Manually reset the circuit breaker to closed state."""
@@ -380,7 +640,8 @@ class CircuitBreaker:
             self._failure_count = 0
             self._success_count = 0
             self._last_failure_time = None
-            logger.info("Circuit '%s' manually reset", self.name)
+            self._probe_in_flight = False
+        logger.info("Circuit '%s' manually reset", self.name)
 
     def __call__(self, func: F) -> F:
         """Use circuit breaker as a decorator."""
@@ -407,11 +668,7 @@ class CircuitBreaker:
         Raises:
             CircuitOpenError: If circuit is open.
         """
-        if not self.is_available():
-            raise CircuitOpenError(
-                f"Circuit '{self.name}' is open",
-                details={"circuit": self.name, "state": self._state.value},
-            )
+        self._acquire()
 
         try:
             result = func(*args, **kwargs)
@@ -420,14 +677,14 @@ class CircuitBreaker:
         except Exception as e:
             self.record_failure(e)
             raise
+        except BaseException:
+            # Interrupted (e.g. KeyboardInterrupt): free the test slot
+            self._probe_in_flight = False
+            raise
 
     def __enter__(self) -> "CircuitBreaker":
         """Context manager entry."""
-        if not self.is_available():
-            raise CircuitOpenError(
-                f"Circuit '{self.name}' is open",
-                details={"circuit": self.name, "state": self._state.value},
-            )
+        self._acquire()
         return self
 
     def __exit__(
@@ -441,6 +698,9 @@ class CircuitBreaker:
             self.record_success()
         elif isinstance(exc_val, Exception):
             self.record_failure(exc_val)
+        else:
+            # Interrupted (e.g. KeyboardInterrupt): free the test slot
+            self._probe_in_flight = False
         # Don't suppress exceptions (implicitly returns None)
 
     @classmethod
@@ -465,7 +725,7 @@ class CircuitOpenError(RedditFlowError):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimeoutConfig:
     """
     Configuration for timeout behavior.
@@ -502,6 +762,67 @@ FAST_TIMEOUT_CONFIG = TimeoutConfig(
 )
 
 
+class _DaemonThreadPool:
+    """
+    Minimal bounded thread pool whose workers are daemon threads.
+
+    ThreadPoolExecutor joins its workers at interpreter exit, so a single call
+    hung past its timeout would keep the process from exiting.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        """Create the pool; worker threads are started on demand."""
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work: queue.SimpleQueue[tuple[concurrent.futures.Future[Any], Callable[[], Any]]] = (
+            queue.SimpleQueue()
+        )
+        # Released by a worker each time it finishes a call and waits for more
+        self._idle = threading.Semaphore(0)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[T]:
+        """Schedule func(*args, **kwargs) and return a Future for its result."""
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        self._work.put((future, functools.partial(func, *args, **kwargs)))
+
+        # Start a worker only if none is idle and the pool has room
+        if not self._idle.acquire(blocking=False):
+            with self._lock:
+                if len(self._threads) < self._max_workers:
+                    thread = threading.Thread(
+                        target=self._run,
+                        name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                        daemon=True,
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+        return future
+
+    def _run(self) -> None:
+        """Run queued calls forever (worker thread body)."""
+        while True:
+            future, call = self._work.get()
+            # False if the call was cancelled while still queued
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = call()
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del future, call
+            self._idle.release()
+
+
+# Shared worker threads for with_timeout. Bounding the pool stops calls that
+# hang past their timeout from piling up new threads during an outage.
+_TIMEOUT_POOL = _DaemonThreadPool(max_workers=16, thread_name_prefix="rf-timeout")
+
+
 class TimeoutError(RedditFlowError):
     """Raised when an operation times out."""
 
@@ -540,37 +861,25 @@ def with_timeout(
         TimeoutError: If execution exceeds timeout.
 
     Note:
-        This uses threading and may not interrupt all blocking operations.
-        For true cancellation, use async functions with asyncio.wait_for.
+        The call runs on a shared worker pool, so time spent waiting for a free
+        worker counts towards the timeout. A call that times out keeps running
+        in the background and cannot be interrupted; for true cancellation, use
+        async functions with asyncio.wait_for.
     """
-    result: Any = None
-    exception: Optional[Exception] = None
-    completed = threading.Event()
-
-    def target():
-        """Execute function in thread and capture result."""
-        nonlocal result, exception
-        try:
-            result = func(*args, **kwargs)
-        except Exception as e:
-            exception = e
-        finally:
-            completed.set()
-
-    thread = threading.Thread(target=target, daemon=True)
-    thread.start()
-
-    if not completed.wait(timeout):
+    future = _TIMEOUT_POOL.submit(func, *args, **kwargs)
+    # wait() rather than result(timeout): a TimeoutError raised by func itself
+    # must propagate unchanged, not be mistaken for this timeout
+    done, _ = concurrent.futures.wait((future,), timeout)
+    if not done:
+        # Drop the call if it is still queued; a running call cannot be stopped
+        future.cancel()
         raise TimeoutError(
             f"Operation timed out after {timeout} seconds",
             timeout=timeout,
             details={"function": func.__name__},
         )
 
-    if exception:
-        raise exception
-
-    return result
+    return future.result()
 
 
 async def with_timeout_async(
@@ -590,9 +899,15 @@ async def with_timeout_async(
     Raises:
         TimeoutError: If execution exceeds timeout.
     """
+    # Cancels the awaiting task in place; wait_for would wrap coro in a new Task
+    deadline = asyncio.timeout(timeout)
     try:
-        return await asyncio.wait_for(coro, timeout=timeout)
+        async with deadline:
+            return await coro
     except asyncio.TimeoutError:
+        if not deadline.expired():
+            # Raised by coro itself, not by our deadline
+            raise
         raise TimeoutError(
             f"Async operation timed out after {timeout} seconds",
             timeout=timeout,
@@ -635,3 +950,60 @@ def timeout_decorator(
         return wrapper  # type: ignore
 
     return decorator
+
+
+# =============================================================================
+# Combined Resilience
+# =============================================================================
+
+
+def resilient(
+    *,
+    timeout: Optional[float] = None,
+    retry: Optional[RetryConfig] = None,
+    breaker: Optional[CircuitBreaker] = None,
+) -> Callable[[F], F]:
+    """
+    Decorator combining timeout, retry and circuit breaker in one wrapper.
+
+    Each attempt goes through the circuit breaker and, when ``timeout`` is
+    set, runs under ``with_timeout``; failed attempts are retried according
+    to ``retry``. An open circuit raises CircuitOpenError straight away and is
+    not retried unless CircuitOpenError is in ``retry.retry_on``. Only for
+    synchronous functions.
+
+    Args:
+        timeout: Per-attempt timeout in seconds.
+        retry: Retry configuration; no retries if not provided.
+        breaker: Circuit breaker guarding every attempt.
+
+    Returns:
+        Decorated function.
+
+    Example:
+        @resilient(timeout=30.0, retry=API_RETRY_CONFIG, breaker=CircuitBreaker("heygen_api"))
+        def call_heygen():
+            ...
+    """
+
+    def decorator(func: F) -> F:
+        """Apply timeout, circuit breaker and retry logic to the decorated function."""
+
+        @functools.wraps(func)
+        def attempt(*args: Any, **kwargs: Any) -> Any:
+            """Run one attempt through the circuit breaker and timeout."""
+            if timeout is None:
+                bound: Callable[[], Any] = functools.partial(func, *args, **kwargs)
+            else:
+                # Bind the arguments first so a "timeout" kwarg reaches func
+                call = functools.update_wrapper(functools.partial(func, *args, **kwargs), func)
+                bound = functools.partial(with_timeout, call, timeout)
+            if breaker is not None:
+                return breaker.call(bound)
+            return bound()
+
+        if retry is None:
+            return attempt  # type: ignore
+        return with_retry(retry)(attempt)  # type: ignore
+
+    return decorator
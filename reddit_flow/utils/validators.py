@@ -17,11 +17,14 @@ from reddit_flow.config import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """
     Result of a validation operation.
 
+    Results are immutable, so the fixed failure results below are shared
+    rather than rebuilt on every call.
+
     Attributes:
         is_valid: Whether the validation passed.
         value: The validated/cleaned value (if valid).
@@ -39,6 +42,45 @@ class ValidationResult:
         return self.is_valid
 
 
+# =============================================================================
+# Shared Failure Results
+# =============================================================================
+
+_ERR_EMPTY_URL = ValidationResult(is_valid=False, error="URL cannot be empty")
+_ERR_INVALID_URL = ValidationResult(
+    is_valid=False,
+    error="Invalid Reddit URL. Expected: https://reddit.com/r/subreddit/comments/postid/",
+)
+_ERR_EMPTY_SUBREDDIT = ValidationResult(is_valid=False, error="Subreddit name cannot be empty")
+_ERR_SUBREDDIT_TOO_SHORT = ValidationResult(
+    is_valid=False, error="Subreddit name too short (minimum 2 characters)"
+)
+_ERR_SUBREDDIT_TOO_LONG = ValidationResult(
+    is_valid=False, error="Subreddit name too long (maximum 21 characters)"
+)
+_ERR_SUBREDDIT_CHARS = ValidationResult(
+    is_valid=False, error="Subreddit name can only contain letters, numbers, and underscores"
+)
+_ERR_SUBREDDIT_UNDERSCORE = ValidationResult(
+    is_valid=False, error="Subreddit name cannot start with underscore"
+)
+_ERR_EMPTY_POST_ID = ValidationResult(is_valid=False, error="Post ID cannot be empty")
+_ERR_POST_ID_TOO_SHORT = ValidationResult(
+    is_valid=False, error="Post ID too short (minimum 5 characters)"
+)
+_ERR_POST_ID_TOO_LONG = ValidationResult(
+    is_valid=False, error="Post ID too long (maximum 10 characters)"
+)
+_ERR_POST_ID_CHARS = ValidationResult(
+    is_valid=False, error="Post ID can only contain lowercase letters and numbers"
+)
+_ERR_EMPTY_SCRIPT = ValidationResult(is_valid=False, error="Script cannot be empty")
+_ERR_EMPTY_TITLE = ValidationResult(is_valid=False, error="Title cannot be empty")
+_ERR_TITLE_SANITIZED_EMPTY = ValidationResult(
+    is_valid=False, error="Title is empty after sanitization"
+)
+
+
 # =============================================================================
 # Reddit URL Validation
 # =============================================================================
@@ -61,6 +103,20 @@ REDDIT_SHARE_URL_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# All three URL forms in one pattern, so a URL is scanned once; the named
+# group that matched tells which form it is
+REDDIT_ANY_URL_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{form}>{pattern.pattern})"
+        for form, pattern in (
+            ("standard", REDDIT_URL_PATTERN),
+            ("short", REDDIT_SHORT_URL_PATTERN),
+            ("share", REDDIT_SHARE_URL_PATTERN),
+        )
+    ),
+    re.IGNORECASE,
+)
+
 # Subreddit name validation pattern
 SUBREDDIT_PATTERN = re.compile(r"^[a-zA-Z0-9_]{2,21}$")
 
@@ -92,21 +148,7 @@ def is_valid_reddit_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
 
-    url = url.strip()
-
-    # Check standard Reddit URL
-    if REDDIT_URL_PATTERN.search(url):
-        return True
-
-    # Check short URL
-    if REDDIT_SHORT_URL_PATTERN.search(url):
-        return True
-
-    # Check share URL
-    if REDDIT_SHARE_URL_PATTERN.search(url):
-        return True
-
-    return False
+    return REDDIT_ANY_URL_PATTERN.search(url) is not None
 
 
 def parse_reddit_url(url: str) -> ValidationResult:
@@ -130,17 +172,19 @@ def parse_reddit_url(url: str) -> ValidationResult:
         {'subreddit': 'python', 'post_id': 'abc123', 'url': '...'}
     """
     if not url or not isinstance(url, str):
-        return ValidationResult(
-            is_valid=False,
-            error="URL cannot be empty",
-        )
+        return _ERR_EMPTY_URL
 
     url = url.strip()
 
-    # Try standard Reddit URL
-    match = REDDIT_URL_PATTERN.search(url)
-    if match:
-        subreddit, post_id = match.groups()
+    match = REDDIT_ANY_URL_PATTERN.search(url)
+    if match is None:
+        return _ERR_INVALID_URL
+
+    # lastindex is the matched form's named group; its own groups follow it
+    form = match.lastgroup
+    first = (match.lastindex or 0) + 1
+    if form == "standard":
+        subreddit, post_id = match.group(first, first + 1)
         return ValidationResult(
             is_valid=True,
             value={
@@ -151,10 +195,9 @@ def parse_reddit_url(url: str) -> ValidationResult:
             },
         )
 
-    # Try short URL (redd.it) - note: doesn't include subreddit
-    match = REDDIT_SHORT_URL_PATTERN.search(url)
-    if match:
-        post_id = match.group(1)
+    if form == "short":
+        # Short URL (redd.it) - note: doesn't include subreddit
+        post_id = match.group(first)
         return ValidationResult(
             is_valid=True,
             value={
@@ -166,24 +209,17 @@ def parse_reddit_url(url: str) -> ValidationResult:
             details={"note": "Subreddit must be resolved from API"},
         )
 
-    # Try share URL
-    match = REDDIT_SHARE_URL_PATTERN.search(url)
-    if match:
-        subreddit, share_id = match.groups()
-        return ValidationResult(
-            is_valid=True,
-            value={
-                "subreddit": subreddit,
-                "post_id": share_id,  # Share ID, may need resolution
-                "url": url,
-                "format": "share",
-            },
-            details={"note": "Share URL may require redirect resolution"},
-        )
-
+    # Share URL
+    subreddit, share_id = match.group(first, first + 1)
     return ValidationResult(
-        is_valid=False,
-        error="Invalid Reddit URL. Expected: https://reddit.com/r/subreddit/comments/postid/",
+        is_valid=True,
+        value={
+            "subreddit": subreddit,
+            "post_id": share_id,  # Share ID, may need resolution
+            "url": url,
+            "format": "share",
+        },
+        details={"note": "Share URL may require redirect resolution"},
     )
 
 
@@ -209,10 +245,7 @@ def validate_subreddit_name(name: str) -> ValidationResult:
         ValidationResult(is_valid=False, error='...too short...', ...)
     """
     if not name or not isinstance(name, str):
-        return ValidationResult(
-            is_valid=False,
-            error="Subreddit name cannot be empty",
-        )
+        return _ERR_EMPTY_SUBREDDIT
 
     # Remove r/ prefix if present
     name = name.strip()
@@ -221,29 +254,17 @@ def validate_subreddit_name(name: str) -> ValidationResult:
 
     # Check length
     if len(name) < 2:
-        return ValidationResult(
-            is_valid=False,
-            error="Subreddit name too short (minimum 2 characters)",
-        )
+        return _ERR_SUBREDDIT_TOO_SHORT
     if len(name) > 21:
-        return ValidationResult(
-            is_valid=False,
-            error="Subreddit name too long (maximum 21 characters)",
-        )
+        return _ERR_SUBREDDIT_TOO_LONG
 
     # Check pattern
     if not SUBREDDIT_PATTERN.match(name):
-        return ValidationResult(
-            is_valid=False,
-            error="Subreddit name can only contain letters, numbers, and underscores",
-        )
+        return _ERR_SUBREDDIT_CHARS
 
     # Check doesn't start with underscore
     if name.startswith("_"):
-        return ValidationResult(
-            is_valid=False,
-            error="Subreddit name cannot start with underscore",
-        )
+        return _ERR_SUBREDDIT_UNDERSCORE
 
     return ValidationResult(
         is_valid=True,
@@ -270,29 +291,17 @@ def validate_post_id(post_id: str) -> ValidationResult:
         ValidationResult(is_valid=False, error='...', ...)
     """
     if not post_id or not isinstance(post_id, str):
-        return ValidationResult(
-            is_valid=False,
-            error="Post ID cannot be empty",
-        )
+        return _ERR_EMPTY_POST_ID
 
     post_id = post_id.strip().lower()
 
     if len(post_id) < 5:
-        return ValidationResult(
-            is_valid=False,
-            error="Post ID too short (minimum 5 characters)",
-        )
+        return _ERR_POST_ID_TOO_SHORT
     if len(post_id) > 10:
-        return ValidationResult(
-            is_valid=False,
-            error="Post ID too long (maximum 10 characters)",
-        )
+        return _ERR_POST_ID_TOO_LONG
 
     if not POST_ID_PATTERN.match(post_id):
-        return ValidationResult(
-            is_valid=False,
-            error="Post ID can only contain lowercase letters and numbers",
-        )
+        return _ERR_POST_ID_CHARS
 
     return ValidationResult(
         is_valid=True,
@@ -304,6 +313,17 @@ def validate_post_id(post_id: str) -> ValidationResult:
 # Content Validation
 # =============================================================================
 
+# ASCII letters, digits and whitespace: what is *not* a special character
+_ASCII_PLAIN_BYTES = bytes(i for i in range(128) if chr(i).isalnum() or chr(i).isspace())
+
+
+def _count_special_chars(text: str) -> int:
+    """Count characters that are neither alphanumeric nor whitespace."""
+    if text.isascii():
+        # Deleting the plain bytes in C leaves exactly the special ones
+        return len(text.encode("ascii").translate(None, _ASCII_PLAIN_BYTES))
+    return sum(1 for c in text if not c.isalnum() and not c.isspace())
+
 
 def validate_content_length(
     content: str,
@@ -388,10 +408,7 @@ def validate_script_content(
         ValidationResult(is_valid=True, value='...', details={'word_count': 7})
     """
     if not script or not isinstance(script, str):
-        return ValidationResult(
-            is_valid=False,
-            error="Script cannot be empty",
-        )
+        return _ERR_EMPTY_SCRIPT
 
     script = script.strip()
     words = script.split()
@@ -412,7 +429,7 @@ def validate_script_content(
         )
 
     # Check for excessive special characters (potential injection)
-    special_char_ratio = sum(1 for c in script if not c.isalnum() and not c.isspace()) / len(script)
+    special_char_ratio = _count_special_chars(script) / len(script)
     if special_char_ratio > 0.3:
         return ValidationResult(
             is_valid=False,
@@ -454,10 +471,7 @@ def validate_youtube_title(
         ValidationResult(is_valid=True, value='My Cool Video Title', ...)
     """
     if not title or not isinstance(title, str):
-        return ValidationResult(
-            is_valid=False,
-            error="Title cannot be empty",
-        )
+        return _ERR_EMPTY_TITLE
 
     title = title.strip()
 
@@ -473,10 +487,7 @@ def validate_youtube_title(
     title = re.sub(r"\s+", " ", title)
 
     if not title:
-        return ValidationResult(
-            is_valid=False,
-            error="Title is empty after sanitization",
-        )
+        return _ERR_TITLE_SANITIZED_EMPTY
 
     return ValidationResult(
         is_valid=True,
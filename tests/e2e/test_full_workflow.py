@@ -203,6 +203,9 @@ class MockHeyGenClient:
         video_id: str,
         update_callback: Optional[Callable[[str], Any]] = None,
         timeout: Optional[int] = None,
+        status_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        initial_delay: float = 0.0,
+        poll_backoff: float = 1.5,
     ) -> str:
         """Return a completed video URL."""
         if update_callback:
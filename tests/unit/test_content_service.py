@@ -14,7 +14,21 @@ import pytest
 
 from reddit_flow.exceptions import ContentError, EmptyContentError, InvalidURLError, RedditAPIError
 from reddit_flow.models import LinkInfo, RedditComment, RedditPost
-from reddit_flow.services.content_service import ContentService
+from reddit_flow.services.content_service import (
+    ContentService,
+    _default_reddit_client,
+    _parse_reddit_url_cached,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_default_client():
+    """Reset the shared default Reddit client and URL cache between tests."""
+    _default_reddit_client.cache_clear()
+    _parse_reddit_url_cached.cache_clear()
+    yield
+    _default_reddit_client.cache_clear()
+    _parse_reddit_url_cached.cache_clear()
 
 
 class TestContentServiceInitialization:
@@ -59,6 +73,15 @@ class TestContentServiceInitialization:
             assert client is mock_instance
             MockClient.assert_called_once()
 
+    def test_default_reddit_client_shared_between_services(self):
+        """Test that services without an explicit client share one instance."""
+        with patch("reddit_flow.services.content_service.RedditClient") as MockClient:
+            first = ContentService().reddit_client
+            second = ContentService().reddit_client
+
+        assert first is second
+        MockClient.assert_called_once()
+
 
 class TestContentServiceURLParsing:
     """Tests for Reddit URL parsing."""
@@ -130,6 +153,40 @@ class TestContentServiceURLParsing:
             with pytest.raises(InvalidURLError):
                 service.parse_reddit_url(url)
 
+    def test_parse_non_reddit_url_skips_regex(self, service):
+        """Test that obvious non-Reddit URLs are rejected before the regex runs."""
+        with patch.object(ContentService, "REDDIT_URL_PATTERN") as pattern:
+            with pytest.raises(InvalidURLError, match="Could not parse"):
+                service.parse_reddit_url("https://www.google.com/search?q=reddit")
+
+        pattern.search.assert_not_called()
+
+    def test_parse_repeated_url_uses_cache(self, service):
+        """Test that repeat URLs skip the regex and return independent copies."""
+        url = "https://www.reddit.com/r/python/comments/abc123/"
+        first = service.parse_reddit_url(url)
+
+        with patch.object(ContentService, "REDDIT_URL_PATTERN") as pattern:
+            second = ContentService(reddit_client=MagicMock()).parse_reddit_url(url)
+
+        pattern.search.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_parse_mixed_case_url(self, service):
+        """Test that the prefix check is case-insensitive."""
+        result = service.parse_reddit_url("HTTPS://WWW.REDDIT.COM/r/Python/comments/abc123/")
+
+        assert result.subreddit == "Python"
+        assert result.post_id == "abc123"
+
+    def test_parse_preserves_post_id_case(self, service):
+        """Test that matching on the lowered URL keeps the original casing."""
+        result = service.parse_reddit_url("https://www.reddit.com/r/AskReddit/comments/AbC123/")
+
+        assert result.subreddit == "AskReddit"
+        assert result.post_id == "AbC123"
+
 
 class TestContentServiceURLValidation:
     """Tests for URL component validation."""
@@ -153,6 +210,11 @@ class TestContentServiceURLValidation:
             ("python", "abc123xyz789", False),  # Too long
             ("ab", "abc123", True),  # Subreddit min length
             ("a", "abc123", False),  # Subreddit too short
+            ("x" * 22, "abc123", False),  # Subreddit too long
+            ("bad-sub", "abc123", False),  # Subreddit punctuation
+            ("python", "abc_12", False),  # Underscore not allowed in post ID
+            ("python", "abcé12", False),  # Non-ASCII post ID
+            ("pythön", "abc123", False),  # Non-ASCII subreddit
         ],
     )
     def test_validate_url(self, service, subreddit, post_id, expected):
@@ -245,6 +307,45 @@ class TestContentServiceFetchContent:
 
         assert len(result.comments) == 10
 
+    def test_get_post_content_stops_at_max_comments(self, mock_reddit_client):
+        """Test that comments are consumed lazily up to the limit."""
+        consumed = []
+
+        def comment_stream():
+            for i in range(100):
+                consumed.append(i)
+                yield {"id": f"comment{i}", "author": "user", "body": "Comment", "score": i}
+
+        mock_reddit_client.get_post_data.return_value["comments"] = comment_stream()
+
+        service = ContentService(reddit_client=mock_reddit_client, max_comments=3)
+        result = service.get_post_content("test", "abc123")
+
+        assert len(result.comments) == 3
+        assert consumed == [0, 1, 2]
+
+    def test_get_post_content_max_comments_override(self, service):
+        """Test that a per-call override lowers the comment limit."""
+        result = service.get_post_content("test", "abc123", max_comments_override=1)
+
+        assert len(result.comments) == 1
+        assert result.comments[0].id == "comment1"
+
+    def test_get_post_content_override_zero_skips_comments(self, service):
+        """Test that an override of 0 skips building comment models."""
+        with patch("reddit_flow.services.content_service.RedditComment") as comment_model:
+            result = service.get_post_content("test", "abc123", max_comments_override=0)
+
+        assert result.comments == []
+        comment_model.assert_not_called()
+
+    def test_get_post_content_override_cannot_raise_limit(self, mock_reddit_client):
+        """Test that the override is capped at the service's max_comments."""
+        service = ContentService(reddit_client=mock_reddit_client, max_comments=1)
+        result = service.get_post_content("test", "abc123", max_comments_override=50)
+
+        assert len(result.comments) == 1
+
     def test_get_post_content_api_error(self, service, mock_reddit_client):
         """Test handling of Reddit API errors."""
         mock_reddit_client.get_post_data.side_effect = RedditAPIError("API failed")
@@ -308,6 +409,14 @@ class TestContentServiceGetContentFromURL:
 
         assert result["user_text"] == user_text
 
+    def test_get_content_from_url_max_comments_zero(self, service):
+        """Test that max_comments=0 returns the post without comments."""
+        url = "https://www.reddit.com/r/python/comments/abc123/"
+        result = service.get_content_from_url(url, max_comments=0)
+
+        assert result["post"].selftext == "Post content here."
+        assert result["post"].comments == []
+
     def test_get_content_from_url_short_url_error(self, service):
         """Test that short URLs raise an error."""
         url = "https://redd.it/abc123"
@@ -343,6 +452,37 @@ class TestContentServiceGetContentFromURL:
 
         assert "no text content" in str(exc_info.value).lower()
 
+    def test_get_content_from_url_max_comments_zero_link_post(self, service, mock_reddit_client):
+        """Test a link post with comments is not rejected when comments are skipped."""
+        mock_reddit_client.get_post_data.return_value = {
+            "id": "abc123",
+            "title": "Link Post",
+            "selftext": "",
+            "url": "https://example.com/article",
+            "comments": [{"id": "c1", "author": "user", "body": "Discussion", "score": 3}],
+        }
+
+        url = "https://www.reddit.com/r/python/comments/abc123/"
+        result = service.get_content_from_url(url, max_comments=0)
+
+        assert result["post"].title == "Link Post"
+        assert result["post"].comments == []
+        assert result["post"].num_comments == 1
+
+    def test_get_content_from_url_max_comments_zero_empty_post(self, service, mock_reddit_client):
+        """Test a post with no text and no comments is rejected even when comments are skipped."""
+        mock_reddit_client.get_post_data.return_value = {
+            "id": "abc123",
+            "title": "Link Post",
+            "selftext": "",
+            "url": "https://example.com/article",
+            "comments": [],
+        }
+
+        url = "https://www.reddit.com/r/python/comments/abc123/"
+        with pytest.raises(EmptyContentError):
+            service.get_content_from_url(url, max_comments=0)
+
 
 class TestContentServicePostSummary:
     """Tests for get_post_summary method."""
@@ -257,6 +257,73 @@ class TestElevenLabsClientTextToSpeech:
         assert "Failed to convert" in str(exc_info.value)
 
 
+# =============================================================================
+# Streaming Text to Speech Tests
+# =============================================================================
+
+
+class TestElevenLabsClientTextToSpeechStream:
+    """Tests for text_to_speech_stream method."""
+
+    @patch("reddit_flow.clients.elevenlabs_client.requests.post")
+    def test_stream_yields_chunks(self, mock_post, elevenlabs_client):
+        """Test that audio chunks are yielded as they arrive."""
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b"chunk1", b"", b"chunk2"]
+        mock_post.return_value.__enter__.return_value = mock_response
+
+        chunks = list(elevenlabs_client.text_to_speech_stream("Hello, world!"))
+
+        assert chunks == [b"chunk1", b"chunk2"]
+        call_url = mock_post.call_args[0][0]
+        assert call_url.endswith(f"/text-to-speech/{elevenlabs_client.voice_id}/stream")
+        assert mock_post.call_args[1]["stream"] is True
+
+    @patch("reddit_flow.clients.elevenlabs_client.requests.post")
+    def test_stream_http_error_keeps_error_response_status(self, mock_post, elevenlabs_client):
+        """Test that the status of a 4xx response (which is falsy) is kept."""
+        error_response = requests.Response()
+        error_response.status_code = 429
+        error_response._content = b"Too many requests"
+        mock_response = MagicMock()
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=error_response
+        )
+        mock_post.return_value.__enter__.return_value = mock_response
+
+        with pytest.raises(TTSError) as exc_info:
+            list(elevenlabs_client.text_to_speech_stream("Test"))
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.response_body == "Too many requests"
+
+    @patch("reddit_flow.clients.elevenlabs_client.requests.post")
+    def test_stream_http_error_raises_tts_error(self, mock_post, elevenlabs_client):
+        """Test that HTTP errors are wrapped in TTSError."""
+        mock_response = MagicMock()
+        mock_response.status_code = 401
+        mock_response.text = "Unauthorized"
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=mock_response
+        )
+        mock_post.return_value.__enter__.return_value = mock_response
+
+        with pytest.raises(TTSError) as exc_info:
+            list(elevenlabs_client.text_to_speech_stream("Test"))
+
+        assert "conversion failed" in str(exc_info.value)
+
+    @patch("reddit_flow.clients.elevenlabs_client.requests.post")
+    def test_stream_network_error_raises_tts_error(self, mock_post, elevenlabs_client):
+        """Test that network errors are wrapped in TTSError."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with pytest.raises(TTSError) as exc_info:
+            list(elevenlabs_client.text_to_speech_stream("Test"))
+
+        assert "Network error" in str(exc_info.value)
+
+
 # =============================================================================
 # Get Voices Tests
 # =============================================================================
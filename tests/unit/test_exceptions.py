@@ -117,6 +117,15 @@ class TestAPIError:
         assert "[HTTP 429]" in str(error)
         assert error.status_code == 429
 
+    def test_status_prefix_shared_across_instances(self) -> None:
+        """Test the status prefix string is built once per status code."""
+        first = APIError("Rate limit exceeded", status_code=429)
+        second = TransientAPIError("Slow down", status_code=429)
+
+        assert str(first) == "[HTTP 429] Rate limit exceeded"
+        assert str(second) == "[HTTP 429] Slow down"
+        assert APIError._status_prefix_cache[429] == "[HTTP 429] "
+
     def test_with_response_body(self) -> None:
         """Test API error with response body."""
         error = APIError(
@@ -11,7 +11,7 @@ import pytest
 import requests
 
 from reddit_flow.clients.heygen_client import HeyGenClient
-from reddit_flow.exceptions import ConfigurationError, VideoGenerationError
+from reddit_flow.exceptions import ConfigurationError, TTSError, VideoGenerationError
 from reddit_flow.models import AudioAsset, VideoGenerationRequest, VideoGenerationResponse
 
 # =============================================================================
@@ -213,6 +213,17 @@ class TestHeyGenClientUploadAudio:
         assert result.asset_id == "asset-12345"
         assert result.file_size_bytes == len(b"audio bytes")
 
+    @patch("reddit_flow.clients.heygen_client.requests.post")
+    def test_upload_audio_accepts_memoryview(self, mock_post, heygen_client, mock_upload_response):
+        """Test that a memoryview body is sent as-is and sized correctly."""
+        mock_post.return_value = mock_upload_response
+        view = memoryview(b"audio bytes")
+
+        result = heygen_client.upload_audio(view)
+
+        assert mock_post.call_args[1]["data"] is view
+        assert result.file_size_bytes == len(b"audio bytes")
+
     @patch("reddit_flow.clients.heygen_client.requests.post")
     def test_upload_audio_sends_correct_headers(
         self, mock_post, heygen_client, mock_upload_response
@@ -263,6 +274,22 @@ class TestHeyGenClientUploadAudio:
 
         assert "upload failed" in str(exc_info.value)
 
+    @patch("reddit_flow.clients.heygen_client.requests.post")
+    def test_upload_audio_http_error_keeps_error_response_status(self, mock_post, heygen_client):
+        """Test that the status of a 4xx response (which is falsy) is kept."""
+        error_response = requests.Response()
+        error_response.status_code = 413
+        error_response._content = b"Payload too large"
+        mock_post.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=error_response
+        )
+
+        with pytest.raises(VideoGenerationError) as exc_info:
+            heygen_client.upload_audio(b"audio")
+
+        assert exc_info.value.status_code == 413
+        assert exc_info.value.response_body == "Payload too large"
+
     @patch("reddit_flow.clients.heygen_client.requests.post")
     def test_upload_audio_network_error_raises_video_error(self, mock_post, heygen_client):
         """Test that network errors are wrapped in VideoGenerationError."""
@@ -274,6 +301,50 @@ class TestHeyGenClientUploadAudio:
         assert "Network error" in str(exc_info.value)
 
 
+class TestHeyGenClientUploadAudioStream:
+    """Tests for upload_audio_stream method."""
+
+    @patch("reddit_flow.clients.heygen_client.requests.post")
+    def test_upload_audio_stream_consumes_chunks(
+        self, mock_post, heygen_client, mock_upload_response
+    ):
+        """Test that chunks are streamed as the request body."""
+        sent = []
+
+        def fake_post(url, data, headers, timeout):
+            sent.extend(data)
+            return mock_upload_response
+
+        mock_post.side_effect = fake_post
+
+        result = heygen_client.upload_audio_stream(iter([b"abc", b"defg"]))
+
+        assert sent == [b"abc", b"defg"]
+        assert result.url == "https://heygen.com/audio/12345.mp3"
+        assert result.file_size_bytes == 7
+
+    @patch("reddit_flow.clients.heygen_client.requests.post")
+    def test_upload_audio_stream_source_error_passes_through(self, mock_post, heygen_client):
+        """Test that errors raised by the chunk source are not rewrapped."""
+
+        def failing_chunks():
+            yield b"abc"
+            raise TTSError("TTS stream broke")
+
+        mock_post.side_effect = lambda url, data, headers, timeout: list(data)
+
+        with pytest.raises(TTSError, match="TTS stream broke"):
+            heygen_client.upload_audio_stream(failing_chunks())
+
+    @patch("reddit_flow.clients.heygen_client.requests.post")
+    def test_upload_audio_stream_network_error_raises_video_error(self, mock_post, heygen_client):
+        """Test that network errors are wrapped in VideoGenerationError."""
+        mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with pytest.raises(VideoGenerationError, match="Network error"):
+            heygen_client.upload_audio_stream(iter([b"audio"]))
+
+
 # =============================================================================
 # Generate Video Tests
 # =============================================================================
@@ -514,6 +585,20 @@ class TestHeyGenClientWaitForVideo:
         assert result == "https://heygen.com/video/final.mp4"
         mock_sleep.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch("reddit_flow.clients.heygen_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("reddit_flow.clients.heygen_client.requests.get")
+    async def test_wait_for_video_initial_delay(
+        self, mock_get, mock_sleep, heygen_client, mock_status_completed_response
+    ):
+        """Test that the first poll is deferred by initial_delay."""
+        mock_get.return_value = mock_status_completed_response
+
+        await heygen_client.wait_for_video("video-123", initial_delay=30.0)
+
+        mock_sleep.assert_awaited_once_with(30.0)
+        mock_get.assert_called_once()
+
     @pytest.mark.asyncio
     @patch("reddit_flow.clients.heygen_client.requests.get")
     async def test_wait_for_video_failure(self, mock_get, heygen_client):
@@ -565,6 +650,19 @@ class TestHeyGenClientWaitForVideo:
         # Callback not called since video completed immediately
         # (callback is called during polling loop before completion)
 
+    @pytest.mark.asyncio
+    @patch("reddit_flow.clients.heygen_client.requests.get")
+    async def test_wait_for_video_reports_each_poll(
+        self, mock_get, heygen_client, mock_status_completed_response
+    ):
+        """Test that status_callback receives the raw status data of each poll."""
+        mock_get.return_value = mock_status_completed_response
+        seen = []
+
+        await heygen_client.wait_for_video("video-123", status_callback=seen.append)
+
+        assert seen == [mock_status_completed_response.json.return_value["data"]]
+
 
 # =============================================================================
 # Get Remaining Quota Tests
@@ -604,6 +702,29 @@ class TestHeyGenClientGetRemainingQuota:
             heygen_client.get_remaining_quota()
 
 
+class TestHeyGenClientDeleteVideo:
+    """Tests for delete_video method."""
+
+    @patch("reddit_flow.clients.heygen_client.requests.delete")
+    def test_delete_video_success(self, mock_delete, heygen_client):
+        """Test deleting a video sends its ID."""
+        mock_delete.return_value = MagicMock(status_code=200)
+
+        heygen_client.delete_video("video_123")
+
+        mock_delete.assert_called_once()
+        assert mock_delete.call_args.kwargs["params"] == {"video_id": "video_123"}
+        assert mock_delete.call_args.args[0].endswith("/v1/video.delete")
+
+    @patch("reddit_flow.clients.heygen_client.requests.delete")
+    def test_delete_video_error(self, mock_delete, heygen_client):
+        """Test deletion errors raise VideoGenerationError."""
+        mock_delete.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError()
+
+        with pytest.raises(VideoGenerationError):
+            heygen_client.delete_video("video_123")
+
+
 # =============================================================================
 # Integration-style Tests
 # =============================================================================
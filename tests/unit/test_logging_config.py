@@ -4,12 +4,16 @@ import json
 import logging
 import os
 import sys
+import threading
+from datetime import datetime
 from pathlib import Path
 
+import pytest
 from dotenv import load_dotenv
 
 from reddit_flow.config.logging_config import (
     ColoredFormatter,
+    DeferredQueueHandler,
     JsonFormatter,
     StructuredLogger,
     configure_logging,
@@ -62,6 +66,48 @@ class TestConfigureLogging:
         root_logger = logging.getLogger()
         assert root_logger.level == logging.WARNING
 
+    def test_configure_logging_quietens_library_loggers(self, tmp_path):
+        """Test third-party loggers drop to WARNING without disabling other loggers."""
+        app_logger = get_logger("test.existing_app_logger")
+
+        configure_logging(level="DEBUG", log_dir=str(tmp_path), console_output=False)
+
+        assert logging.getLogger("urllib3").level == logging.WARNING
+        assert logging.getLogger("googleapiclient").level == logging.WARNING
+        assert not app_logger.disabled
+
+    def test_configure_logging_background_formats_off_thread(self, tmp_path, monkeypatch):
+        """Test background logging formats and writes records on the listener thread."""
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        format_threads = []
+
+        class ThreadRecorder:
+            def __str__(self):
+                format_threads.append(threading.current_thread())
+                return "payload"
+
+        configure_logging(
+            level="INFO",
+            log_dir=str(tmp_path),
+            json_logs=True,
+            console_output=False,
+            file_output=True,
+            background=True,
+        )
+        try:
+            root_logger = logging.getLogger()
+            assert [type(h) for h in root_logger.handlers] == [DeferredQueueHandler]
+
+            get_logger("test.background").info("value=%s", ThreadRecorder())
+        finally:
+            # Reconfiguring stops (and flushes) the listener
+            configure_logging(console_output=False, file_output=False)
+
+        lines = (tmp_path / "reddit_flow_log.json").read_text().splitlines()
+        messages = [json.loads(line)["message"] for line in lines]
+        assert "value=payload" in messages
+        assert format_threads and threading.main_thread() not in format_threads
+
 
 class TestGetLogger:
     """Tests for the get_logger function."""
@@ -129,6 +175,57 @@ class TestJsonFormatter:
         assert "exception" in parsed
         assert "ValueError" in parsed["exception"]
 
+    def test_json_formatter_reuses_rendered_traceback(self, monkeypatch):
+        """Test a traceback already rendered for the record is not rendered again."""
+        formatter = JsonFormatter()
+        try:
+            raise ValueError("Test error")
+        except ValueError:
+            record = logging.LogRecord(
+                name="test",
+                level=logging.ERROR,
+                pathname="test.py",
+                lineno=10,
+                msg="Error occurred",
+                args=(),
+                exc_info=sys.exc_info(),
+            )
+
+        first = json.loads(formatter.format(record))["exception"]
+        monkeypatch.setattr(
+            formatter, "formatException", lambda ei: pytest.fail("traceback rendered twice")
+        )
+
+        assert json.loads(formatter.format(record))["exception"] == first
+        assert record.exc_text == first
+
+    def test_json_formatter_timestamp_matches_isoformat(self):
+        """Test the reused seconds prefix gives the same text as datetime.isoformat."""
+        formatter = JsonFormatter()
+        base = 1_700_000_000.0
+
+        for created in (base, base + 0.25, base + 0.999_999_7, base + 1.5, base + 0.000_001):
+            expected = datetime.fromtimestamp(created).isoformat()
+            assert formatter._format_timestamp(created) == expected
+
+    def test_json_formatter_stringifies_unknown_types(self):
+        """Test values JSON cannot encode are written as their str()."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="With extra",
+            args=(),
+            exc_info=None,
+        )
+        record.extra_data = {"path": Path("/tmp/video.mp4")}
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["extra"] == {"path": "/tmp/video.mp4"}
+
 
 class TestColoredFormatter:
     """Tests for the ColoredFormatter class."""
@@ -152,6 +249,28 @@ class TestColoredFormatter:
         assert "Test message" in output
         assert "test" in output
 
+    def test_colored_formatter_uses_tty_flag(self, monkeypatch):
+        """Test colorizing follows the is_tty flag without re-checking stdout."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        colored = ColoredFormatter(is_tty=True)
+        plain = ColoredFormatter(is_tty=False)
+
+        def fail_isatty():
+            raise AssertionError("isatty checked per record")
+
+        monkeypatch.setattr(sys.stdout, "isatty", fail_isatty)
+
+        assert "\033[32mINFO\033[0m" in colored.format(record)
+        assert "\033[" not in plain.format(record)
+
 
 class TestStructuredLogger:
     """Tests for the StructuredLogger class."""
@@ -217,3 +336,73 @@ class TestStructuredLogger:
 
         assert entry["status"] == "failed"
         assert entry["error"] == "Something went wrong"
+
+    def test_structured_logger_step_message_is_lazy(self, tmp_path, caplog):
+        """Test the step message is passed as arguments and the timestamp is ISO text."""
+        logger = StructuredLogger(log_dir=str(tmp_path))
+
+        with caplog.at_level(logging.INFO, logger="reddit_flow.config.logging_config"):
+            logger.log_step(chat_id=1, step=3, name="upload", status="failed", error="quota")
+
+        record = caplog.records[-1]
+        assert record.args == (3, "upload", "failed", "quota")
+        assert record.getMessage() == "Step 3 (upload): failed - quota"
+        entry = json.loads(logger.log_file.read_text().splitlines()[1])
+        assert datetime.fromisoformat(entry["timestamp"])
+        logger.close()
+
+    def test_structured_logger_writes_on_background_thread(self, tmp_path):
+        """Test in-progress steps are written by the writer thread, not the caller."""
+        logger = StructuredLogger(log_dir=str(tmp_path))
+        real_file = logger._file
+        release = threading.Event()
+        write_threads = []
+
+        class BlockingFile:
+            def write(self, text):
+                write_threads.append(threading.current_thread())
+                release.wait(5)
+                return real_file.write(text)
+
+            def flush(self):
+                real_file.flush()
+
+            def close(self):
+                real_file.close()
+
+        logger._file = BlockingFile()
+        try:
+            # Returns while the writer is still blocked on the file
+            logger.log_step(chat_id=1, step=1, name="fetch", status="started")
+        finally:
+            release.set()
+        logger.flush()
+
+        lines = logger.log_file.read_text().splitlines()
+        assert json.loads(lines[1])["status"] == "started"
+        assert write_threads and threading.current_thread() not in write_threads
+        logger.close()
+
+    def test_structured_logger_flush_writes_all_queued_entries(self, tmp_path):
+        """Test flush waits for every queued entry, across several batches."""
+        logger = StructuredLogger(log_dir=str(tmp_path))
+
+        for step in range(StructuredLogger.BATCH_LIMIT * 3):
+            logger.log_step(chat_id=1, step=step, name="poll", status="started")
+        logger.flush()
+
+        lines = logger.log_file.read_text().splitlines()
+        assert len(lines) == StructuredLogger.BATCH_LIMIT * 3 + 1
+        assert [json.loads(line)["step_number"] for line in lines[1:]] == list(
+            range(StructuredLogger.BATCH_LIMIT * 3)
+        )
+
+    def test_structured_logger_close_writes_pending_entries(self, tmp_path):
+        """Test close writes queued entries and releases the file."""
+        logger = StructuredLogger(log_dir=str(tmp_path))
+        logger.log_step(chat_id=1, step=1, name="fetch", status="started")
+
+        logger.close()
+        logger.close()
+
+        assert len(logger.log_file.read_text().splitlines()) == 2
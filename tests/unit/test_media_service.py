@@ -11,20 +11,37 @@ Tests cover:
 - Error handling
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
 from reddit_flow.exceptions import MediaGenerationError, TTSError, VideoGenerationError
 from reddit_flow.models import AudioAsset, VideoGenerationResponse, VideoScript
 from reddit_flow.models.video import VideoStatus
-from reddit_flow.services.media_service import MediaGenerationResult, MediaService
+from reddit_flow.services.media_service import (
+    MediaGenerationResult,
+    MediaService,
+    _CoalescingNotifier,
+    _default_elevenlabs_client,
+    _default_heygen_client,
+)
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_default_clients():
+    """Reset the shared default clients between tests."""
+    _default_elevenlabs_client.cache_clear()
+    _default_heygen_client.cache_clear()
+    yield
+    _default_elevenlabs_client.cache_clear()
+    _default_heygen_client.cache_clear()
+
+
 @pytest.fixture
 def mock_elevenlabs_client():
     """Create a mock ElevenLabsClient."""
@@ -124,6 +141,29 @@ class TestMediaServiceInit:
             service = MediaService(heygen_client=mock_heygen_client)
             assert service.heygen_client is mock_heygen_client
 
+    def test_default_settings_are_cached(self):
+        """Test that services without explicit settings reuse the cached settings."""
+        with patch("reddit_flow.services.media_service.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.env = "dev"
+            first, second = MediaService(), MediaService()
+
+        assert first.settings is second.settings
+        assert first._is_prod is False
+
+    def test_default_clients_shared_between_services(self):
+        """Test that services without explicit clients share one instance of each."""
+        with (
+            patch("reddit_flow.services.media_service.ElevenLabsClient") as MockElevenLabs,
+            patch("reddit_flow.services.media_service.HeyGenClient") as MockHeyGen,
+        ):
+            first, second = MediaService(), MediaService()
+
+            assert first.elevenlabs_client is second.elevenlabs_client
+            assert first.heygen_client is second.heygen_client
+
+        MockElevenLabs.assert_called_once()
+        MockHeyGen.assert_called_once()
+
 
 # =============================================================================
 # Audio Generation Tests
@@ -140,6 +180,19 @@ class TestGenerateAudio:
         assert result == b"fake_audio_data"
         mock_elevenlabs_client.text_to_speech.assert_called_once_with("Hello world")
 
+    def test_generate_audio_skipped_outside_prod(self, mock_elevenlabs_client, mock_heygen_client):
+        """Test that non-prod runs return placeholder audio without calling ElevenLabs."""
+        settings = MagicMock()
+        settings.env = "dev"
+        service = MediaService(
+            elevenlabs_client=mock_elevenlabs_client,
+            heygen_client=mock_heygen_client,
+            settings=settings,
+        )
+
+        assert service.generate_audio("Hello world") == b"dummy_audio_bytes"
+        mock_elevenlabs_client.text_to_speech.assert_not_called()
+
     def test_generate_audio_empty_text_raises_error(self, media_service):
         """Test that empty text raises TTSError."""
         with pytest.raises(TTSError, match="empty text"):
@@ -183,6 +236,16 @@ class TestUploadAudio:
         assert result.url == "https://heygen.com/audio/123"
         mock_heygen_client.upload_audio.assert_called_once_with(b"audio_data")
 
+    def test_upload_audio_passes_buffer_without_copy(self, media_service, mock_heygen_client):
+        """Test that bytes-like input is passed down as a zero-copy view."""
+        buffer = bytearray(b"audio_data")
+
+        media_service.upload_audio(buffer)
+
+        sent = mock_heygen_client.upload_audio.call_args.args[0]
+        assert isinstance(sent, memoryview)
+        assert sent.obj is buffer
+
     def test_upload_audio_empty_data_raises_error(self, media_service):
         """Test that empty audio data raises VideoGenerationError."""
         with pytest.raises(VideoGenerationError, match="empty audio"):
@@ -266,6 +329,9 @@ class TestWaitForVideo:
             video_id="video_123",
             update_callback=None,
             timeout=None,
+            status_callback=ANY,
+            initial_delay=10.0,
+            poll_backoff=1.6,
         )
 
     @pytest.mark.asyncio
@@ -279,6 +345,9 @@ class TestWaitForVideo:
             video_id="video_123",
             update_callback=callback,
             timeout=None,
+            status_callback=ANY,
+            initial_delay=10.0,
+            poll_backoff=1.6,
         )
 
     @pytest.mark.asyncio
@@ -290,8 +359,39 @@ class TestWaitForVideo:
             video_id="video_123",
             update_callback=None,
             timeout=300,
+            status_callback=ANY,
+            initial_delay=10.0,
+            poll_backoff=1.6,
         )
 
+    @pytest.mark.asyncio
+    async def test_first_poll_delay_adapts_to_completion_time(
+        self, media_service, mock_heygen_client
+    ):
+        """Test that observed completion times raise the first poll delay."""
+        with patch("reddit_flow.services.media_service.time.monotonic", side_effect=[0.0, 100.0]):
+            await media_service.wait_for_video("video_123")
+
+        assert media_service.first_poll_delay == 50.0
+
+        with patch("reddit_flow.services.media_service.time.monotonic", side_effect=[0.0, 50.0]):
+            await media_service.wait_for_video("video_456")
+
+        # EMA: 0.2 * 50 + 0.8 * 100 = 90 -> half of that
+        assert media_service.first_poll_delay == pytest.approx(45.0)
+        assert mock_heygen_client.wait_for_video.call_args.kwargs["initial_delay"] == 50.0
+
+    def test_first_poll_delay_never_below_minimum(self, mock_elevenlabs_client, mock_heygen_client):
+        """Test that fast completions do not lower the delay below the minimum."""
+        service = MediaService(
+            elevenlabs_client=mock_elevenlabs_client,
+            heygen_client=mock_heygen_client,
+            min_first_poll_delay=5.0,
+        )
+        service._record_completion_time(2.0)
+
+        assert service.first_poll_delay == 5.0
+
     @pytest.mark.asyncio
     async def test_wait_for_video_error_propagates(self, media_service, mock_heygen_client):
         """Test that wait errors are propagated."""
@@ -372,6 +472,22 @@ class TestGenerateVideoFromScript:
         # Callback should be called for each step
         assert callback.await_count >= 3
 
+    @pytest.mark.asyncio
+    async def test_generate_video_from_script_callback_error_not_fatal(
+        self, media_service, sample_video_script
+    ):
+        """Test that a failing progress callback does not abort the workflow."""
+        callback = AsyncMock(side_effect=RuntimeError("chat unavailable"))
+
+        result = await media_service.generate_video_from_script(
+            sample_video_script,
+            wait_for_completion=False,
+            update_callback=callback,
+        )
+
+        assert result.video_id == "video_123"
+        assert callback.await_count == 3
+
     @pytest.mark.asyncio
     async def test_generate_video_from_script_tts_error(
         self, media_service, mock_elevenlabs_client, sample_video_script
@@ -413,6 +529,223 @@ class TestGenerateVideoFromScript:
             await media_service.generate_video_from_script(sample_video_script)
 
 
+class TestCancelVideoJob:
+    """Tests for tearing down HeyGen videos on cancellation."""
+
+    def test_cancel_video_job_deletes_video(self, media_service, mock_heygen_client):
+        """Test cancel_video_job deletes the video."""
+        assert media_service.cancel_video_job("video_123") is True
+        mock_heygen_client.delete_video.assert_called_once_with("video_123")
+
+    def test_cancel_video_job_failure_not_raised(self, media_service, mock_heygen_client):
+        """Test a failed deletion is reported, not raised."""
+        mock_heygen_client.delete_video.side_effect = VideoGenerationError("Delete failed")
+
+        assert media_service.cancel_video_job("video_123") is False
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_deletes_video(
+        self, media_service, mock_heygen_client, sample_video_script
+    ):
+        """Test cancelling while waiting for the render deletes the HeyGen video."""
+        waiting = asyncio.Event()
+
+        async def wait_forever(**kwargs):
+            waiting.set()
+            await asyncio.sleep(60)
+
+        mock_heygen_client.wait_for_video.side_effect = wait_forever
+
+        task = asyncio.create_task(media_service.generate_video_from_script(sample_video_script))
+        await waiting.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        mock_heygen_client.delete_video.assert_called_once_with("video_123")
+
+
+class TestCoalescingNotifier:
+    """Tests for background progress message delivery."""
+
+    @pytest.mark.asyncio
+    async def test_messages_posted_during_delivery_are_coalesced(self):
+        """Test that only the latest message is sent after a slow delivery."""
+        delivered = []
+        release = asyncio.Event()
+
+        async def slow_sink(msg: str):
+            delivered.append(msg)
+            await release.wait()
+
+        notifier = _CoalescingNotifier(slow_sink)
+        notifier.post("first")
+        await asyncio.sleep(0)
+        notifier.post("second")
+        notifier.post("third")
+        release.set()
+        await notifier.aclose()
+
+        assert delivered == ["first", "third"]
+
+    @pytest.mark.asyncio
+    async def test_post_without_callback_is_noop(self):
+        """Test that posting with no callback does nothing."""
+        notifier = _CoalescingNotifier(None)
+        notifier.post("ignored")
+        await notifier.aclose()
+
+
+class TestAudioAssetCache:
+    """Tests for reusing uploaded audio for identical scripts."""
+
+    @pytest.mark.asyncio
+    async def test_identical_script_reuses_uploaded_audio(
+        self, media_service, mock_elevenlabs_client, mock_heygen_client, sample_video_script
+    ):
+        """Test that a repeated script skips TTS and upload."""
+        first = await media_service.generate_video_from_script(
+            sample_video_script, wait_for_completion=False
+        )
+        second = await media_service.generate_video_from_script(
+            sample_video_script, wait_for_completion=False
+        )
+
+        assert second.audio_asset == first.audio_asset
+        assert second.audio_data == first.audio_data
+        mock_elevenlabs_client.text_to_speech.assert_called_once()
+        mock_heygen_client.upload_audio.assert_called_once()
+        assert mock_heygen_client.generate_video.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_regenerates_audio(
+        self, media_service, mock_elevenlabs_client, sample_video_script
+    ):
+        """Test that audio is regenerated once the cache entry expires."""
+        with patch("reddit_flow.services.media_service.time.monotonic", return_value=0.0):
+            await media_service.generate_video_from_script(
+                sample_video_script, wait_for_completion=False
+            )
+        with patch(
+            "reddit_flow.services.media_service.time.monotonic",
+            return_value=media_service.audio_cache_ttl + 1,
+        ):
+            await media_service.generate_video_from_script(
+                sample_video_script, wait_for_completion=False
+            )
+
+        assert mock_elevenlabs_client.text_to_speech.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_ttl(
+        self, mock_elevenlabs_client, mock_heygen_client, mock_prod_settings, sample_video_script
+    ):
+        """Test that a zero TTL disables the cache."""
+        service = MediaService(
+            elevenlabs_client=mock_elevenlabs_client,
+            heygen_client=mock_heygen_client,
+            settings=mock_prod_settings,
+            audio_cache_ttl=0,
+        )
+
+        for _ in range(2):
+            await service.generate_video_from_script(sample_video_script, wait_for_completion=False)
+
+        assert mock_elevenlabs_client.text_to_speech.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_audio_is_evicted(
+        self, mock_elevenlabs_client, mock_heygen_client, mock_prod_settings
+    ):
+        """Test the cache keeps at most audio_cache_max_entries entries."""
+        service = MediaService(
+            elevenlabs_client=mock_elevenlabs_client,
+            heygen_client=mock_heygen_client,
+            settings=mock_prod_settings,
+            audio_cache_max_entries=2,
+        )
+        scripts = [
+            VideoScript(script=f"Script number {i} " * 5, title=f"Title {i}") for i in range(3)
+        ]
+
+        for script in scripts:
+            await service.generate_video_from_script(script, wait_for_completion=False)
+        await service.generate_video_from_script(scripts[0], wait_for_completion=False)
+
+        assert len(service._audio_cache) == 2
+        # The first script was evicted by the third, so it is voiced again
+        assert mock_elevenlabs_client.text_to_speech.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_audio_is_dropped_on_insert(self, media_service, sample_video_script):
+        """Test storing new audio removes entries whose TTL has passed."""
+        with patch("reddit_flow.services.media_service.time.monotonic", return_value=0.0):
+            await media_service.generate_video_from_script(
+                sample_video_script, wait_for_completion=False
+            )
+        other = VideoScript(script="A different script entirely " * 5, title="Other")
+        with patch(
+            "reddit_flow.services.media_service.time.monotonic",
+            return_value=media_service.audio_cache_ttl + 1,
+        ):
+            await media_service.generate_video_from_script(other, wait_for_completion=False)
+
+        assert len(media_service._audio_cache) == 1
+
+
+class TestStreamAudioToHeyGen:
+    """Tests for the streamed TTS-to-HeyGen audio path."""
+
+    @pytest.fixture
+    def streaming_service(self, mock_elevenlabs_client, mock_heygen_client, mock_prod_settings):
+        """Create a MediaService with audio streaming enabled."""
+        mock_elevenlabs_client.text_to_speech_stream = MagicMock(
+            return_value=iter([b"fake_", b"audio"])
+        )
+        mock_heygen_client.upload_audio_stream = MagicMock(
+            side_effect=lambda chunks: AudioAsset(
+                url="https://heygen.com/audio/streamed",
+                file_size_bytes=len(b"".join(chunks)),
+            )
+        )
+        return MediaService(
+            elevenlabs_client=mock_elevenlabs_client,
+            heygen_client=mock_heygen_client,
+            settings=mock_prod_settings,
+            stream_audio=True,
+        )
+
+    def test_stream_audio_to_heygen_returns_audio_and_asset(
+        self, streaming_service, sample_video_script
+    ):
+        """Test that streamed chunks are uploaded and collected."""
+        audio_data, asset = streaming_service.stream_audio_to_heygen(sample_video_script)
+
+        assert audio_data == b"fake_audio"
+        assert asset.url == "https://heygen.com/audio/streamed"
+        assert asset.file_size_bytes == len(b"fake_audio")
+
+    def test_stream_audio_to_heygen_empty_script_raises_error(self, streaming_service):
+        """Test that empty script text is rejected before any API call."""
+        script = VideoScript.model_construct(script="   ", title="Empty")
+
+        with pytest.raises(TTSError, match="empty text"):
+            streaming_service.stream_audio_to_heygen(script)
+
+    @pytest.mark.asyncio
+    async def test_generate_video_from_script_uses_stream(
+        self, streaming_service, mock_elevenlabs_client, mock_heygen_client, sample_video_script
+    ):
+        """Test that the pipeline uses the streamed path when enabled."""
+        result = await streaming_service.generate_video_from_script(sample_video_script)
+
+        assert result.audio_data == b"fake_audio"
+        assert result.audio_asset.url == "https://heygen.com/audio/streamed"
+        mock_elevenlabs_client.text_to_speech.assert_not_called()
+        mock_heygen_client.upload_audio.assert_not_called()
+        mock_heygen_client.generate_video.assert_called_once()
+
+
 # =============================================================================
 # Generate from Text Tests
 # =============================================================================
@@ -499,6 +832,50 @@ class TestCheckVideoStatus:
         assert result["status"] == "failed"
         assert result["error_message"] == "Generation error"
 
+    def test_check_video_status_served_from_cache(self, media_service, mock_heygen_client):
+        """Test that a repeated check within the TTL skips the API call."""
+        first = media_service.check_video_status("video_123")
+        second = media_service.check_video_status("video_123")
+
+        assert second == first
+        mock_heygen_client.check_video_status.assert_called_once_with("video_123")
+
+    def test_check_video_status_refreshes_after_ttl(self, media_service, mock_heygen_client):
+        """Test that a stale cached status is refetched."""
+        with patch("reddit_flow.services.media_service.time.monotonic", return_value=0.0):
+            media_service.check_video_status("video_123")
+        with patch("reddit_flow.services.media_service.time.monotonic", return_value=1.0):
+            media_service.check_video_status("video_123")
+
+        assert mock_heygen_client.check_video_status.call_count == 2
+
+    def test_check_video_status_drops_stale_entries(self, media_service):
+        """Test caching a status removes entries for other videos past the TTL."""
+        with patch("reddit_flow.services.media_service.time.monotonic", return_value=0.0):
+            for i in range(5):
+                media_service.check_video_status(f"video_{i}")
+        with patch("reddit_flow.services.media_service.time.monotonic", return_value=1.0):
+            media_service.check_video_status("video_new")
+
+        assert list(media_service._status_cache) == ["video_new"]
+
+    @pytest.mark.asyncio
+    async def test_check_video_status_uses_wait_for_video_poll(
+        self, media_service, mock_heygen_client
+    ):
+        """Test that statuses seen by an in-flight wait are reused."""
+
+        async def fake_wait(video_id, update_callback, timeout, status_callback, **kwargs):
+            status_callback({"status": "processing"})
+            assert media_service.check_video_status(video_id)["status"] == "processing"
+            return "https://heygen.com/video/123.mp4"
+
+        mock_heygen_client.wait_for_video.side_effect = fake_wait
+
+        await media_service.wait_for_video("video_123")
+
+        mock_heygen_client.check_video_status.assert_not_called()
+
     def test_check_video_status_error_propagates(self, media_service, mock_heygen_client):
         """Test that status check errors are propagated."""
         mock_heygen_client.check_video_status.side_effect = VideoGenerationError(
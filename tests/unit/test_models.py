@@ -321,6 +321,11 @@ class TestScriptGenerationRequest:
             request = ScriptGenerationRequest(post_text="Test", style=style)
             assert request.style == style
 
+    def test_style_normalized_to_lowercase(self) -> None:
+        """Test mixed-case styles are normalized."""
+        request = ScriptGenerationRequest(post_text="Test", style="Formal")
+        assert request.style == "formal"
+
     def test_invalid_style_rejected(self) -> None:
         """Test that invalid style is rejected."""
         with pytest.raises(ValueError):
@@ -443,6 +448,36 @@ class TestVideoGenerationResponse:
         assert response.is_complete is False
         assert response.is_failed is True
 
+    def test_status_parsed_from_api_name(self) -> None:
+        """Test status accepts HeyGen API names and compares equal to them."""
+        response = VideoGenerationResponse(video_id="vid_123", status="processing")
+
+        assert response.status is VideoStatus.PROCESSING
+        assert response.status == "processing"
+        assert VideoStatus("completed") is VideoStatus.COMPLETED
+
+    def test_unknown_status_rejected(self) -> None:
+        """Test that unknown status names are rejected."""
+        with pytest.raises(ValueError):
+            VideoGenerationResponse(video_id="vid_123", status="exploded")
+
+    def test_status_serialized_as_name(self) -> None:
+        """Test status is dumped as its API name."""
+        response = VideoGenerationResponse(video_id="vid_123", status=VideoStatus.FAILED)
+
+        assert response.model_dump()["status"] == "failed"
+        assert '"status":"failed"' in response.model_dump_json()
+
+    def test_status_flags_not_serialized(self) -> None:
+        """Test status flags are plain properties, not part of the dump."""
+        response = VideoGenerationResponse(video_id="vid_123", status=VideoStatus.PROCESSING)
+        dumped = response.model_dump()
+
+        assert response.is_pending is True
+        assert "is_pending" not in dumped
+        assert "is_complete" not in dumped
+        assert "is_failed" not in dumped
+
 
 class TestYouTubeUploadRequest:
     """Tests for YouTubeUploadRequest model."""
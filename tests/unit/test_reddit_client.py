@@ -276,6 +276,7 @@ class TestRedditClientGetPostData:
         assert data["selftext"] == "This is the post body"
         assert "comments" in data
         assert isinstance(data["comments"], list)
+        assert data["num_comments"] == len(data["comments"])
 
     def test_get_post_data_comment_format(self, mock_praw_reddit, reddit_config, mock_submission):
         """Test that comments are formatted correctly in dict output."""
@@ -9,9 +9,19 @@ Tests cover:
 """
 
 import asyncio
+import builtins
+import gc
+import subprocess
+import sys
+import textwrap
+import threading
 import time
+import weakref
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
 
 import pytest
+from tenacity import wait_exponential, wait_random_exponential
 
 from reddit_flow.exceptions import RetryableError
 from reddit_flow.utils.retry import (
@@ -29,6 +39,9 @@ from reddit_flow.utils.retry import (
     RetryConfig,
     TimeoutConfig,
     TimeoutError,
+    _sync_retry_wrapper,
+    cached_retry,
+    resilient,
     timeout_decorator,
     with_retry,
     with_retry_sync,
@@ -36,6 +49,19 @@ from reddit_flow.utils.retry import (
     with_timeout_async,
 )
 
+
+def _double(x):
+    """Module-level function, so with_retry_sync caches its wrapper."""
+    return x * 2
+
+
+class _Doubler:
+    """Instances whose bound method is passed to with_retry_sync."""
+
+    def double(self, x):
+        return x * 2
+
+
 # =============================================================================
 # RetryConfig Tests
 # =============================================================================
@@ -86,6 +112,13 @@ class TestRetryConfig:
         assert CONSERVATIVE_RETRY_CONFIG.max_attempts == 2
         assert API_RETRY_CONFIG.max_attempts == 3
 
+    def test_config_is_immutable(self):
+        """Test configs are frozen so shared presets cannot be changed in place."""
+        with pytest.raises(FrozenInstanceError):
+            DEFAULT_RETRY_CONFIG.max_attempts = 10
+
+        assert not hasattr(DEFAULT_RETRY_CONFIG, "__dict__")
+
 
 # =============================================================================
 # with_retry Decorator Tests
@@ -171,6 +204,27 @@ class TestWithRetry:
 
         assert call_count == 1
 
+    def test_decorator_shared_per_policy(self):
+        """Test equal configs reuse one decorator and changed configs get a new one."""
+        config = RetryConfig(max_attempts=3, base_delay=0.01)
+
+        assert with_retry(config) is with_retry(RetryConfig(max_attempts=3, base_delay=0.01))
+
+        assert with_retry(config) is not with_retry(replace(config, max_attempts=4))
+
+    def test_jitter_randomizes_backoff(self):
+        """Test jitter selects full-jitter backoff and can be turned off."""
+
+        def func():
+            return None
+
+        jittered = with_retry(RetryConfig(jitter=True))(func)
+        fixed = with_retry(RetryConfig(jitter=False))(func)
+
+        assert isinstance(jittered.retry.wait, wait_random_exponential)
+        assert not isinstance(fixed.retry.wait, wait_random_exponential)
+        assert isinstance(fixed.retry.wait, wait_exponential)
+
 
 class TestWithRetrySync:
     """Tests for with_retry_sync function."""
@@ -200,6 +254,161 @@ class TestWithRetrySync:
         assert result == "ok"
         assert call_count == 2
 
+    def test_reuses_wrapper_for_same_function_and_policy(self):
+        """Test repeated calls reuse one retry wrapper per function and policy."""
+        config = RetryConfig(max_attempts=2, base_delay=0.01)
+        hits_before = _sync_retry_wrapper.cache_info().hits
+
+        assert [with_retry_sync(_double, config, n) for n in range(3)] == [0, 2, 4]
+        assert _sync_retry_wrapper.cache_info().hits - hits_before == 2
+
+    def test_bound_method_wrapper_does_not_keep_instance_alive(self):
+        """Test bound methods share their function's wrapper without caching the instance."""
+        config = RetryConfig(max_attempts=2, base_delay=0.01)
+        first, second = _Doubler(), _Doubler()
+        hits_before = _sync_retry_wrapper.cache_info().hits
+
+        assert with_retry_sync(first.double, config, 2) == 4
+        assert with_retry_sync(second.double, config, 3) == 6
+        assert _sync_retry_wrapper.cache_info().hits - hits_before == 1
+
+        instance_ref = weakref.ref(first)
+        del first
+        gc.collect()
+        assert instance_ref() is None
+
+    def test_closures_are_not_cached(self):
+        """Test per-call closures and lambdas bypass the wrapper cache."""
+        config = RetryConfig(max_attempts=2, base_delay=0.01)
+        size_before = _sync_retry_wrapper.cache_info().currsize
+
+        for n in range(3):
+            assert with_retry_sync(lambda: n * 2, config) == n * 2
+
+        assert _sync_retry_wrapper.cache_info().currsize == size_before
+
+    def test_unhashable_callable(self):
+        """Test callables that cannot be cached are still retried."""
+
+        class Unhashable:
+            __hash__ = None
+
+            def __call__(self):
+                return "ok"
+
+        assert with_retry_sync(Unhashable()) == "ok"
+
+
+class TestCachedRetry:
+    """Tests for cached_retry decorator."""
+
+    def test_caches_successful_result(self):
+        """Test repeated calls with the same arguments hit the cache."""
+        calls = []
+
+        @cached_retry(RetryConfig(max_attempts=2, base_delay=0.01), cache_ttl=60)
+        def lookup(item_id, suffix=""):
+            calls.append(item_id)
+            return f"{item_id}{suffix}"
+
+        assert lookup(1) == "1"
+        assert lookup(1) == "1"
+        assert lookup(1, suffix="!") == "1!"
+        assert calls == [1, 1]
+
+        lookup.cache_clear()
+        lookup(1)
+        assert calls == [1, 1, 1]
+
+    def test_retries_on_miss(self):
+        """Test a cache miss goes through the retry logic."""
+        attempts = 0
+
+        @cached_retry(RetryConfig(max_attempts=3, base_delay=0.01), cache_ttl=60)
+        def flaky():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 2:
+                raise RetryableError("Temporary failure")
+            return "ok"
+
+        assert flaky() == "ok"
+        assert flaky() == "ok"
+        assert attempts == 2
+
+    def test_entries_expire(self):
+        """Test cached results expire after the TTL."""
+        calls = 0
+
+        @cached_retry(cache_ttl=0.01)
+        def lookup():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert lookup() == 1
+        time.sleep(0.02)
+        assert lookup() == 2
+
+    def test_failures_cached_when_enabled(self):
+        """Test exhausted failures are replayed from the cache when enabled."""
+        calls = 0
+
+        @cached_retry(RetryConfig(max_attempts=1), cache_ttl=60, cache_failures=True)
+        def broken():
+            nonlocal calls
+            calls += 1
+            raise ValueError("down")
+
+        for _ in range(3):
+            with pytest.raises(ValueError, match="down"):
+                broken()
+        assert calls == 1
+
+    def test_failures_not_cached_by_default(self):
+        """Test failures are retried on the next call by default."""
+        calls = 0
+
+        @cached_retry(RetryConfig(max_attempts=1), cache_ttl=60)
+        def broken():
+            nonlocal calls
+            calls += 1
+            raise ValueError("down")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                broken()
+        assert calls == 2
+
+    def test_unhashable_arguments_bypass_cache(self):
+        """Test calls with unhashable arguments run uncached."""
+        calls = 0
+
+        @cached_retry(cache_ttl=60)
+        def total(values):
+            nonlocal calls
+            calls += 1
+            return sum(values)
+
+        assert total([1, 2]) == 3
+        assert total([1, 2]) == 3
+        assert calls == 2
+
+    def test_custom_key_and_eviction(self):
+        """Test key_fn controls the key and old entries are evicted when full."""
+        calls = []
+
+        @cached_retry(cache_ttl=60, key_fn=lambda url, **_: url.lower(), max_entries=1)
+        def fetch(url, trace_id=None):
+            calls.append(url)
+            return url.lower()
+
+        fetch("A", trace_id=1)
+        fetch("a", trace_id=2)
+        fetch("b")
+        fetch("a")
+        assert calls == ["A", "b", "a"]
+
 
 # =============================================================================
 # CircuitBreaker Tests
@@ -216,6 +425,14 @@ class TestCircuitBreakerConfig:
         assert config.success_threshold == 2
         assert config.timeout_seconds == 60.0
 
+    def test_excluded_exceptions_frozen(self):
+        """Test excluded exception types are stored as a frozenset."""
+        config = CircuitBreakerConfig(excluded_exceptions={KeyError})
+
+        assert config.excluded_exceptions == frozenset({KeyError})
+        assert isinstance(config.excluded_exceptions, frozenset)
+        assert CircuitBreakerConfig().excluded_exceptions == frozenset()
+
 
 class TestCircuitBreaker:
     """Tests for CircuitBreaker."""
@@ -260,6 +477,16 @@ class TestCircuitBreaker:
 
         assert breaker.state == CircuitState.HALF_OPEN
 
+    def test_open_timeout_uses_monotonic_clock(self):
+        """Test the open timeout is measured on the monotonic clock."""
+        breaker = CircuitBreaker("test_monotonic", CircuitBreakerConfig(failure_threshold=1))
+        breaker.record_failure(Exception("failure"))
+        assert breaker.state == CircuitState.OPEN
+
+        breaker._last_failure_time = time.monotonic() - 61.0
+
+        assert breaker.state == CircuitState.HALF_OPEN
+
     def test_closes_after_successes(self):
         """Test circuit closes after success threshold in half-open."""
         config = CircuitBreakerConfig(
@@ -296,6 +523,61 @@ class TestCircuitBreaker:
         breaker.record_failure(Exception("failure"))
         assert breaker.state == CircuitState.OPEN
 
+    def test_half_open_admits_one_probe_at_a_time(self):
+        """Test only one request goes through while a half-open probe is running."""
+        config = CircuitBreakerConfig(failure_threshold=1, timeout_seconds=0.01)
+        breaker = CircuitBreaker("test_single_probe", config)
+
+        breaker.record_failure(Exception("failure"))
+        time.sleep(0.02)
+
+        with breaker:
+            assert not breaker.is_available()
+            with pytest.raises(CircuitOpenError):
+                breaker.call(lambda: "second probe")
+
+        # Probe succeeded, so the next test request is admitted
+        assert breaker.is_available()
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_excluded_exception_frees_probe(self):
+        """Test an excluded exception during a probe lets the next request through."""
+        config = CircuitBreakerConfig(
+            failure_threshold=1,
+            timeout_seconds=0.01,
+            excluded_exceptions={KeyError},
+        )
+        breaker = CircuitBreaker("test_probe_excluded", config)
+
+        breaker.record_failure(Exception("failure"))
+        time.sleep(0.02)
+
+        with pytest.raises(KeyError):
+            with breaker:
+                raise KeyError("ignored")
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.is_available()
+
+    def test_closed_path_skips_lock(self):
+        """Test a healthy circuit admits and records calls without taking its lock."""
+
+        class FailingLock:
+            def __enter__(self):
+                raise AssertionError("lock taken on the closed fast path")
+
+            def __exit__(self, *exc):
+                return False
+
+        breaker = CircuitBreaker("test_fast_path")
+        breaker._state_lock = FailingLock()
+
+        assert breaker.is_available()
+        assert breaker.call(lambda: "ok") == "ok"
+        with breaker:
+            pass
+
     def test_decorator_usage(self):
         """Test circuit breaker as decorator."""
         config = CircuitBreakerConfig(failure_threshold=2)
@@ -363,6 +645,18 @@ class TestCircuitBreaker:
         found = CircuitBreaker.get("test_registry")
         assert found is breaker
 
+    def test_same_name_shares_breaker(self):
+        """Test constructing a breaker with a used name returns the existing one."""
+        config = CircuitBreakerConfig(failure_threshold=1)
+        breaker = CircuitBreaker("test_shared", config)
+        breaker.record_failure(Exception("failure"))
+
+        again = CircuitBreaker("test_shared", CircuitBreakerConfig(failure_threshold=10))
+
+        assert again is breaker
+        assert again.config is config
+        assert again.state == CircuitState.OPEN
+
     def test_get_all_states(self):
         """Test getting all circuit states."""
         CircuitBreaker("test_state_1")
@@ -442,6 +736,49 @@ class TestWithTimeout:
         with pytest.raises(ValueError, match="error"):
             with_timeout(raises, 1.0)
 
+    def test_propagates_builtin_timeout_error(self):
+        """Test a TimeoutError raised by the function is not treated as a timeout."""
+
+        def raises():
+            raise builtins.TimeoutError("socket timed out")
+
+        with pytest.raises(builtins.TimeoutError, match="socket timed out") as exc_info:
+            with_timeout(raises, 1.0)
+
+        assert not isinstance(exc_info.value, TimeoutError)
+
+    def test_reuses_pooled_threads(self):
+        """Test calls run on shared pool threads instead of a new thread each."""
+        names = {with_timeout(lambda: threading.current_thread().name, 1.0) for _ in range(50)}
+
+        assert all(name.startswith("rf-timeout") for name in names)
+        assert len(names) < 50
+
+    def test_hung_call_does_not_block_interpreter_exit(self):
+        """Test the process still exits while a timed-out call is running."""
+        script = textwrap.dedent(
+            """
+            import time
+            from reddit_flow.utils.retry import TimeoutError, with_timeout
+
+            try:
+                with_timeout(lambda: time.sleep(30), 0.2)
+            except TimeoutError:
+                print("timed out")
+            """
+        )
+
+        completed = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+            timeout=20,
+        )
+
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.strip() == "timed out"
+
 
 class TestWithTimeoutAsync:
     """Tests for with_timeout_async function."""
@@ -467,6 +804,87 @@ class TestWithTimeoutAsync:
         with pytest.raises(TimeoutError):
             await with_timeout_async(slow_coro(), timeout=0.1)
 
+    @pytest.mark.asyncio
+    async def test_runs_in_calling_task(self):
+        """Test the coroutine runs in the caller's task rather than a new one."""
+
+        async def current_task():
+            return asyncio.current_task()
+
+        assert await with_timeout_async(current_task(), timeout=1.0) is asyncio.current_task()
+
+    @pytest.mark.asyncio
+    async def test_propagates_coroutine_timeout_error(self):
+        """Test a TimeoutError raised by the coroutine is not treated as a timeout."""
+
+        async def raises():
+            raise builtins.TimeoutError("upstream timed out")
+
+        with pytest.raises(builtins.TimeoutError, match="upstream timed out") as exc_info:
+            await with_timeout_async(raises(), timeout=1.0)
+
+        assert not isinstance(exc_info.value, TimeoutError)
+
+
+class TestResilient:
+    """Tests for resilient decorator."""
+
+    def test_retries_through_breaker(self):
+        """Test failed attempts are retried and each one reaches the breaker."""
+        breaker = CircuitBreaker("test_resilient_retry", CircuitBreakerConfig(failure_threshold=5))
+        attempts = 0
+
+        @resilient(retry=RetryConfig(max_attempts=3, base_delay=0.01), breaker=breaker)
+        def flaky():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise RetryableError("Temporary failure")
+            return "ok"
+
+        assert flaky() == "ok"
+        assert attempts == 3
+        assert breaker._failure_count == 0
+        assert flaky.__name__ == "flaky"
+
+    def test_open_breaker_skips_call(self):
+        """Test an open circuit rejects the call without running it."""
+        breaker = CircuitBreaker("test_resilient_open", CircuitBreakerConfig(failure_threshold=1))
+        breaker.record_failure(Exception("failure"))
+        called = False
+
+        @resilient(retry=RetryConfig(max_attempts=3, base_delay=0.01), breaker=breaker)
+        def guarded():
+            nonlocal called
+            called = True
+
+        with pytest.raises(CircuitOpenError):
+            guarded()
+        assert not called
+
+    def test_timeout_counts_as_breaker_failure(self):
+        """Test a timed-out attempt raises TimeoutError and is recorded as a failure."""
+        breaker = CircuitBreaker(
+            "test_resilient_timeout", CircuitBreakerConfig(failure_threshold=1)
+        )
+
+        @resilient(timeout=0.05, breaker=breaker)
+        def slow():
+            time.sleep(0.5)
+
+        with pytest.raises(TimeoutError):
+            slow()
+        assert breaker.state == CircuitState.OPEN
+
+    def test_passes_timeout_keyword_to_function(self):
+        """Test a function's own timeout argument is not taken by the wrapper."""
+
+        @resilient(timeout=1.0)
+        def fetch(url, timeout=None):
+            return url, timeout
+
+        assert fetch("https://example.com", timeout=5) == ("https://example.com", 5)
+
 
 class TestTimeoutDecorator:
     """Tests for timeout_decorator."""
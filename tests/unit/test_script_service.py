@@ -17,7 +17,7 @@ import pytest
 
 from reddit_flow.exceptions import AIGenerationError, ContentError
 from reddit_flow.models import RedditComment, RedditPost, VideoScript
-from reddit_flow.services.script_service import ScriptService
+from reddit_flow.services.script_service import ScriptService, _default_gemini_client
 
 # =============================================================================
 # Fixtures
@@ -163,6 +163,22 @@ class TestScriptServiceInit:
             assert service._gemini_client is None
             # We can't test actual lazy loading without mocking GeminiClient init
 
+    def test_default_gemini_client_shared_between_services(self):
+        """Test that services without an explicit client share one GeminiClient."""
+        _default_gemini_client.cache_clear()
+        try:
+            with (
+                patch("reddit_flow.services.script_service.logger"),
+                patch("reddit_flow.services.script_service.GeminiClient") as MockGemini,
+            ):
+                first, second = ScriptService(), ScriptService()
+
+                assert first.gemini_client is second.gemini_client
+
+            MockGemini.assert_called_once()
+        finally:
+            _default_gemini_client.cache_clear()
+
 
 # =============================================================================
 # Generate Script from RedditPost Tests
@@ -405,6 +421,33 @@ class TestGenerateScriptFromDict:
         call_kwargs = mock_gemini_client.generate_script.call_args.kwargs
         assert len(call_kwargs["comments_data"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_generate_script_from_dict_skips_empty_before_limit(
+        self,
+        mock_gemini_client,
+        sample_video_script,
+    ):
+        """Test comments without a body don't count toward max_comments."""
+        with patch("reddit_flow.services.script_service.logger"):
+            service = ScriptService(gemini_client=mock_gemini_client, max_comments=2)
+
+        content = {
+            "post": {"title": "Test", "selftext": "Content"},
+            "comments": [
+                {"body": "", "author": "u0"},
+                {"author": "u1"},
+                {"body": "Kept 1", "author": "u2", "score": 2},
+                {"body": "Kept 2", "author": "u3", "score": 3},
+                {"body": "Dropped", "author": "u4", "score": 4},
+            ],
+        }
+        mock_gemini_client.generate_script.return_value = sample_video_script
+
+        await service.generate_script_from_dict(content)
+
+        comments_data = mock_gemini_client.generate_script.call_args.kwargs["comments_data"]
+        assert [c["body"] for c in comments_data] == ["Kept 1", "Kept 2"]
+
     @pytest.mark.asyncio
     async def test_generate_script_from_dict_ai_error(
         self,
@@ -519,6 +562,23 @@ class TestFormatComments:
         result = service._format_comments(comments)
         assert len(result) == 3
 
+    def test_format_comments_deleted_do_not_count_toward_limit(self, mock_gemini_client):
+        """Test deleted comments are skipped before the limit is applied."""
+        with patch("reddit_flow.services.script_service.logger"):
+            service = ScriptService(gemini_client=mock_gemini_client, max_comments=2)
+
+        comments = [
+            RedditComment(id="c1", body="[deleted]", author="u1", score=1),
+            RedditComment(id="c2", body="[deleted]", author="u2", score=2),
+            RedditComment(id="c3", body="Third", author="u3", score=3),
+            RedditComment(id="c4", body="Fourth", author="u4", score=4),
+            RedditComment(id="c5", body="Fifth", author="u5", score=5),
+        ]
+
+        result = service._format_comments(comments)
+
+        assert [c["body"] for c in result] == ["Third", "Fourth"]
+
     def test_format_comments_empty_list(self, script_service):
         """Test formatting empty comment list."""
         result = script_service._format_comments([])
@@ -11,7 +11,12 @@ Tests cover:
 - Error handling
 """
 
+import io
+import json
+import os
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -19,7 +24,37 @@ import pytest
 
 from reddit_flow.exceptions import YouTubeUploadError
 from reddit_flow.models import VideoScript, YouTubeUploadResponse
-from reddit_flow.services.upload_service import UploadResult, UploadService
+from reddit_flow.services.upload_service import (
+    UploadResult,
+    UploadService,
+    _AtomicCleanup,
+    _BackgroundCallback,
+)
+
+# Ranged downloads write with os.pwrite, which Windows lacks
+requires_pwrite = pytest.mark.skipif(
+    not hasattr(os, "pwrite"), reason="ranged downloads need os.pwrite"
+)
+
+
+def _api_error(status, reason):
+    """Build a YouTubeUploadError wrapping a YouTube API HttpError."""
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    content = json.dumps({"error": {"message": reason, "errors": [{"reason": reason}]}})
+    cause = HttpError(httplib2.Response({"status": status}), content.encode())
+    error = YouTubeUploadError(f"YouTube upload failed: {cause}")
+    error.__cause__ = cause
+    return error
+
+
+def _network_error():
+    """Build a YouTubeUploadError caused by a dropped connection."""
+    error = YouTubeUploadError("Failed to upload video: Connection reset by peer")
+    error.__cause__ = ConnectionResetError("Connection reset by peer")
+    return error
+
 
 # =============================================================================
 # Fixtures
@@ -119,6 +154,15 @@ class TestUploadServiceInit:
             service = UploadService(youtube_client=mock_youtube_client)
             assert service.youtube_client is mock_youtube_client
 
+    def test_http_session_reused_with_retries(self, upload_service):
+        """Test that downloads share one pooled session that retries server errors."""
+        session = upload_service.http_session
+
+        assert upload_service.http_session is session
+        adapter = session.get_adapter("https://example.com/video.mp4")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
 
 # =============================================================================
 # Upload Video Tests
@@ -148,6 +192,19 @@ class TestUploadVideo:
                 title="Test Video",
             )
 
+    def test_upload_video_stats_file_once(self, upload_service, mock_youtube_client):
+        """Test that one getsize call covers both the existence check and the size."""
+        with (
+            patch("pathlib.Path.exists") as mock_exists,
+            patch("os.path.getsize", return_value=1024) as mock_getsize,
+        ):
+            upload_service.upload_video(file_path="/tmp/video.mp4", title="Test Video")
+
+        mock_getsize.assert_called_once_with("/tmp/video.mp4")
+        mock_exists.assert_not_called()
+        request = mock_youtube_client.upload_video_from_request.call_args.kwargs["request"]
+        assert request.file_path == "/tmp/video.mp4"
+
     def test_upload_video_with_tags(self, upload_service, mock_youtube_client, temp_video_file):
         """Test upload with tags."""
         upload_service.upload_video(
@@ -175,17 +232,25 @@ class TestUploadVideo:
     def test_upload_video_with_progress_callback(
         self, upload_service, mock_youtube_client, temp_video_file
     ):
-        """Test upload with progress callback."""
+        """Test that progress updates reach the callback from a background thread."""
         callback = MagicMock()
+        callback_threads = []
+        callback.side_effect = lambda progress: callback_threads.append(threading.get_ident())
+
+        def fake_upload(request, progress_callback):
+            progress_callback(50)
+            progress_callback(100)
+            return mock_youtube_client.upload_video_from_request.return_value
 
+        mock_youtube_client.upload_video_from_request.side_effect = fake_upload
         upload_service.upload_video(
             file_path=temp_video_file,
             title="Test Video",
             progress_callback=callback,
         )
 
-        call_args = mock_youtube_client.upload_video_from_request.call_args
-        assert call_args.kwargs["progress_callback"] is callback
+        assert [c.args for c in callback.call_args_list] == [(50,), (100,)]
+        assert threading.get_ident() not in callback_threads
 
     def test_upload_video_error_propagates(
         self, upload_service, mock_youtube_client, temp_video_file
@@ -277,37 +342,31 @@ class TestUploadFromUrl:
         with patch.object(
             upload_service, "_download_video", return_value="/tmp/video.mp4"
         ) as mock_download:
-            with patch.object(upload_service, "_cleanup_file") as mock_cleanup:
-                with patch("pathlib.Path.exists", return_value=True):
-                    with patch("pathlib.Path.stat") as mock_stat:
-                        mock_stat.return_value.st_size = 1024 * 1024
-
-                        result = upload_service.upload_from_url(
-                            video_url="https://example.com/video.mp4",
-                            title="Downloaded Video",
-                        )
-
-                        assert isinstance(result, UploadResult)
-                        assert result.video_id == "abc123"
-                        mock_download.assert_called_once()
-                        mock_cleanup.assert_called_once()
+            with patch("pathlib.Path.unlink") as mock_cleanup:
+                with patch("os.path.getsize", return_value=1024 * 1024):
+                    result = upload_service.upload_from_url(
+                        video_url="https://example.com/video.mp4",
+                        title="Downloaded Video",
+                    )
+
+                    assert isinstance(result, UploadResult)
+                    assert result.video_id == "abc123"
+                    mock_download.assert_called_once()
+                    mock_cleanup.assert_called_once()
 
     def test_upload_from_url_keep_local_file(self, upload_service, mock_youtube_client):
         """Test upload from URL keeping the local file."""
         with patch.object(upload_service, "_download_video", return_value="/tmp/video.mp4"):
-            with patch.object(upload_service, "_cleanup_file") as mock_cleanup:
-                with patch("pathlib.Path.exists", return_value=True):
-                    with patch("pathlib.Path.stat") as mock_stat:
-                        mock_stat.return_value.st_size = 1024 * 1024
+            with patch("pathlib.Path.unlink") as mock_cleanup:
+                with patch("os.path.getsize", return_value=1024 * 1024):
+                    result = upload_service.upload_from_url(
+                        video_url="https://example.com/video.mp4",
+                        title="Downloaded Video",
+                        keep_local_file=True,
+                    )
 
-                        result = upload_service.upload_from_url(
-                            video_url="https://example.com/video.mp4",
-                            title="Downloaded Video",
-                            keep_local_file=True,
-                        )
-
-                        assert result.local_file_path == "/tmp/video.mp4"
-                        mock_cleanup.assert_not_called()
+                    assert result.local_file_path == "/tmp/video.mp4"
+                    mock_cleanup.assert_not_called()
 
     def test_upload_from_url_cleanup_on_error(self, upload_service, mock_youtube_client):
         """Test that file is cleaned up on upload error."""
@@ -316,18 +375,15 @@ class TestUploadFromUrl:
         )
 
         with patch.object(upload_service, "_download_video", return_value="/tmp/video.mp4"):
-            with patch.object(upload_service, "_cleanup_file") as mock_cleanup:
-                with patch("pathlib.Path.exists", return_value=True):
-                    with patch("pathlib.Path.stat") as mock_stat:
-                        mock_stat.return_value.st_size = 1024 * 1024
-
-                        with pytest.raises(YouTubeUploadError):
-                            upload_service.upload_from_url(
-                                video_url="https://example.com/video.mp4",
-                                title="Downloaded Video",
-                            )
+            with patch("pathlib.Path.unlink") as mock_cleanup:
+                with patch("os.path.getsize", return_value=1024 * 1024):
+                    with pytest.raises(YouTubeUploadError):
+                        upload_service.upload_from_url(
+                            video_url="https://example.com/video.mp4",
+                            title="Downloaded Video",
+                        )
 
-                        mock_cleanup.assert_called_once()
+                    mock_cleanup.assert_called_once()
 
 
 # =============================================================================
@@ -335,6 +391,87 @@ class TestUploadFromUrl:
 # =============================================================================
 
 
+class TestUploadFromUrlStreaming:
+    """Tests for piping a video URL straight into the YouTube upload."""
+
+    @pytest.fixture
+    def streaming_service(self, mock_youtube_client, mock_prod_settings):
+        """Create an UploadService with streaming uploads enabled."""
+        mock_youtube_client.upload_video_stream.return_value = "stream123"
+        return UploadService(
+            youtube_client=mock_youtube_client,
+            settings=mock_prod_settings,
+            stream_uploads=True,
+        )
+
+    def test_upload_from_url_streams_without_temp_file(
+        self, streaming_service, mock_youtube_client
+    ):
+        """Test that a sized response body is handed to the client as a stream."""
+        mock_response = MagicMock()
+        mock_response.headers = {"Content-Length": "9"}
+        mock_response.raw = io.BytesIO(b"videodata")
+
+        with (
+            patch("requests.Session.get", return_value=mock_response),
+            patch.object(streaming_service, "_download_video") as mock_download,
+        ):
+            result = streaming_service.upload_from_url(
+                video_url="https://example.com/video.mp4",
+                title="  Streamed Video  ",
+            )
+
+        mock_download.assert_not_called()
+        call = mock_youtube_client.upload_video_stream.call_args.kwargs
+        assert call["stream"] is mock_response.raw
+        assert call["size"] == 9
+        assert call["title"] == "Streamed Video"
+        assert result.video_id == "stream123"
+        assert result.local_file_path is None
+        mock_response.close.assert_called()
+
+    def test_streaming_falls_back_without_content_length(
+        self, streaming_service, mock_youtube_client
+    ):
+        """Test that unknown sizes are downloaded to a temporary file first."""
+        mock_response = MagicMock()
+        mock_response.headers = {}
+
+        with (
+            patch("requests.Session.get", return_value=mock_response),
+            patch.object(
+                streaming_service, "_download_video", return_value="/tmp/video.mp4"
+            ) as mock_download,
+            patch("pathlib.Path.unlink"),
+            patch("os.path.getsize", return_value=1024),
+        ):
+            result = streaming_service.upload_from_url(
+                video_url="https://example.com/video.mp4",
+                title="Video",
+            )
+
+        mock_download.assert_called_once()
+        mock_youtube_client.upload_video_stream.assert_not_called()
+        assert result.video_id == "abc123"
+
+    def test_keep_local_file_uses_temp_file(self, streaming_service, mock_youtube_client):
+        """Test that keeping the local file bypasses streaming."""
+        with (
+            patch.object(
+                streaming_service, "_download_video", return_value="/tmp/video.mp4"
+            ) as mock_download,
+            patch("os.path.getsize", return_value=1024),
+        ):
+            result = streaming_service.upload_from_url(
+                video_url="https://example.com/video.mp4",
+                title="Video",
+                keep_local_file=True,
+            )
+
+        mock_download.assert_called_once()
+        assert result.local_file_path == "/tmp/video.mp4"
+
+
 class TestUploadFromUrlWithScript:
     """Tests for downloading and uploading with script metadata."""
 
@@ -343,18 +480,201 @@ class TestUploadFromUrlWithScript:
     ):
         """Test successful download and upload with script metadata."""
         with patch.object(upload_service, "_download_video", return_value="/tmp/video.mp4"):
-            with patch.object(upload_service, "_cleanup_file"):
-                with patch("pathlib.Path.exists", return_value=True):
-                    with patch("pathlib.Path.stat") as mock_stat:
-                        mock_stat.return_value.st_size = 1024 * 1024
+            with patch("pathlib.Path.unlink"):
+                with patch("os.path.getsize", return_value=1024 * 1024):
+                    result = upload_service.upload_from_url_with_script(
+                        video_url="https://example.com/video.mp4",
+                        script=sample_video_script,
+                    )
 
-                        result = upload_service.upload_from_url_with_script(
-                            video_url="https://example.com/video.mp4",
-                            script=sample_video_script,
-                        )
+                    assert isinstance(result, UploadResult)
+                    assert result.video_id == "abc123"
+
+    def test_upload_from_url_with_script_forwards_download_progress(
+        self, upload_service, mock_youtube_client, sample_video_script
+    ):
+        """Test that the download progress callback reaches _download_video."""
+        callback = MagicMock()
+        with patch.object(
+            upload_service, "_download_video", return_value="/tmp/video.mp4"
+        ) as mock_download:
+            with patch("pathlib.Path.unlink"):
+                with patch("os.path.getsize", return_value=1024 * 1024):
+                    upload_service.upload_from_url_with_script(
+                        video_url="https://example.com/video.mp4",
+                        script=sample_video_script,
+                        download_progress_callback=callback,
+                    )
+
+        mock_download.assert_called_once_with(
+            "https://example.com/video.mp4", progress_callback=callback
+        )
+
+
+class TestUploadManyFromUrls:
+    """Tests for concurrent batch uploads."""
+
+    @staticmethod
+    def _result(video_id):
+        return UploadResult(
+            video_id=video_id,
+            title="Video",
+            url=f"https://youtube.com/watch?v={video_id}",
+            studio_url=f"https://studio.youtube.com/video/{video_id}/edit",
+        )
+
+    def test_results_follow_job_order(self, upload_service, sample_video_script):
+        """Test that results line up with jobs even when they finish out of order."""
+        delays = {"https://example.com/a.mp4": 0.05, "https://example.com/b.mp4": 0.0}
+
+        def fake_upload(video_url, script, privacy_status=None):
+            time.sleep(delays[video_url])
+            return self._result(video_url[-5])
+
+        jobs = [(url, sample_video_script) for url in delays]
+        with patch.object(upload_service, "upload_from_url_with_script", side_effect=fake_upload):
+            results = upload_service.upload_many_from_urls(jobs, max_concurrency=2)
+
+        assert [r.video_id for r in results] == ["a", "b"]
+
+    def test_transient_errors_are_retried(self, upload_service, sample_video_script):
+        """Test that a failed upload is retried with backoff."""
+        upload_service.BATCH_RETRY_BASE_DELAY = 0
+        with patch.object(
+            upload_service,
+            "upload_from_url_with_script",
+            side_effect=[
+                _network_error(),
+                _api_error(503, "backendError"),
+                self._result("ok"),
+            ],
+        ) as mock_upload:
+            results = upload_service.upload_many_from_urls(
+                [("https://example.com/a.mp4", sample_video_script)]
+            )
+
+        assert [r.video_id for r in results] == ["ok"]
+        assert mock_upload.call_count == 3
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            YouTubeUploadError("Video file not found: /tmp/missing.mp4"),
+            YouTubeUploadError("Failed to authenticate with YouTube: invalid_grant"),
+            _api_error(403, "forbidden"),
+        ],
+    )
+    def test_permanent_errors_are_not_retried(self, upload_service, sample_video_script, error):
+        """Test that missing files, auth failures and 4xx replies are not retried."""
+        upload_service.BATCH_RETRY_BASE_DELAY = 0
+        with patch.object(
+            upload_service, "upload_from_url_with_script", side_effect=error
+        ) as mock_upload:
+            with pytest.raises(YouTubeUploadError, match="1 of 1 uploads failed"):
+                upload_service.upload_many_from_urls(
+                    [("https://example.com/a.mp4", sample_video_script)]
+                )
+
+        assert mock_upload.call_count == 1
+
+    def test_quota_errors_are_not_retried(self, upload_service, sample_video_script):
+        """Test that exhausted quota fails the job at once and is reported."""
+        upload_service.BATCH_RETRY_BASE_DELAY = 0
+
+        def fake_upload(video_url, script, privacy_status=None):
+            if video_url.endswith("b.mp4"):
+                raise _api_error(403, "quotaExceeded")
+            return self._result("a")
+
+        jobs = [
+            ("https://example.com/a.mp4", sample_video_script),
+            ("https://example.com/b.mp4", sample_video_script),
+        ]
+        with patch.object(
+            upload_service, "upload_from_url_with_script", side_effect=fake_upload
+        ) as mock_upload:
+            with pytest.raises(YouTubeUploadError, match="1 of 2 uploads failed") as exc_info:
+                upload_service.upload_many_from_urls(jobs)
+
+        assert mock_upload.call_count == 2
+        assert exc_info.value.details["uploaded"] == ["a"]
+        assert exc_info.value.details["failed"][0]["url"] == "https://example.com/b.mp4"
+
+    def test_workers_use_their_own_http_sessions(self, upload_service, sample_video_script):
+        """Test each worker thread downloads with its own session, closed afterwards."""
+        both_running = threading.Barrier(2, timeout=5)
+        sessions = {}
+
+        def fake_upload(video_url, script, privacy_status=None):
+            both_running.wait()
+            sessions[video_url] = upload_service.http_session
+            return self._result(video_url[-5])
+
+        jobs = [
+            ("https://example.com/a.mp4", sample_video_script),
+            ("https://example.com/b.mp4", sample_video_script),
+        ]
+        with (
+            patch.object(upload_service, "upload_from_url_with_script", side_effect=fake_upload),
+            patch("requests.Session.close", autospec=True) as mock_close,
+        ):
+            upload_service.upload_many_from_urls(jobs, max_concurrency=2)
+
+        first, second = sessions.values()
+        assert first is not second
+        assert {call.args[0] for call in mock_close.call_args_list} == {first, second}
+        # The calling thread keeps using the service's shared session
+        assert upload_service.http_session not in (first, second)
+
+    def test_empty_batch(self, upload_service):
+        """Test that an empty batch does nothing."""
+        assert upload_service.upload_many_from_urls([]) == []
+
+    def test_invalid_concurrency(self, upload_service):
+        """Test that max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            upload_service.upload_many_from_urls([], max_concurrency=0)
+
+
+class TestUploadSkippedOutsideProd:
+    """Tests for the non-prod short-circuit."""
+
+    @pytest.fixture
+    def dev_service(self, mock_youtube_client):
+        """Create an UploadService running in dev mode."""
+        settings = MagicMock()
+        settings.env = "dev"
+        return UploadService(youtube_client=mock_youtube_client, settings=settings)
+
+    def test_upload_from_script_skips_metadata(
+        self, dev_service, mock_youtube_client, sample_video_script
+    ):
+        """Test that no description is built when the upload is skipped."""
+        with patch.object(dev_service, "_build_description_from_script") as mock_build:
+            result = dev_service.upload_from_script("/tmp/video.mp4", sample_video_script)
+
+        mock_build.assert_not_called()
+        mock_youtube_client.upload_video_from_request.assert_not_called()
+        assert result.video_id == "test_video_id"
+        assert result.title == "Amazing Reddit Story"
 
-                        assert isinstance(result, UploadResult)
-                        assert result.video_id == "abc123"
+    def test_upload_from_url_with_script_skips_metadata(
+        self, dev_service, mock_youtube_client, sample_video_script
+    ):
+        """Test that neither the description nor the download happen in dev."""
+        with (
+            patch.object(dev_service, "_build_description_from_script") as mock_build,
+            patch.object(dev_service, "_download_video") as mock_download,
+        ):
+            result = dev_service.upload_from_url_with_script(
+                video_url="https://example.com/video.mp4",
+                script=sample_video_script,
+            )
+
+        mock_build.assert_not_called()
+        mock_download.assert_not_called()
+        assert result.video_id == "test_video_id"
+        assert result.local_file_path is None
 
 
 # =============================================================================
@@ -466,6 +786,16 @@ class TestBuildDescriptionFromScript:
         result = upload_service._build_description_from_script(sample_video_script)
         assert "Generated with AI" in result
 
+    def test_build_description_without_source_has_no_leading_whitespace(self, upload_service):
+        """Test that the first section starts the description without a separator."""
+        script = VideoScript(script="Summary text", title="Title")
+        with patch.object(upload_service, "_format_description") as mock_format:
+            result = upload_service._build_description_from_script(script, "  extra  ")
+        mock_format.assert_not_called()
+        assert result.startswith("Summary text\n")
+        assert result == result.strip()
+        assert "\n  extra  \n" in result
+
 
 # =============================================================================
 # Download Video Tests
@@ -478,21 +808,256 @@ class TestDownloadVideo:
     def test_download_video_success(self, upload_service):
         """Test successful video download."""
         mock_response = MagicMock()
-        mock_response.iter_content.return_value = [b"video", b"data"]
+        mock_response.raw = io.BytesIO(b"videodata")
         mock_response.raise_for_status = MagicMock()
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("requests.Session.get", return_value=mock_response):
             result = upload_service._download_video("https://example.com/video.mp4")
 
             assert result.endswith(".mp4")
             # Clean up
             Path(result).unlink()
 
+    def test_download_video_copies_raw_stream(self, upload_service):
+        """Test that the raw body is decoded and copied to disk, then closed."""
+        mock_response = MagicMock()
+        mock_response.raw = io.BytesIO(b"videodata")
+
+        with patch("requests.Session.get", return_value=mock_response):
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert Path(result).read_bytes() == b"videodata"
+            assert mock_response.raw.decode_content is True
+            mock_response.close.assert_called()
+        finally:
+            Path(result).unlink()
+
+    @staticmethod
+    def _range_server(payload, honour_ranges=True):
+        """Build a fake requests.get that serves byte ranges of payload."""
+
+        def fake_get(url, headers=None, stream=False, timeout=None):
+            response = MagicMock()
+            range_header = (headers or {}).get("Range")
+            if range_header and honour_ranges:
+                start, end = (int(x) for x in range_header[len("bytes=") :].split("-"))
+                body = payload[start : end + 1]
+                response.status_code = 206
+                response.headers = {"Content-Range": f"bytes {start}-{end}/{len(payload)}"}
+            else:
+                body = payload
+                response.status_code = 200
+                response.headers = {}
+            response.raw = io.BytesIO(body)
+            return response
+
+        return fake_get
+
+    @requires_pwrite
+    def test_download_video_parallel_ranges(self, upload_service):
+        """Test that range-capable servers are downloaded in parallel parts."""
+        payload = bytes(range(256)) * 4
+        upload_service.PARALLEL_DOWNLOAD_MIN_SIZE = 0
+
+        with patch("requests.Session.get", side_effect=self._range_server(payload)) as mock_get:
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert Path(result).read_bytes() == payload
+            ranges = [c.kwargs["headers"]["Range"] for c in mock_get.call_args_list]
+            assert ranges[0] == "bytes=0-0"
+            assert len(ranges) == 1 + upload_service.DOWNLOAD_WORKERS
+        finally:
+            Path(result).unlink()
+
+    @requires_pwrite
+    def test_download_video_ranges_use_their_own_http_sessions(self, upload_service):
+        """Test that each range thread downloads over a session of its own."""
+        payload = bytes(range(256)) * 4
+        upload_service.PARALLEL_DOWNLOAD_MIN_SIZE = 0
+        serve = self._range_server(payload)
+        range_sessions = []
+
+        def fake_get(session, url, headers=None, stream=False, timeout=None):
+            if headers and headers["Range"] != "bytes=0-0":
+                range_sessions.append(session)
+            return serve(url, headers=headers, stream=stream, timeout=timeout)
+
+        with (
+            patch("requests.Session.get", autospec=True, side_effect=fake_get),
+            patch("requests.Session.close", autospec=True) as mock_close,
+        ):
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert Path(result).read_bytes() == payload
+            assert len(range_sessions) == upload_service.DOWNLOAD_WORKERS
+            assert len({id(s) for s in range_sessions}) == len(range_sessions)
+            assert upload_service.http_session not in range_sessions
+            closed = [c.args[0] for c in mock_close.call_args_list]
+            assert all(any(s is c for c in closed) for s in range_sessions)
+        finally:
+            Path(result).unlink()
+
+    @requires_pwrite
+    def test_download_video_small_file_uses_single_stream(self, upload_service):
+        """Test that files below the parallel threshold use one connection."""
+        payload = b"small video"
+
+        with patch("requests.Session.get", side_effect=self._range_server(payload)) as mock_get:
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert Path(result).read_bytes() == payload
+            assert mock_get.call_count == 2  # probe + single stream
+        finally:
+            Path(result).unlink()
+
+    def test_download_video_falls_back_without_range_support(self, upload_service):
+        """Test that servers ignoring Range headers get a single-stream download."""
+        payload = b"x" * 100
+        upload_service.PARALLEL_DOWNLOAD_MIN_SIZE = 0
+
+        with patch(
+            "requests.Session.get", side_effect=self._range_server(payload, honour_ranges=False)
+        ):
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert Path(result).read_bytes() == payload
+        finally:
+            Path(result).unlink()
+
+    def test_download_video_writes_partial_reads(self, upload_service):
+        """Test that short reads from read1 are written as they arrive."""
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.raw.read1.side_effect = [b"vid", b"eo", b"data", b""]
+
+        with patch("requests.Session.get", return_value=mock_response):
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert Path(result).read_bytes() == b"videodata"
+            mock_response.raw.read.assert_not_called()
+        finally:
+            Path(result).unlink()
+
+    def test_download_video_preallocates_known_size(self, upload_service):
+        """Test that a known Content-Length is reserved and unused space trimmed."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "64"}
+        mock_response.raw = io.BytesIO(b"videodata")
+
+        with (
+            patch("requests.Session.get", return_value=mock_response),
+            patch.object(
+                UploadService, "_preallocate", side_effect=UploadService._preallocate
+            ) as preallocate,
+        ):
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert preallocate.call_args.args[1] == 64
+            assert Path(result).read_bytes() == b"videodata"
+        finally:
+            Path(result).unlink()
+
+    def test_download_video_reports_progress(self, upload_service):
+        """Test that the single-stream download reports progress per threshold."""
+        payload = b"v" * ((1 << 20) * 2 + 10)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": str(len(payload))}
+        mock_response.raw = io.BytesIO(payload)
+        progress = []
+
+        with patch("requests.Session.get", return_value=mock_response):
+            result = upload_service._download_video(
+                "https://example.com/video.mp4",
+                progress_callback=lambda done, total: progress.append((done, total)),
+            )
+
+        try:
+            assert progress == [
+                (1 << 20, len(payload)),
+                (2 << 20, len(payload)),
+                (len(payload), len(payload)),
+            ]
+        finally:
+            Path(result).unlink()
+
+    @requires_pwrite
+    def test_download_video_parallel_ranges_report_progress(self, upload_service):
+        """Test that parallel range downloads report the final byte count."""
+        payload = bytes(range(256)) * 4
+        upload_service.PARALLEL_DOWNLOAD_MIN_SIZE = 0
+        progress = []
+
+        with patch("requests.Session.get", side_effect=self._range_server(payload)):
+            result = upload_service._download_video(
+                "https://example.com/video.mp4",
+                progress_callback=lambda done, total: progress.append((done, total)),
+            )
+
+        try:
+            assert progress == [(len(payload), len(payload))]
+        finally:
+            Path(result).unlink()
+
+    def test_download_video_fallback_progress_never_goes_backwards(self, upload_service):
+        """Test a range answered with 200 restarts the count without reporting less."""
+        payload = b"v" * ((1 << 20) * 4)
+        upload_service.PARALLEL_DOWNLOAD_MIN_SIZE = 0
+        serve_ranges = self._range_server(payload)
+        serve_full = self._range_server(payload, honour_ranges=False)
+        last_range = f"bytes={len(payload) * 3 // 4}-{len(payload) - 1}"
+        progress = []
+
+        def fake_get(url, headers=None, stream=False, timeout=None):
+            # The last range is answered with the whole body
+            if (headers or {}).get("Range") == last_range:
+                return serve_full(url, headers, stream, timeout)
+            return serve_ranges(url, headers, stream, timeout)
+
+        with patch("requests.Session.get", side_effect=fake_get):
+            result = upload_service._download_video(
+                "https://example.com/video.mp4",
+                progress_callback=lambda done, total: progress.append(done),
+            )
+
+        try:
+            assert Path(result).read_bytes() == payload
+            assert progress == sorted(progress)
+            assert progress[-1] == len(payload)
+        finally:
+            Path(result).unlink()
+
+    def test_download_video_without_pwrite_skips_range_probe(self, upload_service, monkeypatch):
+        """Test no probe request is sent when ranged downloads cannot be written."""
+        payload = b"x" * 100
+        upload_service.PARALLEL_DOWNLOAD_MIN_SIZE = 0
+        monkeypatch.delattr("os.pwrite", raising=False)
+
+        with patch("requests.Session.get", side_effect=self._range_server(payload)) as mock_get:
+            result = upload_service._download_video("https://example.com/video.mp4")
+
+        try:
+            assert Path(result).read_bytes() == payload
+            assert mock_get.call_count == 1
+            assert "headers" not in mock_get.call_args.kwargs
+        finally:
+            Path(result).unlink()
+
     def test_download_video_request_error(self, upload_service):
         """Test download with request error."""
         import requests
 
-        with patch("requests.get", side_effect=requests.exceptions.RequestException("Failed")):
+        with patch(
+            "requests.Session.get", side_effect=requests.exceptions.RequestException("Failed")
+        ):
             with pytest.raises(YouTubeUploadError, match="Failed to download"):
                 upload_service._download_video("https://example.com/video.mp4")
 
@@ -532,19 +1097,73 @@ class TestVideoInfoAndDelete:
 # =============================================================================
 
 
-class TestCleanupFile:
-    """Tests for file cleanup functionality."""
+class TestBackgroundCallback:
+    """Tests for running progress callbacks off the transfer thread."""
+
+    def test_slow_callback_does_not_block_caller(self):
+        """Test that updates are queued while the callback is busy."""
+        release = threading.Event()
+        seen = []
+
+        def slow_callback(progress):
+            release.wait(5)
+            seen.append(progress)
+
+        with _BackgroundCallback(slow_callback) as background:
+            start = time.monotonic()
+            for progress in range(100):
+                background(progress)
+            assert time.monotonic() - start < 1
+            release.set()
+
+        # Oldest updates were dropped, but the final one was delivered
+        assert seen[-1] == 99
+        assert len(seen) <= _BackgroundCallback.QUEUE_SIZE + 1
+
+    def test_callback_errors_are_logged(self):
+        """Test that a failing callback does not break later updates."""
+        seen = []
+
+        def flaky_callback(progress):
+            if progress == 1:
+                raise RuntimeError("boom")
+            seen.append(progress)
 
-    def test_cleanup_existing_file(self, upload_service, temp_video_file):
-        """Test cleanup of existing file."""
+        with _BackgroundCallback(flaky_callback) as background:
+            background(1)
+            background(2)
+
+        assert seen == [2]
+
+
+class TestAtomicCleanup:
+    """Tests for temporary file cleanup."""
+
+    def test_cleanup_existing_file(self, temp_video_file):
+        """Test that the file is deleted when the block exits."""
         assert Path(temp_video_file).exists()
-        upload_service._cleanup_file(temp_video_file)
+        with _AtomicCleanup(temp_video_file):
+            pass
         assert not Path(temp_video_file).exists()
 
-    def test_cleanup_nonexistent_file(self, upload_service):
+    def test_cleanup_on_error(self, temp_video_file):
+        """Test that the file is deleted when the block raises."""
+        with pytest.raises(RuntimeError):
+            with _AtomicCleanup(temp_video_file):
+                raise RuntimeError("boom")
+        assert not Path(temp_video_file).exists()
+
+    def test_disarm_keeps_file(self, temp_video_file):
+        """Test that a disarmed cleanup leaves the file in place."""
+        with _AtomicCleanup(temp_video_file) as cleanup:
+            assert cleanup.disarm() == temp_video_file
+        assert Path(temp_video_file).exists()
+
+    def test_cleanup_nonexistent_file(self):
         """Test cleanup of non-existent file (no error)."""
         # Should not raise
-        upload_service._cleanup_file("/nonexistent/file.mp4")
+        with _AtomicCleanup("/nonexistent/file.mp4"):
+            pass
 
 
 # =============================================================================
@@ -9,6 +9,10 @@ Tests cover:
 - Utility functions (sanitize, truncate, extract)
 """
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from reddit_flow.utils.validators import (
     ValidationResult,
     extract_urls_from_text,
@@ -80,6 +84,17 @@ class TestValidationResult:
             passed = False
         assert passed is False
 
+    def test_result_is_immutable(self):
+        """Test results cannot be modified, so shared failure results stay intact."""
+        result = ValidationResult(is_valid=False, error="error")
+        with pytest.raises(FrozenInstanceError):
+            result.is_valid = True  # type: ignore[misc]
+
+    def test_fixed_failures_are_shared(self):
+        """Test failures with a fixed message reuse one result instance."""
+        assert validate_post_id("") is validate_post_id("")
+        assert parse_reddit_url("https://google.com") is parse_reddit_url("not a url")
+
 
 # =============================================================================
 # Reddit URL Validation Tests
@@ -208,6 +223,16 @@ class TestParseRedditUrl:
         assert result.is_valid is True
         assert result.value["subreddit"] == "test"
 
+    def test_parse_extracts_ids_for_each_form(self):
+        """Test each URL form pulls its own subreddit and ID out of the combined pattern."""
+        standard = parse_reddit_url("https://reddit.com/r/python/comments/ABC123/")
+        short = parse_reddit_url("https://redd.it/xyz789")
+        share = parse_reddit_url("https://www.reddit.com/r/news/s/ShareId9")
+
+        assert (standard.value["subreddit"], standard.value["post_id"]) == ("python", "abc123")
+        assert (short.value["subreddit"], short.value["post_id"]) == (None, "xyz789")
+        assert (share.value["subreddit"], share.value["post_id"]) == ("news", "ShareId9")
+
 
 # =============================================================================
 # Subreddit Validation Tests
@@ -415,6 +440,13 @@ class TestValidateScriptContent:
         assert result.is_valid is False
         assert "special characters" in result.error
 
+    def test_special_char_ratio_ascii_and_unicode(self):
+        """Test the ASCII fast path and the Unicode path count special characters alike."""
+        # ",", "!" and "_" are special; letters, digits and whitespace are not
+        for script in (",!_ab", ",!_éé"):
+            result = validate_script_content(script, min_words=1)
+            assert result.details == {"special_char_ratio": 3 / 5}
+
     def test_whitespace_trimmed(self):
         """Test script whitespace is trimmed."""
         script = "  This is a test script with padding  "
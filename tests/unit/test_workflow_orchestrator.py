@@ -11,6 +11,10 @@ Tests cover:
 - Callback handling
 """
 
+import asyncio
+import subprocess
+import sys
+import threading
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -32,10 +36,12 @@ from reddit_flow.services.media_service import MediaGenerationResult
 from reddit_flow.services.upload_service import UploadResult
 from reddit_flow.services.workflow_orchestrator import (
     StepResult,
+    WorkflowCache,
     WorkflowOrchestrator,
     WorkflowResult,
     WorkflowStatus,
     WorkflowStep,
+    fire_and_collect,
 )
 
 # =============================================================================
@@ -262,6 +268,36 @@ class TestWorkflowResult:
         assert result.duration_seconds is not None
         assert result.duration_seconds >= 0
 
+    def test_results_use_slots(self):
+        """Test result objects carry no per-instance __dict__."""
+        step = StepResult(step=WorkflowStep.PARSE_URL, status=WorkflowStatus.COMPLETED)
+        result = WorkflowResult(workflow_id="wf_001")
+
+        assert not hasattr(step, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown_field = 1
+
+    def test_duration_uses_monotonic_clock(self):
+        """Test duration comes from the monotonic clock once finished."""
+        result = WorkflowResult(workflow_id="wf_001", started_ns=1_000_000_000)
+        result.mark_finished()
+        result.completed_ns = 3_500_000_000
+
+        assert result.duration_seconds == 2.5
+        assert isinstance(result.completed_at, datetime)
+
+    def test_get_step_returns_latest_result(self):
+        """Test get_step finds the most recent result for a step."""
+        result = WorkflowResult(workflow_id="wf_001")
+        assert result.get_step(WorkflowStep.PARSE_URL) is None
+
+        failed = StepResult(step=WorkflowStep.PARSE_URL, status=WorkflowStatus.FAILED)
+        retried = StepResult(step=WorkflowStep.PARSE_URL, status=WorkflowStatus.COMPLETED)
+        result.steps.extend([failed, retried])
+
+        assert result.get_step(WorkflowStep.PARSE_URL) is retried
+        assert result.get_step(WorkflowStep.UPLOAD_VIDEO) is None
+
 
 # =============================================================================
 # WorkflowOrchestrator Initialization Tests
@@ -302,7 +338,7 @@ class TestWorkflowOrchestratorInit:
         """Test lazy loading of ContentService."""
         orchestrator = WorkflowOrchestrator()
 
-        with patch("reddit_flow.services.workflow_orchestrator.ContentService") as MockService:
+        with patch("reddit_flow.services.content_service.ContentService") as MockService:
             MockService.return_value = MagicMock()
             service = orchestrator.content_service
             MockService.assert_called_once()
@@ -312,7 +348,7 @@ class TestWorkflowOrchestratorInit:
         """Test lazy loading of ScriptService."""
         orchestrator = WorkflowOrchestrator()
 
-        with patch("reddit_flow.services.workflow_orchestrator.ScriptService") as MockService:
+        with patch("reddit_flow.services.script_service.ScriptService") as MockService:
             MockService.return_value = MagicMock()
             service = orchestrator.script_service
             MockService.assert_called_once()
@@ -322,7 +358,7 @@ class TestWorkflowOrchestratorInit:
         """Test lazy loading of MediaService."""
         orchestrator = WorkflowOrchestrator()
 
-        with patch("reddit_flow.services.workflow_orchestrator.MediaService") as MockService:
+        with patch("reddit_flow.services.media_service.MediaService") as MockService:
             MockService.return_value = MagicMock()
             service = orchestrator.media_service
             MockService.assert_called_once()
@@ -332,12 +368,23 @@ class TestWorkflowOrchestratorInit:
         """Test lazy loading of UploadService."""
         orchestrator = WorkflowOrchestrator()
 
-        with patch("reddit_flow.services.workflow_orchestrator.UploadService") as MockService:
+        with patch("reddit_flow.services.upload_service.UploadService") as MockService:
             MockService.return_value = MagicMock()
             service = orchestrator.upload_service
             MockService.assert_called_once()
             assert orchestrator._upload_service is service
 
+    def test_import_does_not_load_service_clients(self):
+        """Test importing the orchestrator leaves the client SDK modules unloaded."""
+        code = (
+            "import sys\n"
+            "import reddit_flow.services.workflow_orchestrator\n"
+            "heavy = ('praw', 'google.generativeai', 'reddit_flow.clients.reddit_client')\n"
+            "loaded = [m for m in heavy if m in sys.modules]\n"
+            "assert not loaded, loaded\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
 
 # =============================================================================
 # WorkflowOrchestrator Workflow ID Tests
@@ -363,6 +410,37 @@ class TestWorkflowIdGeneration:
         assert len(parts) == 4  # wf, date, time, counter
         assert parts[0] == "wf"
 
+    def test_workflow_ids_unique_across_threads(self, orchestrator):
+        """Test concurrent callers never receive the same ID."""
+        ids = []
+
+        def generate():
+            ids.extend(orchestrator._generate_workflow_id() for _ in range(500))
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(ids)) == 2000
+
+    def test_workflow_id_timestamp_follows_clock(self, orchestrator):
+        """Test the timestamp is reused within a second and refreshed after it."""
+        start = datetime(2024, 1, 2, 3, 4, 5).timestamp()
+        clock = "reddit_flow.services.workflow_orchestrator.time.time"
+
+        with patch(clock, return_value=start):
+            first = orchestrator._generate_workflow_id()
+        with patch(clock, return_value=start + 0.5):
+            second = orchestrator._generate_workflow_id()
+        with patch(clock, return_value=start + 1):
+            third = orchestrator._generate_workflow_id()
+
+        assert first == "wf_20240102_030405_0001"
+        assert second == "wf_20240102_030405_0002"
+        assert third == "wf_20240102_030406_0003"
+
 
 # =============================================================================
 # WorkflowOrchestrator Complete Workflow Tests
@@ -388,6 +466,24 @@ class TestProcessRedditUrl:
         assert len(result.steps) == 5
         assert result.completed_at is not None
 
+    @pytest.mark.asyncio
+    async def test_upload_runs_off_event_loop_thread(self, orchestrator, sample_url):
+        """Test that the blocking download/upload step runs in a worker thread."""
+        upload = orchestrator.upload_service.upload_from_url_with_script
+        upload_result = upload.return_value
+        threads = []
+
+        def record_thread(**kwargs):
+            threads.append(threading.current_thread())
+            return upload_result
+
+        upload.side_effect = record_thread
+
+        result = await orchestrator.process_reddit_url(sample_url)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert threads and threads[0] is not threading.main_thread()
+
     @pytest.mark.asyncio
     async def test_workflow_generates_unique_id(self, orchestrator, sample_url):
         """Test each workflow gets a unique ID."""
@@ -464,6 +560,177 @@ class TestProcessRedditUrl:
         ]
         assert all(step.status == WorkflowStatus.COMPLETED for step in result.steps)
 
+    @pytest.mark.asyncio
+    async def test_clients_warmed_while_script_generates(self, orchestrator, sample_url):
+        """Test media/upload clients are created while the script is being generated."""
+        warmed = threading.Event()
+        seen_during_script = []
+
+        type(orchestrator.upload_service).youtube_client = property(
+            lambda self: warmed.set() or MagicMock()
+        )
+
+        async def slow_script(**kwargs):
+            for _ in range(100):
+                if warmed.is_set():
+                    break
+                await asyncio.sleep(0.01)
+            seen_during_script.append(warmed.is_set())
+            return VideoScript(script="Script text.", title="Title")
+
+        orchestrator.script_service.generate_script.side_effect = slow_script
+
+        result = await orchestrator.process_reddit_url(sample_url)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert seen_during_script == [True]
+
+    @pytest.mark.asyncio
+    async def test_prewarm_failure_does_not_fail_workflow(self, orchestrator, sample_url):
+        """Test a client that cannot be created early only fails its own step."""
+        type(orchestrator.media_service).heygen_client = property(
+            lambda self: (_ for _ in ()).throw(Exception("No HeyGen key"))
+        )
+
+        result = await orchestrator.process_reddit_url(sample_url)
+
+        assert result.status == WorkflowStatus.COMPLETED
+
+
+class TestWorkflowCache:
+    """Tests for WorkflowCache and cached workflow steps."""
+
+    def test_get_set(self):
+        """Test stored values are returned until they expire."""
+        cache = WorkflowCache(ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+
+    def test_expired_entry_dropped(self):
+        """Test expired entries are treated as misses and removed."""
+        cache = WorkflowCache(ttl=60)
+        with patch("reddit_flow.services.workflow_orchestrator.time.monotonic", return_value=0):
+            cache.set("key", "value")
+        with patch("reddit_flow.services.workflow_orchestrator.time.monotonic", return_value=61):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = WorkflowCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    @pytest.mark.asyncio
+    async def test_rerun_reuses_intermediate_results(self, orchestrator, sample_url):
+        """Test a second identical run skips fetch, script and media generation."""
+        orchestrator.cache = WorkflowCache()
+
+        first = await orchestrator.process_reddit_url(sample_url, user_opinion="Nice")
+        second = await orchestrator.process_reddit_url(sample_url, user_opinion="Nice")
+
+        orchestrator.content_service.get_post_content.assert_called_once()
+        orchestrator.script_service.generate_script.assert_called_once()
+        orchestrator.media_service.generate_video_from_script.assert_called_once()
+        assert orchestrator.upload_service.upload_from_url_with_script.call_count == 2
+        assert [s.data.get("cached") for s in first.steps[1:4]] == [False] * 3
+        assert [s.data.get("cached") for s in second.steps[1:4]] == [True] * 3
+        assert second.script == first.script
+
+    @pytest.mark.asyncio
+    async def test_different_opinion_regenerates_script(self, orchestrator, sample_url):
+        """Test a new user opinion reuses the post but generates a new script."""
+        orchestrator.cache = WorkflowCache()
+
+        await orchestrator.process_reddit_url(sample_url, user_opinion="First")
+        await orchestrator.process_reddit_url(sample_url, user_opinion="Second")
+
+        orchestrator.content_service.get_post_content.assert_called_once()
+        assert orchestrator.script_service.generate_script.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self, orchestrator, sample_url):
+        """Test every run calls the services when no cache is configured."""
+        await orchestrator.process_reddit_url(sample_url)
+        await orchestrator.process_reddit_url(sample_url)
+
+        assert orchestrator.content_service.get_post_content.call_count == 2
+        assert orchestrator.script_service.generate_script.call_count == 2
+
+
+class TestMediaStepCancellation:
+    """Tests for cancelling the media generation step."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_media_step_recorded(self, orchestrator):
+        """Test a cancelled media step is recorded as cancelled and re-raised."""
+        started = asyncio.Event()
+
+        async def never_finish(**kwargs):
+            started.set()
+            await asyncio.sleep(60)
+
+        orchestrator.media_service.generate_video_from_script.side_effect = never_finish
+        result = WorkflowResult(workflow_id="test")
+        result.script = VideoScript(script="Script text.", title="Title")
+
+        task = asyncio.create_task(
+            orchestrator._execute_generate_media(result, None, False, None, None)
+        )
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert result.steps[-1].step == WorkflowStep.GENERATE_MEDIA
+        assert result.steps[-1].status == WorkflowStatus.CANCELLED
+        assert result.steps[-1].completed_at is not None
+
+
+class TestFireAndCollect:
+    """Tests for the fire_and_collect helper."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_argument_order(self):
+        """Test results keep argument order regardless of completion order."""
+
+        async def value_after(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        results = await fire_and_collect(value_after("slow", 0.02), value_after("fast", 0))
+
+        assert results == ["slow", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining(self):
+        """Test the first exception propagates and pending awaitables are cancelled."""
+        cancelled = asyncio.Event()
+
+        async def fail():
+            raise ContentError("No content")
+
+        async def wait_forever():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(ContentError):
+            await fire_and_collect(fail(), wait_forever())
+
+        await asyncio.sleep(0)
+        assert cancelled.is_set()
+
 
 # =============================================================================
 # WorkflowOrchestrator Error Handling Tests
@@ -573,6 +840,18 @@ class TestWorkflowErrorHandling:
 
         assert "Unexpected error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_unexpected_error_recorded_on_callback(self, orchestrator, sample_url):
+        """Test unexpected errors report through the callback before being wrapped."""
+        callback = AsyncMock()
+        orchestrator.content_service.get_post_content.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RedditFlowError) as exc_info:
+            await orchestrator.process_reddit_url(sample_url, update_callback=callback)
+
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+        callback.assert_awaited_with("❌ Unexpected error: boom")
+
     @pytest.mark.asyncio
     async def test_error_callback_called_on_failure(self, orchestrator, sample_url):
         """Test callback is called with error message on failure."""
@@ -627,6 +906,104 @@ class TestProcessWithLinkInfo:
         assert first_step.step == WorkflowStep.PARSE_URL
         assert first_step.status == WorkflowStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_process_with_link_info_unexpected_error_not_wrapped(self, orchestrator):
+        """Test unexpected errors propagate unchanged from process_with_link_info."""
+        link_info = LinkInfo(
+            link="https://reddit.com/r/test/comments/xyz789/",
+            subReddit="test",
+            postId="xyz789",
+        )
+        callback = AsyncMock()
+        orchestrator.content_service.get_post_content.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.process_with_link_info(link_info, update_callback=callback)
+
+        callback.assert_awaited_with("❌ Failed: boom")
+
+
+class TestProcessBatch:
+    """Tests for process_batch method."""
+
+    @pytest.mark.asyncio
+    async def test_batch_completes_all_in_order(self, orchestrator, sample_url):
+        """Test every URL gets a completed result, in input order."""
+        urls = [sample_url, sample_url + "?a", sample_url + "?b"]
+
+        results = await orchestrator.process_batch(urls)
+
+        assert [r.status for r in results] == [WorkflowStatus.COMPLETED] * 3
+        assert all(len(r.steps) == 5 for r in results)
+        assert len({r.workflow_id for r in results}) == 3
+        parsed = [c.args[0] for c in orchestrator.content_service.parse_reddit_url.call_args_list]
+        assert parsed == urls
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_skips_remaining_steps(self, orchestrator, sample_url):
+        """Test a failing workflow is marked failed without stopping the others."""
+        orchestrator.content_service.parse_reddit_url.side_effect = [
+            orchestrator.content_service.parse_reddit_url.return_value,
+            InvalidURLError("Bad URL"),
+            orchestrator.content_service.parse_reddit_url.return_value,
+        ]
+
+        results = await orchestrator.process_batch([sample_url, "bad_url", sample_url])
+
+        assert [r.status for r in results] == [
+            WorkflowStatus.COMPLETED,
+            WorkflowStatus.FAILED,
+            WorkflowStatus.COMPLETED,
+        ]
+        assert results[1].error == "Bad URL"
+        assert len(results[1].steps) == 1
+        assert orchestrator.upload_service.upload_from_url_with_script.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_unexpected_error_recorded(self, orchestrator, sample_url):
+        """Test unexpected exceptions fail only their own workflow."""
+        orchestrator.script_service.generate_script.side_effect = [
+            ValueError("boom"),
+            orchestrator.script_service.generate_script.return_value,
+        ]
+
+        results = await orchestrator.process_batch([sample_url, sample_url])
+
+        assert results[0].status == WorkflowStatus.FAILED
+        assert results[0].error == "Unexpected error: boom"
+        assert results[1].status == WorkflowStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_batch_overlaps_stages(self, orchestrator, sample_url):
+        """Test the second workflow's script is generated while the first is in media."""
+        second_script_started = asyncio.Event()
+        media_result = orchestrator.media_service.generate_video_from_script.return_value
+        script_result = orchestrator.script_service.generate_script.return_value
+        script_calls = 0
+
+        async def generate_script(**kwargs):
+            nonlocal script_calls
+            script_calls += 1
+            if script_calls == 2:
+                second_script_started.set()
+            return script_result
+
+        async def generate_media(**kwargs):
+            await asyncio.wait_for(second_script_started.wait(), timeout=1)
+            return media_result
+
+        orchestrator.script_service.generate_script.side_effect = generate_script
+        orchestrator.media_service.generate_video_from_script.side_effect = generate_media
+
+        results = await orchestrator.process_batch([sample_url, sample_url])
+
+        assert [r.status for r in results] == [WorkflowStatus.COMPLETED] * 2
+
+    @pytest.mark.asyncio
+    async def test_batch_empty(self, orchestrator):
+        """Test an empty batch returns no results."""
+        assert await orchestrator.process_batch([]) == []
+
 
 class TestGenerateScriptOnly:
     """Tests for generate_script_only method."""
@@ -686,7 +1063,8 @@ class TestGenerateScriptOnly:
 class TestVerifyServices:
     """Tests for verify_services method."""
 
-    def test_verify_services_all_pass(
+    @pytest.mark.asyncio
+    async def test_verify_services_all_pass(
         self,
         mock_content_service,
         mock_script_service,
@@ -708,14 +1086,15 @@ class TestVerifyServices:
             upload_service=mock_upload_service,
         )
 
-        result = orchestrator.verify_services()
+        result = await orchestrator.verify_services()
 
         assert result["content_service"] is True
         assert result["script_service"] is True
         assert result["media_service"] is True
         assert result["upload_service"] is True
 
-    def test_verify_services_content_fails(
+    @pytest.mark.asyncio
+    async def test_verify_services_content_fails(
         self,
         mock_content_service,
         mock_script_service,
@@ -741,11 +1120,101 @@ class TestVerifyServices:
             upload_service=mock_upload_service,
         )
 
-        result = orchestrator.verify_services()
+        result = await orchestrator.verify_services()
 
         assert result["content_service"] is False
         assert result["script_service"] is True
 
+    @pytest.mark.asyncio
+    async def test_verify_services_checks_run_concurrently(self, orchestrator):
+        """Test a slow check does not delay the others."""
+        barrier = threading.Barrier(2, timeout=2)
+
+        def wait_for_peer(self):
+            barrier.wait()
+            return MagicMock()
+
+        type(orchestrator.content_service).reddit_client = property(wait_for_peer)
+        type(orchestrator.upload_service).youtube_client = property(wait_for_peer)
+
+        result = await orchestrator.verify_services()
+
+        assert result["content_service"] is True
+        assert result["upload_service"] is True
+
+
+class TestWarmup:
+    """Tests for warming up service clients."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_creates_all_clients(self, orchestrator):
+        """Test warmup touches every service's clients."""
+        touched = []
+        for service, attr in [
+            (orchestrator.content_service, "reddit_client"),
+            (orchestrator.script_service, "gemini_client"),
+            (orchestrator.media_service, "heygen_client"),
+            (orchestrator.upload_service, "youtube_client"),
+        ]:
+            setattr(type(service), attr, property(lambda self, a=attr: touched.append(a)))
+
+        await orchestrator.warmup()
+
+        assert sorted(touched) == [
+            "gemini_client",
+            "heygen_client",
+            "reddit_client",
+            "youtube_client",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_warmup_failure_not_raised(self, orchestrator):
+        """Test a client that cannot be created does not fail the warm-up."""
+        type(orchestrator.script_service).gemini_client = property(
+            lambda self: (_ for _ in ()).throw(Exception("No API key"))
+        )
+
+        await orchestrator.warmup()
+
+    def test_eager_init_without_loop_warms_immediately(self):
+        """Test eager_init outside an event loop warms up before returning."""
+        with patch.object(WorkflowOrchestrator, "warmup", new_callable=AsyncMock) as warmup:
+            orchestrator = WorkflowOrchestrator(eager_init=True)
+
+        warmup.assert_awaited_once()
+        assert orchestrator._warmup_task is None
+
+    @pytest.mark.asyncio
+    async def test_eager_init_in_loop_schedules_task(self):
+        """Test eager_init inside an event loop schedules warmup as a task."""
+        with patch.object(WorkflowOrchestrator, "warmup", new_callable=AsyncMock) as warmup:
+            orchestrator = WorkflowOrchestrator(eager_init=True)
+            await orchestrator.warmup_task
+
+        warmup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_eager_init_builds_services_before_warmup_task(self):
+        """Test services exist before the warm-up task runs, so it never creates them."""
+        with (
+            patch.object(WorkflowOrchestrator, "warmup", new_callable=AsyncMock),
+            patch("reddit_flow.services.content_service.ContentService") as MockContent,
+            patch("reddit_flow.services.script_service.ScriptService") as MockScript,
+            patch("reddit_flow.services.media_service.MediaService") as MockMedia,
+            patch("reddit_flow.services.upload_service.UploadService") as MockUpload,
+        ):
+            orchestrator = WorkflowOrchestrator(eager_init=True)
+
+            assert not orchestrator.warmup_task.done()
+            assert orchestrator._content_service is MockContent.return_value
+            assert orchestrator._script_service is MockScript.return_value
+            assert orchestrator._media_service is MockMedia.return_value
+            assert orchestrator._upload_service is MockUpload.return_value
+            await orchestrator.warmup_task
+
+        for mock_class in (MockContent, MockScript, MockMedia, MockUpload):
+            mock_class.assert_called_once_with()
+
 
 # =============================================================================
 # Step Execution Tests
@@ -857,6 +1326,11 @@ class TestStepExecution:
         step = result.steps[-1]
         assert step.step == WorkflowStep.UPLOAD_VIDEO
         assert step.status == WorkflowStatus.COMPLETED
+        kwargs = orchestrator.upload_service.upload_from_url_with_script.call_args.kwargs
+        assert kwargs["tags"] == ["#Shorts", "Reddit", "test"]
+        assert kwargs["additional_description"] == (
+            "\n\nSource: https://reddit.com/r/test/comments/abc123/"
+        )
 
 
 # =============================================================================
@@ -987,6 +1461,19 @@ class TestEdgeCases:
         # Should have at least one update per step plus completion
         assert len(updates) >= 6
 
+    @pytest.mark.asyncio
+    async def test_callback_step_messages_in_order(self, orchestrator, sample_url):
+        """Test each step announces itself with its numbered message."""
+        updates = []
+
+        async def capture_callback(message):
+            updates.append(message)
+
+        await orchestrator.process_reddit_url(sample_url, update_callback=capture_callback)
+
+        step_updates = [u for u in updates if u.startswith("Step ")]
+        assert [u[:8] for u in step_updates] == [f"Step {n}/5" for n in range(1, 6)]
+
     @pytest.mark.asyncio
     async def test_workflow_result_preserves_all_data(self, orchestrator, sample_url):
         """Test workflow result preserves all intermediate data."""
@@ -8,11 +8,19 @@ Tests cover:
 - Error handling
 """
 
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from reddit_flow.clients.youtube_client import YouTubeClient
+from reddit_flow.clients.youtube_client import (
+    YouTubeClient,
+    _mmap_media_upload_class,
+    _stream_media_upload_class,
+)
 from reddit_flow.exceptions import YouTubeUploadError
 from reddit_flow.models import YouTubeUploadRequest, YouTubeUploadResponse
 
@@ -182,7 +190,10 @@ class TestYouTubeClientUpload:
         mock_media_upload = MagicMock()
 
         with patch.object(mock_client, "_get_authenticated_service", return_value=mock_service):
-            with patch("googleapiclient.http.MediaFileUpload", return_value=mock_media_upload):
+            with patch(
+                "reddit_flow.clients.youtube_client._mmap_media_upload_class",
+                return_value=mock_media_upload,
+            ):
                 video_id = mock_client.upload_video(
                     file_path=str(video_file),
                     title="Test Video",
@@ -216,7 +227,10 @@ class TestYouTubeClientUpload:
         mock_media_upload = MagicMock()
 
         with patch.object(mock_client, "_get_authenticated_service", return_value=mock_service):
-            with patch("googleapiclient.http.MediaFileUpload", return_value=mock_media_upload):
+            with patch(
+                "reddit_flow.clients.youtube_client._mmap_media_upload_class",
+                return_value=mock_media_upload,
+            ):
                 video_id = mock_client.upload_video(
                     file_path=str(video_file),
                     title="Test Video",
@@ -231,7 +245,7 @@ class TestYouTubeClientUpload:
         """Test error when video file doesn't exist."""
         # Mock _get_authenticated_service to prevent actual auth
         with patch.object(mock_client, "_get_authenticated_service", return_value=MagicMock()):
-            with patch("googleapiclient.http.MediaFileUpload"):
+            with patch("reddit_flow.clients.youtube_client._mmap_media_upload_class"):
                 with pytest.raises(YouTubeUploadError) as exc_info:
                     mock_client.upload_video(
                         file_path="/nonexistent/video.mp4",
@@ -256,7 +270,10 @@ class TestYouTubeClientUpload:
         mock_media_upload = MagicMock()
 
         with patch.object(mock_client, "_get_authenticated_service", return_value=mock_service):
-            with patch("googleapiclient.http.MediaFileUpload", return_value=mock_media_upload):
+            with patch(
+                "reddit_flow.clients.youtube_client._mmap_media_upload_class",
+                return_value=mock_media_upload,
+            ):
                 mock_client.upload_video(
                     file_path=str(video_file),
                     title=long_title,
@@ -283,7 +300,10 @@ class TestYouTubeClientUpload:
         mock_media_upload = MagicMock()
 
         with patch.object(mock_client, "_get_authenticated_service", return_value=mock_service):
-            with patch("googleapiclient.http.MediaFileUpload", return_value=mock_media_upload):
+            with patch(
+                "reddit_flow.clients.youtube_client._mmap_media_upload_class",
+                return_value=mock_media_upload,
+            ):
                 mock_client.upload_video(
                     file_path=str(video_file),
                     title="Test Video",
@@ -315,7 +335,10 @@ class TestYouTubeClientUpload:
         mock_media_upload = MagicMock()
 
         with patch.object(mock_client, "_get_authenticated_service", return_value=mock_service):
-            with patch("googleapiclient.http.MediaFileUpload", return_value=mock_media_upload):
+            with patch(
+                "reddit_flow.clients.youtube_client._mmap_media_upload_class",
+                return_value=mock_media_upload,
+            ):
                 with pytest.raises(YouTubeUploadError) as exc_info:
                     mock_client.upload_video(
                         file_path=str(video_file),
@@ -324,6 +347,231 @@ class TestYouTubeClientUpload:
                     )
 
         assert "Failed to upload" in str(exc_info.value)
+        assert str(exc_info.value.__cause__) == "API error"
+
+
+class TestYouTubeClientThreadHttp:
+    """Tests for per-thread upload transports."""
+
+    def test_thread_http_none_before_authentication(self):
+        """Test that the service's own transport is used until credentials exist."""
+        client = YouTubeClient({"category_id": "22"})
+        assert client._thread_http() is None
+
+    def test_thread_http_is_per_thread(self):
+        """Test that each thread gets, and then reuses, its own transport."""
+        client = YouTubeClient({"category_id": "22"})
+        client._credentials = MagicMock()
+
+        with patch("google_auth_httplib2.AuthorizedHttp", side_effect=lambda *a, **k: object()):
+            first = client._thread_http()
+            other = []
+            worker = threading.Thread(target=lambda: other.append(client._thread_http()))
+            worker.start()
+            worker.join()
+
+            assert client._thread_http() is first
+            assert other[0] is not first
+
+    def test_thread_http_accepts_resume_incomplete_chunks(self):
+        """Test the thread's transport hands 308 chunk replies to next_chunk, not redirects."""
+        from google.oauth2.credentials import Credentials
+        from googleapiclient.http import HttpRequest, MediaIoBaseUpload
+
+        chunk_size = 256 * 1024
+        payload = b"v" * (chunk_size * 2)
+        received = bytearray()
+
+        class ResumableUploadHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                # Start of the resumable session
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.send_response(200)
+                self.send_header("Location", f"http://127.0.0.1:{self.server.server_port}/up")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_PUT(self):
+                received.extend(self.rfile.read(int(self.headers["Content-Length"])))
+                if len(received) < len(payload):
+                    # YouTube's reply to every chunk but the last: no Location header
+                    self.send_response(308)
+                    self.send_header("Range", f"bytes=0-{len(received) - 1}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = json.dumps({"id": "v308"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ResumableUploadHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = YouTubeClient({"category_id": "22"})
+            client._credentials = Credentials(token="test-token")
+            media = MediaIoBaseUpload(
+                io.BytesIO(payload), mimetype="video/mp4", chunksize=chunk_size, resumable=True
+            )
+            request = HttpRequest(
+                None,
+                lambda resp, content: json.loads(content),
+                f"http://127.0.0.1:{server.server_port}/upload",
+                method="POST",
+                body="{}",
+                headers={"content-type": "application/json"},
+                resumable=media,
+            )
+
+            http = client._thread_http()
+            status, response = request.next_chunk(http=http)
+            assert response is None
+            assert status.resumable_progress == chunk_size
+
+            status, response = request.next_chunk(http=http)
+            assert response == {"id": "v308"}
+            assert bytes(received) == payload
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_upload_sends_chunks_over_thread_http(self, tmp_path):
+        """Test that resumable chunks are sent over the thread's transport."""
+        client = YouTubeClient({"category_id": "22"})
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"data")
+        mock_service = MagicMock()
+        request = mock_service.videos().insert.return_value
+        request.next_chunk.return_value = (None, {"id": "t1"})
+        thread_http = MagicMock()
+
+        with (
+            patch.object(client, "_get_authenticated_service", return_value=mock_service),
+            patch.object(client, "_thread_http", return_value=thread_http),
+        ):
+            assert client.upload_video(file_path=str(video_file), title="T") == "t1"
+
+        request.next_chunk.assert_called_once_with(http=thread_http)
+
+
+class TestYouTubeClientUploadMmap:
+    """Tests for memory-mapped file uploads."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock YouTube client for testing."""
+        with patch("reddit_flow.clients.youtube_client.Path.exists") as mock_exists:
+            mock_exists.return_value = True
+            return YouTubeClient({"category_id": "22", "chunk_size": 4})
+
+    def test_upload_video_uses_mmap_media(self, mock_client, tmp_path):
+        """Test that upload_video sends a memory-mapped view of the file."""
+        video_file = tmp_path / "test_video.mp4"
+        video_file.write_bytes(b"0123456789")
+
+        mock_service = MagicMock()
+        mock_service.videos().insert.return_value.next_chunk.return_value = (None, {"id": "m1"})
+
+        with patch.object(mock_client, "_get_authenticated_service", return_value=mock_service):
+            video_id = mock_client.upload_video(file_path=str(video_file), title="Mapped")
+
+        assert video_id == "m1"
+        media = mock_service.videos().insert.call_args.kwargs["media_body"]
+        assert media.size() == 10
+        assert media.chunksize() == 4
+        assert media.mimetype() == "video/mp4"
+        assert media.has_stream() is False
+
+    def test_mmap_media_returns_slices(self, tmp_path):
+        """Test that chunks are zero-copy slices of the file contents."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"0123456789")
+        media = _mmap_media_upload_class()(str(video_file), 4, "video/mp4")
+
+        chunk = media.getbytes(4, 4)
+        assert isinstance(chunk, memoryview)
+        assert chunk == b"4567"
+        assert media.getbytes(8, 4) == b"89"
+        assert media.getbytes(2, -1) == b"23456789"
+        del chunk
+        media.close()
+
+    def test_mmap_media_handles_empty_file(self, tmp_path):
+        """Test that an empty file can be wrapped without mapping it."""
+        video_file = tmp_path / "empty.mp4"
+        video_file.write_bytes(b"")
+        media = _mmap_media_upload_class()(str(video_file), 4, "video/mp4")
+
+        assert media.size() == 0
+        assert media.getbytes(0, 4) == b""
+        media.close()
+
+
+class TestYouTubeClientUploadStream:
+    """Tests for uploading from a forward-only stream."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock YouTube client for testing."""
+        with patch("reddit_flow.clients.youtube_client.Path.exists") as mock_exists:
+            mock_exists.return_value = True
+            return YouTubeClient({"category_id": "22", "chunk_size": 4})
+
+    def test_upload_video_stream_success(self, mock_client):
+        """Test that the stream is wrapped in resumable media of the given size."""
+        mock_service = MagicMock()
+        mock_request = MagicMock()
+        mock_request.next_chunk.return_value = (None, {"id": "stream123"})
+        mock_service.videos().insert.return_value = mock_request
+
+        with patch.object(mock_client, "_get_authenticated_service", return_value=mock_service):
+            video_id = mock_client.upload_video_stream(
+                stream=io.BytesIO(b"0123456789"),
+                size=10,
+                title="Streamed",
+            )
+
+        assert video_id == "stream123"
+        media = mock_service.videos().insert.call_args.kwargs["media_body"]
+        assert media.size() == 10
+        assert media.resumable() is True
+        assert media.chunksize() == 4
+        assert media.mimetype() == "video/mp4"
+
+    def test_stream_media_reads_forward_and_resends_last_chunk(self):
+        """Test that chunks are read in order and the last one can be re-sent."""
+        media = _stream_media_upload_class()(io.BytesIO(b"0123456789"), 10, 4, "video/mp4")
+
+        assert media.getbytes(0, 4) == b"0123"
+        assert media.getbytes(4, 4) == b"4567"
+        # Server acknowledged only part of the chunk: resend from byte 6
+        assert media.getbytes(6, 4) == b"6789"
+        assert media.getbytes(10, 4) == b""
+
+    def test_stream_media_reuses_one_buffer(self):
+        """Test that chunks are memoryviews over a single reusable buffer."""
+        media = _stream_media_upload_class()(io.BytesIO(b"0123456789"), 10, 4, "video/mp4")
+
+        first = media.getbytes(0, 4)
+        assert isinstance(first, memoryview)
+        assert bytes(first) == b"0123"
+        second = media.getbytes(4, 4)
+        assert bytes(second) == b"4567"
+        assert first.obj is second.obj
+
+    def test_stream_media_cannot_rewind_past_last_chunk(self):
+        """Test that bytes before the buffered chunk cannot be re-read."""
+        media = _stream_media_upload_class()(io.BytesIO(b"0123456789"), 10, 4, "video/mp4")
+        media.getbytes(0, 4)
+        media.getbytes(4, 4)
+
+        with pytest.raises(YouTubeUploadError, match="Cannot seek"):
+            media.getbytes(2, 4)
 
 
 class TestYouTubeClientUploadFromRequest:
@@ -494,7 +742,10 @@ class TestYouTubeClientIntegration:
             mock_media_upload = MagicMock()
 
             with patch.object(client, "_get_authenticated_service", return_value=mock_service):
-                with patch("googleapiclient.http.MediaFileUpload", return_value=mock_media_upload):
+                with patch(
+                    "reddit_flow.clients.youtube_client._mmap_media_upload_class",
+                    return_value=mock_media_upload,
+                ):
                     # Create request
                     request = YouTubeUploadRequest(
                         file_path=str(video_file),